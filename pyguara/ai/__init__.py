@@ -41,8 +41,10 @@ from pyguara.ai.pathfinding import (
     euclidean_distance,
     manhattan_distance,
     octile_distance,
+    path_to_world_array,
     path_to_world_coords,
     smooth_path,
+    world_to_grid_array,
     world_to_grid_coords,
 )
 
@@ -85,7 +87,9 @@ __all__ = [
     "octile_distance",
     "smooth_path",
     "path_to_world_coords",
+    "path_to_world_array",
     "world_to_grid_coords",
+    "world_to_grid_array",
     # Navmesh
     "NavMesh",
     "NavMeshPolygon",
@@ -4,34 +4,95 @@ Provides navigation meshes for complex 2D environments with irregular geometry.
 Suitable for platformers, top-down games with obstacles, etc.
 """
 
+import heapq
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from pyguara.common.types import Vector2
 
+# Tolerance for treating two vertices as the same point.
+_EPSILON = 0.001
+
+# Snapped points within _EPSILON of each other differ by at most one unit
+# per axis, so matching probes this neighbourhood of buckets.
+_NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+# Polygons spanning more grid cells than this skip the grid and are
+# checked against every query instead.
+_MAX_CELLS_PER_POLYGON = 64
+
 
 @dataclass
 class NavMeshPolygon:
     """A convex polygon representing a walkable area.
 
     Polygons are connected via shared edges (portals).
+
+    Vertex coordinates are also kept as contiguous ``float64`` arrays
+    (one per axis) so point-in-polygon tests run as a single vectorized
+    pass. ``vertices`` is treated as immutable after construction.
     """
 
     id: int
     vertices: list[Vector2]
     center: Vector2 = field(init=False)
-    neighbors: list[int] = field(default_factory=list, init=False)
+    neighbors: tuple[int, ...] = field(default=(), init=False)
+    _xs: np.ndarray = field(init=False, repr=False, compare=False)
+    _ys: np.ndarray = field(init=False, repr=False, compare=False)
+    _ys_next: np.ndarray = field(init=False, repr=False, compare=False)
+    _inv_slope: np.ndarray = field(init=False, repr=False, compare=False)
+    _vertex_buckets: dict[tuple[int, int], list[int]] = field(
+        init=False, repr=False, compare=False
+    )
+    _aabb: tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
+    _is_rect: bool = field(init=False, repr=False, compare=False)
+    _triangle: Optional[tuple[float, ...]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Calculate polygon center."""
+        """Calculate polygon center and edge arrays."""
         if len(self.vertices) < 3:
             raise ValueError("Polygon must have at least 3 vertices")
 
-        # Calculate centroid
-        x_sum = sum(v.x for v in self.vertices)
-        y_sum = sum(v.y for v in self.vertices)
+        self._xs = np.fromiter((v.x for v in self.vertices), dtype=np.float64)
+        self._ys = np.fromiter((v.y for v in self.vertices), dtype=np.float64)
+        xs_next = np.roll(self._xs, -1)
+        self._ys_next = np.roll(self._ys, -1)
+        # (min_x, max_x, min_y, max_y)
+        self._aabb = (
+            float(self._xs.min()),
+            float(self._xs.max()),
+            float(self._ys.min()),
+            float(self._ys.max()),
+        )
+
+        # dx/dy per edge; horizontal edges never cross the ray, so their
+        # slot is left at zero instead of dividing by zero on every query.
+        dy = self._ys_next - self._ys
+        self._inv_slope = np.divide(
+            xs_next - self._xs, dy, out=np.zeros_like(dy), where=dy != 0
+        )
+
         count = len(self.vertices)
-        self.center = Vector2(x_sum / count, y_sum / count)
+
+        # Vertex indices bucketed by snapped position, so shared edges are
+        # found with hash lookups instead of comparing every pair of edges.
+        self._vertex_buckets = {}
+        for i, v in enumerate(self.vertices):
+            self._vertex_buckets.setdefault(_snap(v), []).append(i)
+
+        # Shapes with a cheaper exact test than the general ray cast
+        self._is_rect = _is_axis_aligned_rect(self.vertices, self._aabb)
+        self._triangle = _triangle_edges(self.vertices) if count == 3 else None
+
+        # Vertex centroid, computed once; vertices do not change
+        self.center = Vector2(float(self._xs.mean()), float(self._ys.mean()))
 
     def contains_point(self, point: Vector2) -> bool:
         """Check if point is inside polygon using ray casting.
@@ -43,23 +104,32 @@ class NavMeshPolygon:
             True if point is inside polygon
         """
         x, y = point.x, point.y
-        n = len(self.vertices)
-        inside = False
-
-        p1 = self.vertices[0]
-        for i in range(1, n + 1):
-            p2 = self.vertices[i % n]
-
-            if y > min(p1.y, p2.y):
-                if y <= max(p1.y, p2.y):
-                    if x <= max(p1.x, p2.x):
-                        if p1.y != p2.y:
-                            xinters = (y - p1.y) * (p2.x - p1.x) / (p2.y - p1.y) + p1.x
-                        if p1.x == p2.x or x <= xinters:
-                            inside = not inside
-            p1 = p2
-
-        return inside
+        min_x, max_x, min_y, max_y = self._aabb
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
+
+        if self._is_rect:
+            # Same half-open boundary rule as the ray cast below
+            return x > min_x and y > min_y
+
+        tri = self._triangle
+        if tri is not None:
+            e0 = tri[0] * x + tri[1] * y + tri[2]
+            e1 = tri[3] * x + tri[4] * y + tri[5]
+            e2 = tri[6] * x + tri[7] * y + tri[8]
+            if e0 > 0 and e1 > 0 and e2 > 0:
+                return True
+            if e0 < 0 or e1 < 0 or e2 < 0:
+                return False
+            # On an edge: let the ray cast apply its half-open rule
+
+        ys = self._ys
+
+        # An edge counts when y lies in (min_y, max_y] and the point is
+        # left of (or on) the edge's crossing with the horizontal ray.
+        spans = (ys < y) != (self._ys_next < y)
+        crossings = spans & (x <= (y - ys) * self._inv_slope + self._xs)
+        return int(np.count_nonzero(crossings)) % 2 == 1
 
     def get_shared_edge(
         self, other: "NavMeshPolygon"
@@ -72,26 +142,226 @@ class NavMeshPolygon:
         Returns:
             Tuple of (start, end) vertices of shared edge, or None
         """
-        # Check each edge of this polygon
-        for i in range(len(self.vertices)):
-            v1 = self.vertices[i]
-            v2 = self.vertices[(i + 1) % len(self.vertices)]
+        vertices = self.vertices
+        other_vertices = other.vertices
+        other_count = len(other_vertices)
+        buckets = other._vertex_buckets
+
+        for i, v1 in enumerate(vertices):
+            v2 = vertices[(i + 1) % len(vertices)]
+            sx, sy = _snap(v1)
+            # Probe neighbouring buckets too: two points within tolerance
+            # can round to adjacent buckets; confirm with the exact check.
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                for j in buckets.get((sx + dx, sy + dy), ()):
+                    if not _same_point(v1, other_vertices[j]):
+                        continue
+                    if _same_point(
+                        v2, other_vertices[(j + 1) % other_count]
+                    ) or _same_point(v2, other_vertices[j - 1]):
+                        return (v1, v2)
+        return None
+
+
+@dataclass(slots=True)
+class _PolygonBuffers:
+    """Edge arrays of every polygon in a mesh, concatenated for batch queries.
+
+    Polygon ``i`` owns edges ``offsets[i]:offsets[i] + counts[i]`` of the
+    flat edge arrays.
+    """
 
-            # Check if this edge matches any edge in other polygon
-            for j in range(len(other.vertices)):
-                ov1 = other.vertices[j]
-                ov2 = other.vertices[(j + 1) % len(other.vertices)]
+    polygons: list[NavMeshPolygon]
+    ids: np.ndarray
+    offsets: np.ndarray
+    counts: np.ndarray
+    xs: np.ndarray
+    ys: np.ndarray
+    ys_next: np.ndarray
+    inv_slope: np.ndarray
+    min_x: np.ndarray
+    max_x: np.ndarray
+    min_y: np.ndarray
+    max_y: np.ndarray
+
+    @classmethod
+    def pack(cls, polygons: list[NavMeshPolygon]) -> "_PolygonBuffers":
+        """Concatenate the cached coordinate arrays of ``polygons``."""
+        counts = np.array([len(p.vertices) for p in polygons], dtype=np.int64)
+        offsets = np.zeros(len(polygons), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        bounds = np.array([p._aabb for p in polygons], dtype=np.float64)
+        return cls(
+            polygons=polygons,
+            ids=np.array([p.id for p in polygons], dtype=np.int64),
+            offsets=offsets,
+            counts=counts,
+            xs=np.concatenate([p._xs for p in polygons]),
+            ys=np.concatenate([p._ys for p in polygons]),
+            ys_next=np.concatenate([p._ys_next for p in polygons]),
+            inv_slope=np.concatenate([p._inv_slope for p in polygons]),
+            min_x=bounds[:, 0],
+            max_x=bounds[:, 1],
+            min_y=bounds[:, 2],
+            max_y=bounds[:, 3],
+        )
+
+    def locate(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """Return the index of the first polygon containing each point, or -1."""
+        result = np.full(len(px), -1, dtype=np.int64)
+
+        # Bounding-box filter over the full point x polygon grid; only the
+        # surviving (point, polygon) pairs get the crossings test.
+        px_col = px[:, None]
+        py_col = py[:, None]
+        pt_idx, poly_idx = np.nonzero(
+            (px_col >= self.min_x)
+            & (px_col <= self.max_x)
+            & (py_col >= self.min_y)
+            & (py_col <= self.max_y)
+        )
+        if not pt_idx.size:
+            return result
+
+        # Expand every candidate pair into one row per polygon edge.
+        counts = self.counts[poly_idx]
+        pair_starts = np.cumsum(counts) - counts
+        local = np.arange(int(counts.sum())) - np.repeat(pair_starts, counts)
+        edges = np.repeat(self.offsets[poly_idx], counts) + local
+        ex = np.repeat(px[pt_idx], counts)
+        ey = np.repeat(py[pt_idx], counts)
+
+        ys = self.ys[edges]
+        spans = (ys < ey) != (self.ys_next[edges] < ey)
+        crossings = spans & (ex <= (ey - ys) * self.inv_slope[edges] + self.xs[edges])
+        inside = np.add.reduceat(crossings.astype(np.int64), pair_starts) % 2 == 1
+
+        # np.nonzero is row-major, so the first hit per point is the
+        # lowest polygon index, matching a sequential scan.
+        hit_pts = pt_idx[inside]
+        first_pts, first = np.unique(hit_pts, return_index=True)
+        result[first_pts] = poly_idx[inside][first]
+        return result
+
+
+class _SpatialGrid:
+    """Uniform grid bucketing polygons by the cells their bounds overlap.
+
+    The cell size is the median polygon extent, so a typical polygon
+    touches a handful of cells. Polygons whose bounds would cover more than
+    ``_MAX_CELLS_PER_POLYGON`` cells (or are not finite) are kept in a
+    separate ``large`` list that every query also checks, so the total cell
+    count stays at most ``_MAX_CELLS_PER_POLYGON`` times the polygon count
+    whatever the size distribution. Bounds are padded by the
+    vertex-matching tolerance so polygons meeting along an edge always
+    share a cell.
+    """
 
-                # Check if edges are the same (either direction)
+    def __init__(self, polygons: list[NavMeshPolygon], padding: float) -> None:
+        """Bucket ``polygons`` (kept in the given order) into grid cells."""
+        self.polygons = polygons
+        self.padding = padding
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.large: list[int] = []
+
+        extents = [
+            extent
+            for min_x, max_x, min_y, max_y in (p._aabb for p in polygons)
+            if math.isfinite(extent := max(max_x - min_x, max_y - min_y))
+        ]
+        cell_size = float(np.median(extents)) if extents else 0.0
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+
+        for index, polygon in enumerate(polygons):
+            min_x, max_x, min_y, max_y = polygon._aabb
+            if not all(map(math.isfinite, polygon._aabb)):
+                self.large.append(index)
+                continue
+            x0, y0 = self._cell(min_x - padding, min_y - padding)
+            x1, y1 = self._cell(max_x + padding, max_y + padding)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > _MAX_CELLS_PER_POLYGON:
+                self.large.append(index)
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self.cells.setdefault((cx, cy), []).append(index)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def query(self, point: Vector2) -> list[int]:
+        """Return indices, in storage order, of polygons that may hold ``point``."""
+        if not (math.isfinite(point.x) and math.isfinite(point.y)):
+            return []
+        bucket = self.cells.get(self._cell(point.x, point.y), [])
+        if not self.large:
+            return bucket
+        return sorted(bucket + self.large)
+
+    def candidate_pairs(self) -> list[tuple[int, int]]:
+        """Return sorted index pairs ``(i, j)``, ``i < j``, that may touch."""
+        pairs: set[tuple[int, int]] = set()
+        for bucket in self.cells.values():
+            for a, i in enumerate(bucket):
+                for j in bucket[a + 1 :]:
+                    pairs.add((i, j))
+
+        # Large polygons are in no bucket: pair them by bounds overlap instead
+        pad = self.padding
+        for i in self.large:
+            min_x, max_x, min_y, max_y = self.polygons[i]._aabb
+            for j, other in enumerate(self.polygons):
+                o_min_x, o_max_x, o_min_y, o_max_y = other._aabb
                 if (
-                    _points_equal(v1, ov1)
-                    and _points_equal(v2, ov2)
-                    or _points_equal(v1, ov2)
-                    and _points_equal(v2, ov1)
+                    j != i
+                    and o_min_x <= max_x + pad
+                    and o_max_x >= min_x - pad
+                    and o_min_y <= max_y + pad
+                    and o_max_y >= min_y - pad
                 ):
-                    return (v1, v2)
+                    pairs.add((min(i, j), max(i, j)))
+        return sorted(pairs)
 
-        return None
+
+@dataclass(slots=True)
+class _PolygonGraph:
+    """Polygon adjacency in compressed sparse row form for A*.
+
+    Nodes are polygon indices; the neighbours of node ``u`` are
+    ``targets[offsets[u]:offsets[u + 1]]`` with matching ``costs``.
+    """
+
+    polygons: list[NavMeshPolygon]
+    index: dict[int, int]
+    offsets: list[int]
+    targets: list[int]
+    costs: list[float]
+    center_x: list[float]
+    center_y: list[float]
+
+    @classmethod
+    def build(cls, polygons: list[NavMeshPolygon]) -> "_PolygonGraph":
+        """Flatten the neighbour lists of ``polygons`` into CSR arrays."""
+        index = {polygon.id: i for i, polygon in enumerate(polygons)}
+        center_x = [polygon.center.x for polygon in polygons]
+        center_y = [polygon.center.y for polygon in polygons]
+        offsets = [0]
+        targets: list[int] = []
+        costs: list[float] = []
+
+        for u, polygon in enumerate(polygons):
+            for neighbor_id in polygon.neighbors:
+                v = index.get(neighbor_id)
+                if v is None:
+                    continue
+                # Edge cost: distance between polygon centers
+                dx = center_x[v] - center_x[u]
+                dy = center_y[v] - center_y[u]
+                targets.append(v)
+                costs.append((dx * dx + dy * dy) ** 0.5)
+            offsets.append(len(targets))
+
+        return cls(polygons, index, offsets, targets, costs, center_x, center_y)
 
 
 @dataclass
@@ -105,19 +375,19 @@ class NavMeshEdge:
     poly2_id: int
     start: Vector2
     end: Vector2
+    length: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Calculate edge length once; portals do not move after building."""
+        dx = self.end.x - self.start.x
+        dy = self.end.y - self.start.y
+        self.length = float((dx * dx + dy * dy) ** 0.5)
 
     @property
     def midpoint(self) -> Vector2:
         """Get midpoint of the edge."""
         return Vector2((self.start.x + self.end.x) / 2, (self.start.y + self.end.y) / 2)
 
-    @property
-    def length(self) -> float:
-        """Get length of the edge."""
-        dx = self.end.x - self.start.x
-        dy = self.end.y - self.start.y
-        return float((dx * dx + dy * dy) ** 0.5)
-
 
 class NavMesh:
     """Navigation mesh for polygon-based pathfinding.
@@ -139,8 +409,18 @@ class NavMesh:
 
     def __init__(self) -> None:
         """Initialize empty navmesh."""
-        self._polygons: dict[int, NavMeshPolygon] = {}
+        # Contiguous storage plus id -> slot; removal swaps in the last
+        # polygon, so iteration order is storage order, not insertion order.
+        self._polygons: list[NavMeshPolygon] = []
+        self._index: dict[int, int] = {}
         self._edges: list[NavMeshEdge] = []
+        # Unordered (min_id, max_id) polygon pair -> connecting edge
+        self._edge_lookup: dict[tuple[int, int], NavMeshEdge] = {}
+        self._buffers: Optional[_PolygonBuffers] = None
+        self._grid: Optional[_SpatialGrid] = None
+        # Bumped on every mutation so pathfinders can tell when cached
+        # search graphs are stale.
+        self._version = 0
 
     def add_polygon(self, polygon: NavMeshPolygon) -> None:
         """Add a polygon to the navmesh.
@@ -148,10 +428,12 @@ class NavMesh:
         Args:
             polygon: Polygon to add
         """
-        if polygon.id in self._polygons:
+        if polygon.id in self._index:
             raise ValueError(f"Polygon with id {polygon.id} already exists")
 
-        self._polygons[polygon.id] = polygon
+        self._index[polygon.id] = len(self._polygons)
+        self._polygons.append(polygon)
+        self._invalidate()
 
     def remove_polygon(self, polygon_id: int) -> None:
         """Remove a polygon from the navmesh.
@@ -159,14 +441,22 @@ class NavMesh:
         Args:
             polygon_id: ID of polygon to remove
         """
-        if polygon_id in self._polygons:
-            del self._polygons[polygon_id]
+        slot = self._index.pop(polygon_id, None)
+        if slot is not None:
+            last = self._polygons.pop()
+            if slot < len(self._polygons):
+                self._polygons[slot] = last
+                self._index[last.id] = slot
+            self._invalidate()
             # Remove edges involving this polygon
             self._edges = [
                 e
                 for e in self._edges
                 if e.poly1_id != polygon_id and e.poly2_id != polygon_id
             ]
+            self._edge_lookup = {
+                _pair_key(e.poly1_id, e.poly2_id): e for e in self._edges
+            }
 
     def get_polygon(self, polygon_id: int) -> Optional[NavMeshPolygon]:
         """Get polygon by ID.
@@ -177,7 +467,8 @@ class NavMesh:
         Returns:
             Polygon or None if not found
         """
-        return self._polygons.get(polygon_id)
+        slot = self._index.get(polygon_id)
+        return self._polygons[slot] if slot is not None else None
 
     def get_polygon_at(self, point: Vector2) -> Optional[NavMeshPolygon]:
         """Find which polygon contains a point.
@@ -188,11 +479,49 @@ class NavMesh:
         Returns:
             Polygon containing the point, or None
         """
-        for polygon in self._polygons.values():
+        grid = self._get_grid()
+        for index in grid.query(point):
+            polygon = grid.polygons[index]
             if polygon.contains_point(point):
                 return polygon
         return None
 
+    def get_polygons_at(self, points: np.ndarray) -> np.ndarray:
+        """Find which polygon contains each of many points in one pass.
+
+        Args:
+            points: Array-like of shape (N, 2) holding x, y pairs
+
+        Returns:
+            Integer array of N polygon IDs, -1 where no polygon contains
+            the point. When polygons overlap, the first in storage order wins.
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        buffers = self._get_buffers()
+        if buffers is None:
+            return np.full(len(pts), -1, dtype=np.int64)
+
+        indices = buffers.locate(pts[:, 0], pts[:, 1])
+        return np.where(indices >= 0, buffers.ids[indices], -1)
+
+    def _invalidate(self) -> None:
+        """Drop derived lookup structures after the polygon set changes."""
+        self._buffers = None
+        self._grid = None
+        self._version += 1
+
+    def _get_grid(self) -> _SpatialGrid:
+        """Return the spatial grid, rebuilding it after mutation."""
+        if self._grid is None:
+            self._grid = _SpatialGrid(list(self._polygons), _EPSILON)
+        return self._grid
+
+    def _get_buffers(self) -> Optional[_PolygonBuffers]:
+        """Return packed polygon arrays, rebuilding them after mutation."""
+        if self._buffers is None and self._polygons:
+            self._buffers = _PolygonBuffers.pack(list(self._polygons))
+        return self._buffers
+
     def build_connections(self) -> None:
         """Build connectivity between adjacent polygons.
 
@@ -200,46 +529,48 @@ class NavMesh:
         Should be called after all polygons are added.
         """
         self._edges.clear()
-
-        # Clear existing neighbor lists
-        for polygon in self._polygons.values():
-            polygon.neighbors.clear()
-
-        # Check all pairs of polygons
-        polygon_ids = list(self._polygons.keys())
-        for i, id1 in enumerate(polygon_ids):
-            poly1 = self._polygons[id1]
-
-            for id2 in polygon_ids[i + 1 :]:
-                poly2 = self._polygons[id2]
-
-                # Check for shared edge
-                shared_edge = poly1.get_shared_edge(poly2)
-                if shared_edge:
-                    # Add edge
-                    edge = NavMeshEdge(
-                        poly1_id=id1,
-                        poly2_id=id2,
-                        start=shared_edge[0],
-                        end=shared_edge[1],
-                    )
-                    self._edges.append(edge)
-
-                    # Add to neighbor lists
-                    poly1.neighbors.append(id2)
-                    poly2.neighbors.append(id1)
-
-    def get_neighbors(self, polygon_id: int) -> list[int]:
+        self._edge_lookup.clear()
+        self._version += 1
+
+        # Only polygons sharing a grid cell can share an edge; pairs come
+        # back in storage order, matching an exhaustive pairwise scan.
+        grid = self._get_grid()
+        adjacency: list[list[int]] = [[] for _ in grid.polygons]
+        for i, j in grid.candidate_pairs():
+            poly1 = grid.polygons[i]
+            poly2 = grid.polygons[j]
+
+            # Check for shared edge
+            shared_edge = poly1.get_shared_edge(poly2)
+            if shared_edge:
+                # Add edge
+                edge = NavMeshEdge(
+                    poly1_id=poly1.id,
+                    poly2_id=poly2.id,
+                    start=shared_edge[0],
+                    end=shared_edge[1],
+                )
+                self._edges.append(edge)
+                self._edge_lookup[_pair_key(poly1.id, poly2.id)] = edge
+
+                adjacency[i].append(poly2.id)
+                adjacency[j].append(poly1.id)
+
+        # Publish neighbours as tuples: fixed once built, cheap to iterate
+        for polygon, neighbor_ids in zip(grid.polygons, adjacency):
+            polygon.neighbors = tuple(neighbor_ids)
+
+    def get_neighbors(self, polygon_id: int) -> tuple[int, ...]:
         """Get IDs of neighboring polygons.
 
         Args:
             polygon_id: Polygon ID
 
         Returns:
-            List of neighbor polygon IDs
+            Tuple of neighbor polygon IDs
         """
-        polygon = self._polygons.get(polygon_id)
-        return polygon.neighbors if polygon else []
+        polygon = self.get_polygon(polygon_id)
+        return polygon.neighbors if polygon else ()
 
     def get_edge_between(self, poly1_id: int, poly2_id: int) -> Optional[NavMeshEdge]:
         """Get edge connecting two polygons.
@@ -251,12 +582,7 @@ class NavMesh:
         Returns:
             Edge connecting the polygons, or None
         """
-        for edge in self._edges:
-            if (edge.poly1_id == poly1_id and edge.poly2_id == poly2_id) or (
-                edge.poly1_id == poly2_id and edge.poly2_id == poly1_id
-            ):
-                return edge
-        return None
+        return self._edge_lookup.get(_pair_key(poly1_id, poly2_id))
 
     @property
     def polygon_count(self) -> int:
@@ -271,7 +597,10 @@ class NavMesh:
     def clear(self) -> None:
         """Remove all polygons and edges."""
         self._polygons.clear()
+        self._index.clear()
         self._edges.clear()
+        self._edge_lookup.clear()
+        self._invalidate()
 
 
 class NavMeshPathfinder:
@@ -288,13 +617,27 @@ class NavMeshPathfinder:
             navmesh: Navigation mesh to search
         """
         self.navmesh = navmesh
-
-    def find_path(self, start: Vector2, goal: Vector2) -> Optional[list[Vector2]]:
+        self._graph: Optional[_PolygonGraph] = None
+        self._graph_version = -1
+
+    def _get_graph(self) -> _PolygonGraph:
+        """Return the search graph, rebuilding it if the navmesh changed."""
+        navmesh = self.navmesh
+        if self._graph is None or self._graph_version != navmesh._version:
+            self._graph = _PolygonGraph.build(list(navmesh._polygons))
+            self._graph_version = navmesh._version
+        return self._graph
+
+    def find_path(
+        self, start: Vector2, goal: Vector2, smooth: bool = True
+    ) -> Optional[list[Vector2]]:
         """Find path from start to goal.
 
         Args:
             start: Starting position
             goal: Goal position
+            smooth: Pull the path taut through the portals between polygons
+                (funnel algorithm). If False, route through polygon centers.
 
         Returns:
             List of waypoints from start to goal, or None if no path
@@ -316,6 +659,8 @@ class NavMeshPathfinder:
             return None
 
         # Convert polygon path to waypoint path
+        if smooth:
+            return self._funnel_path(start, goal, polygon_path)
         return self._create_waypoint_path(start, goal, polygon_path)
 
     def _find_polygon_path(self, start_id: int, goal_id: int) -> Optional[list[int]]:
@@ -328,62 +673,16 @@ class NavMeshPathfinder:
         Returns:
             List of polygon IDs forming path, or None
         """
-        import heapq
-
-        # A* on polygon graph
-        open_set = [(0.0, start_id)]
-        came_from: dict[int, int] = {}
-        g_score: dict[int, float] = {start_id: 0.0}
-
-        start_poly = self.navmesh.get_polygon(start_id)
-        goal_poly = self.navmesh.get_polygon(goal_id)
-
-        if not start_poly or not goal_poly:
+        graph = self._get_graph()
+        start = graph.index.get(start_id)
+        goal = graph.index.get(goal_id)
+        if start is None or goal is None:
             return None
 
-        while open_set:
-            _, current_id = heapq.heappop(open_set)
-
-            if current_id == goal_id:
-                # Reconstruct path
-                path = [current_id]
-                while current_id in came_from:
-                    current_id = came_from[current_id]
-                    path.append(current_id)
-                path.reverse()
-                return path
-
-            current_poly = self.navmesh.get_polygon(current_id)
-            if not current_poly:
-                continue
-
-            current_g = g_score[current_id]
-
-            for neighbor_id in current_poly.neighbors:
-                neighbor_poly = self.navmesh.get_polygon(neighbor_id)
-                if not neighbor_poly:
-                    continue
-
-                # Calculate tentative g_score (distance between centers)
-                dx = neighbor_poly.center.x - current_poly.center.x
-                dy = neighbor_poly.center.y - current_poly.center.y
-                distance = (dx * dx + dy * dy) ** 0.5
-
-                tentative_g = current_g + distance
-
-                if neighbor_id not in g_score or tentative_g < g_score[neighbor_id]:
-                    came_from[neighbor_id] = current_id
-                    g_score[neighbor_id] = tentative_g
-
-                    # Heuristic: distance to goal
-                    dx = goal_poly.center.x - neighbor_poly.center.x
-                    dy = goal_poly.center.y - neighbor_poly.center.y
-                    h = (dx * dx + dy * dy) ** 0.5
-
-                    f = tentative_g + h
-                    heapq.heappush(open_set, (f, neighbor_id))
-
-        return None
+        path = _astar(graph, start, goal)
+        if path is None:
+            return None
+        return [graph.polygons[i].id for i in path]
 
     def _create_waypoint_path(
         self, start: Vector2, goal: Vector2, polygon_path: list[int]
@@ -391,7 +690,6 @@ class NavMeshPathfinder:
         """Convert polygon path to waypoint path.
 
         Uses a simple approach: use polygon centers as waypoints.
-        For production, consider implementing the funnel algorithm.
 
         Args:
             start: Starting position
@@ -413,6 +711,140 @@ class NavMeshPathfinder:
 
         return waypoints
 
+    def _funnel_path(
+        self, start: Vector2, goal: Vector2, polygon_path: list[int]
+    ) -> list[Vector2]:
+        """Convert polygon path to the shortest waypoint path (string pulling).
+
+        Runs the simple stupid funnel algorithm over the portals between
+        consecutive polygons: waypoints are only emitted at portal corners
+        the path has to bend around.
+
+        Args:
+            start: Starting position
+            goal: Goal position
+            polygon_path: List of polygon IDs
+
+        Returns:
+            List of waypoint positions
+        """
+        # Portals as (left, right) pairs seen from the direction of travel;
+        # "left" is counter-clockwise. Start and goal are degenerate portals.
+        portals = [(start, start)]
+        for from_id, to_id in zip(polygon_path, polygon_path[1:]):
+            edge = self.navmesh.get_edge_between(from_id, to_id)
+            polygon = self.navmesh.get_polygon(from_id)
+            if edge is None or polygon is None:
+                return self._create_waypoint_path(start, goal, polygon_path)
+            if _cross(polygon.center, edge.start, edge.end) > 0:
+                portals.append((edge.end, edge.start))
+            else:
+                portals.append((edge.start, edge.end))
+        portals.append((goal, goal))
+
+        waypoints = [start]
+        apex = left = right = start
+        apex_index = left_index = right_index = 0
+
+        i = 1
+        while i < len(portals):
+            new_left, new_right = portals[i]
+
+            # Tighten the right side of the funnel
+            if _cross(apex, right, new_right) >= 0:
+                if _same_point(apex, right) or _cross(apex, left, new_right) < 0:
+                    right = new_right
+                    right_index = i
+                else:
+                    # Right crossed over left: left corner becomes the apex
+                    if not _same_point(waypoints[-1], left):
+                        waypoints.append(left)
+                    apex = right = left
+                    apex_index = right_index = left_index
+                    i = apex_index + 1
+                    continue
+
+            # Tighten the left side of the funnel
+            if _cross(apex, left, new_left) <= 0:
+                if _same_point(apex, left) or _cross(apex, right, new_left) > 0:
+                    left = new_left
+                    left_index = i
+                else:
+                    # Left crossed over right: right corner becomes the apex
+                    if not _same_point(waypoints[-1], right):
+                        waypoints.append(right)
+                    apex = left = right
+                    apex_index = left_index = right_index
+                    i = apex_index + 1
+                    continue
+
+            i += 1
+
+        if not _same_point(waypoints[-1], goal):
+            waypoints.append(goal)
+        return waypoints
+
+
+def _astar(graph: _PolygonGraph, start: int, goal: int) -> Optional[list[int]]:
+    """Run A* over a CSR polygon graph.
+
+    Heap entries carry the g-score they were pushed with, so entries made
+    stale by a later, cheaper push are discarded without re-expanding
+    their node.
+
+    Args:
+        graph: Search graph
+        start: Start node index
+        goal: Goal node index
+
+    Returns:
+        Node indices from start to goal, or None if unreachable
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    costs = graph.costs
+    center_x = graph.center_x
+    center_y = graph.center_y
+    goal_x = center_x[goal]
+    goal_y = center_y[goal]
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    open_set = [(0.0, 0.0, start)]
+    came_from: dict[int, int] = {}
+    g_score: dict[int, float] = {start: 0.0}
+
+    while open_set:
+        _, current_g, current = heappop(open_set)
+
+        if current == goal:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
+            return path
+
+        if current_g > g_score[current]:
+            continue
+
+        for edge in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[edge]
+            tentative_g = current_g + costs[edge]
+
+            if tentative_g < g_score.get(neighbor, math.inf):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+
+                # Heuristic: distance to goal
+                dx = goal_x - center_x[neighbor]
+                dy = goal_y - center_y[neighbor]
+                h = (dx * dx + dy * dy) ** 0.5
+
+                heappush(open_set, (tentative_g + h, tentative_g, neighbor))
+
+    return None
+
 
 def create_rectangle_polygon(
     polygon_id: int, x: float, y: float, width: float, height: float
@@ -440,15 +872,86 @@ def create_rectangle_polygon(
     return NavMeshPolygon(id=polygon_id, vertices=vertices)
 
 
-def _points_equal(p1: Vector2, p2: Vector2, epsilon: float = 0.001) -> bool:
-    """Check if two points are equal within tolerance.
+def _is_axis_aligned_rect(
+    vertices: list[Vector2], aabb: tuple[float, float, float, float]
+) -> bool:
+    """Check whether four vertices trace their own bounding box.
+
+    Args:
+        vertices: Polygon vertices in winding order
+        aabb: Bounds as (min_x, max_x, min_y, max_y)
+
+    Returns:
+        True if the polygon is a non-degenerate axis-aligned rectangle
+    """
+    min_x, max_x, min_y, max_y = aabb
+    if len(vertices) != 4 or min_x == max_x or min_y == max_y:
+        return False
+
+    corners = {(v.x, v.y) for v in vertices}
+    if corners != {(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)}:
+        return False
+
+    # Four distinct corners joined by axis-parallel edges (rules out a bowtie)
+    return all(
+        a.x == b.x or a.y == b.y for a, b in zip(vertices, vertices[1:] + vertices[:1])
+    )
+
+
+def _triangle_edges(vertices: list[Vector2]) -> Optional[tuple[float, ...]]:
+    """Build inward-facing edge functions for a triangle.
+
+    Each edge contributes ``(a, b, c)`` such that ``a * x + b * y + c`` is
+    non-negative on the triangle's side of the edge, whatever the winding.
+
+    Args:
+        vertices: The three triangle vertices
+
+    Returns:
+        Nine coefficients, or None for a degenerate (zero-area) triangle
+    """
+    p0, p1, p2 = vertices
+    area2 = (p1.x - p0.x) * (p2.y - p0.y) - (p2.x - p0.x) * (p1.y - p0.y)
+    if area2 == 0:
+        return None
+
+    sign = 1.0 if area2 > 0 else -1.0
+    coefficients: list[float] = []
+    for p, q in ((p0, p1), (p1, p2), (p2, p0)):
+        a = sign * (p.y - q.y)
+        b = sign * (q.x - p.x)
+        coefficients.extend((a, b, -(a * p.x + b * p.y)))
+    return tuple(coefficients)
+
+
+def _pair_key(poly1_id: int, poly2_id: int) -> tuple[int, int]:
+    """Order a polygon id pair so it can key undirected lookups."""
+    return (poly1_id, poly2_id) if poly1_id <= poly2_id else (poly2_id, poly1_id)
+
+
+def _cross(origin: Vector2, a: Vector2, b: Vector2) -> float:
+    """2D cross product of ``a - origin`` and ``b - origin``.
+
+    Positive when ``b`` lies counter-clockwise of the ray from ``origin``
+    through ``a``.
+    """
+    return float(
+        (a.x - origin.x) * (b.y - origin.y) - (a.y - origin.y) * (b.x - origin.x)
+    )
+
+
+def _same_point(p1: Vector2, p2: Vector2) -> bool:
+    """Check whether two points coincide within the vertex tolerance."""
+    return abs(p1.x - p2.x) < _EPSILON and abs(p1.y - p2.y) < _EPSILON
+
+
+def _snap(point: Vector2) -> tuple[int, int]:
+    """Quantize a point to the vertex tolerance so it can be hashed.
 
     Args:
-        p1: First point
-        p2: Second point
-        epsilon: Tolerance for equality
+        point: Point to quantize
 
     Returns:
-        True if points are equal within epsilon
+        Integer grid coordinates in units of the tolerance
     """
-    return abs(p1.x - p2.x) < epsilon and abs(p1.y - p2.y) < epsilon
+    return round(point.x / _EPSILON), round(point.y / _EPSILON)
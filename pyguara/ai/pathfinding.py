@@ -4,13 +4,22 @@ Provides efficient pathfinding with multiple heuristic options.
 """
 
 import heapq
+import math
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, Optional
+from typing import Callable, Final, Optional
+
+import numpy as np
 
 from pyguara.common.types import Vector2
 
 
+# Cost of one diagonal step, and how much more it costs than a straight one.
+# Kept slightly under sqrt(2) so octile distance never overestimates a path.
+DIAGONAL_COST: Final = 1.414
+DIAGONAL_EXTRA: Final = DIAGONAL_COST - 1.0
+
+
 class Heuristic(Enum):
     """Available heuristic functions for pathfinding."""
 
@@ -45,7 +54,7 @@ def euclidean_distance(start: tuple[int, int], goal: tuple[int, int]) -> float:
     """
     dx = start[0] - goal[0]
     dy = start[1] - goal[1]
-    return (dx * dx + dy * dy) ** 0.5
+    return math.sqrt(dx * dx + dy * dy)
 
 
 def diagonal_distance(start: tuple[int, int], goal: tuple[int, int]) -> float:
@@ -60,13 +69,13 @@ def diagonal_distance(start: tuple[int, int], goal: tuple[int, int]) -> float:
     """
     dx = abs(start[0] - goal[0])
     dy = abs(start[1] - goal[1])
-    return max(dx, dy)
+    return dx if dx > dy else dy
 
 
 def octile_distance(start: tuple[int, int], goal: tuple[int, int]) -> float:
     """Octile distance heuristic (8-directional with diagonal cost).
 
-    Uses sqrt(2) for diagonal movement cost.
+    Uses the grid's diagonal move cost (``DIAGONAL_COST``, about sqrt(2)).
 
     Args:
         start: Starting position (x, y)
@@ -77,7 +86,9 @@ def octile_distance(start: tuple[int, int], goal: tuple[int, int]) -> float:
     """
     dx = abs(start[0] - goal[0])
     dy = abs(start[1] - goal[1])
-    return (dx + dy) + (1.414 - 2) * min(dx, dy)
+    if dx > dy:
+        return dx + DIAGONAL_EXTRA * dy
+    return dy + DIAGONAL_EXTRA * dx
 
 
 # Map enum to function
@@ -90,25 +101,78 @@ HEURISTIC_FUNCTIONS: dict[
     Heuristic.OCTILE: octile_distance,
 }
 
+_HeuristicXY = Callable[[int, int, int, int], float]
 
-@dataclass(order=True)
-class PathNode:
-    """Node in the A* search.
 
-    Uses f_cost for priority queue ordering.
-    """
+def _manhattan_xy(x0: int, y0: int, x1: int, y1: int) -> float:
+    return abs(x0 - x1) + abs(y0 - y1)
+
 
-    f_cost: float
-    position: tuple[int, int] = field(compare=False)
-    g_cost: float = field(default=0.0, compare=False)
-    h_cost: float = field(default=0.0, compare=False)
-    parent: Optional["PathNode"] = field(default=None, compare=False, repr=False)
+def _euclidean_xy(x0: int, y0: int, x1: int, y1: int) -> float:
+    dx = x0 - x1
+    dy = y0 - y1
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def _diagonal_xy(x0: int, y0: int, x1: int, y1: int) -> float:
+    dx = abs(x0 - x1)
+    dy = abs(y0 - y1)
+    return dx if dx > dy else dy
+
+
+def _octile_xy(x0: int, y0: int, x1: int, y1: int) -> float:
+    dx = abs(x0 - x1)
+    dy = abs(y0 - y1)
+    if dx > dy:
+        return dx + DIAGONAL_EXTRA * dy
+    return dy + DIAGONAL_EXTRA * dx
+
+
+# Coordinate-argument variants for the search cores, which would otherwise
+# build a tuple for every heuristic call
+_HEURISTIC_XY: Final[dict[Heuristic, _HeuristicXY]] = {
+    Heuristic.MANHATTAN: _manhattan_xy,
+    Heuristic.EUCLIDEAN: _euclidean_xy,
+    Heuristic.DIAGONAL: _diagonal_xy,
+    Heuristic.OCTILE: _octile_xy,
+}
+
+
+# (dx, dy, move cost) in the same order as GridMap.get_neighbors
+_STEPS_4: Final[tuple[tuple[int, int, float], ...]] = (
+    (0, -1, 1.0),
+    (1, 0, 1.0),
+    (0, 1, 1.0),
+    (-1, 0, 1.0),
+)
+_STEPS_8: Final[tuple[tuple[int, int, float], ...]] = _STEPS_4 + (
+    (1, -1, DIAGONAL_COST),
+    (1, 1, DIAGONAL_COST),
+    (-1, 1, DIAGONAL_COST),
+    (-1, -1, DIAGONAL_COST),
+)
+
+
+# Chebyshev distance above which AStar.find_path searches from both ends
+BIDIRECTIONAL_MIN_SPAN: Final = 16
 
 
 class GridMap:
     """Grid-based map for pathfinding.
 
     Supports obstacles and different movement patterns.
+
+    Walkability is one byte per cell in row-major order (1 = walkable).
+    ``_cells`` is the flat buffer, which is cheap to index from Python;
+    ``_walkable`` is a zero-copy ``(height, width)`` NumPy view of it.
+    ``_blocked_rows`` mirrors the obstacles as one int bitmask per row
+    (bit ``x`` set = blocked) so line-of-sight checks can test a whole
+    row span with a single AND. Mutate the grid through the methods below
+    so both stay in sync.
+
+    Every obstacle change bumps ``version``. :meth:`snapshot` hands out a
+    read-only copy for searches that must not see changes made while they
+    run, such as pathfinding on a worker thread.
     """
 
     def __init__(self, width: int, height: int):
@@ -118,9 +182,51 @@ class GridMap:
             width: Grid width in cells
             height: Grid height in cells
         """
-        self.width = width
-        self.height = height
-        self._obstacles: set[tuple[int, int]] = set()
+        self.width: int = width
+        self.height: int = height
+        self._cells: bytearray = bytearray(b"\x01") * (width * height)
+        self._walkable = np.frombuffer(self._cells, dtype=np.uint8).reshape(
+            height, width
+        )
+        self._blocked_rows: list[int] = [0] * height
+        self._version: int = 0
+        self._read_only: bool = False
+        self._snapshot: Optional[GridMap] = None
+
+    @property
+    def version(self) -> int:
+        """Get the number of obstacle changes made to this grid."""
+        return self._version
+
+    def snapshot(self) -> "GridMap":
+        """Get a read-only copy of the grid as it is now.
+
+        The copy shares no storage with this grid, so later obstacle
+        changes don't affect searches running on it. Calls with no change
+        in between return the same snapshot.
+
+        Example:
+            >>> worker = AStar(grid.snapshot())  # safe to run off-thread
+
+        Returns:
+            A GridMap whose obstacle methods raise RuntimeError
+        """
+        if self._read_only:
+            return self
+
+        snap = self._snapshot
+        if snap is None or snap._version != self._version:
+            snap = GridMap(self.width, self.height)
+            snap._cells[:] = self._cells
+            snap._blocked_rows = list(self._blocked_rows)
+            snap._version = self._version
+            snap._read_only = True
+            self._snapshot = snap
+        return snap
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Cannot change obstacles on a GridMap snapshot")
 
     def add_obstacle(self, x: int, y: int) -> None:
         """Mark a cell as obstacle.
@@ -129,8 +235,11 @@ class GridMap:
             x: X coordinate
             y: Y coordinate
         """
+        self._check_writable()
         if 0 <= x < self.width and 0 <= y < self.height:
-            self._obstacles.add((x, y))
+            self._cells[y * self.width + x] = 0
+            self._blocked_rows[y] |= 1 << x
+            self._version += 1
 
     def remove_obstacle(self, x: int, y: int) -> None:
         """Remove obstacle from cell.
@@ -139,7 +248,11 @@ class GridMap:
             x: X coordinate
             y: Y coordinate
         """
-        self._obstacles.discard((x, y))
+        self._check_writable()
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._cells[y * self.width + x] = 1
+            self._blocked_rows[y] &= ~(1 << x)
+            self._version += 1
 
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a cell is walkable.
@@ -153,7 +266,7 @@ class GridMap:
         """
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        return (x, y) not in self._obstacles
+        return self._cells[y * self.width + x] == 1
 
     def get_neighbors(
         self, x: int, y: int, allow_diagonal: bool = True
@@ -168,44 +281,64 @@ class GridMap:
         Returns:
             List of walkable neighbor positions
         """
+        width = self.width
+        height = self.height
+        cells = self._cells
+        row = y * width
+        inside = 0 <= x < width and 0 <= y < height
         neighbors = []
 
-        # Cardinal directions (4-directional)
-        directions = [
-            (0, -1),  # North
-            (1, 0),  # East
-            (0, 1),  # South
-            (-1, 0),  # West
-        ]
-
-        if allow_diagonal:
-            # Add diagonal directions
-            directions.extend(
-                [
-                    (1, -1),  # Northeast
-                    (1, 1),  # Southeast
-                    (-1, 1),  # Southwest
-                    (-1, -1),  # Northwest
-                ]
-            )
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if self.is_walkable(nx, ny):
-                # For diagonal movement, check if adjacent cells are walkable
-                # to prevent cutting corners
-                if allow_diagonal and abs(dx) == 1 and abs(dy) == 1:
-                    if not self.is_walkable(x + dx, y) or not self.is_walkable(
-                        x, y + dy
-                    ):
-                        continue
-                neighbors.append((nx, ny))
+        for dx, dy, _ in _STEPS_8 if allow_diagonal else _STEPS_4:
+            nx = x + dx
+            ny = y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            if not cells[ny * width + nx]:
+                continue
+            # Diagonal moves may not cut past a blocked orthogonal cell
+            if dx and dy:
+                if not (inside and cells[row + nx] and cells[ny * width + x]):
+                    continue
+            neighbors.append((nx, ny))
 
         return neighbors
 
     def clear_obstacles(self) -> None:
         """Remove all obstacles from the map."""
-        self._obstacles.clear()
+        self._check_writable()
+        self._walkable.fill(1)
+        self._blocked_rows = [0] * self.height
+        self._version += 1
+
+
+@dataclass(slots=True)
+class _SearchScratch:
+    """Per-cell search state reused across searches on same-sized grids.
+
+    An entry only counts when its stamp equals the current ``generation``,
+    so starting a search is O(1) instead of clearing every cell. Index 0 of
+    ``seen``/``g_costs``/``parents`` is the forward search, index 1 the
+    backward one. A parent is only followed from cells the current search
+    reached, so ``parents`` needs no stamp of its own.
+    """
+
+    size: int
+    generation: int = 0
+    closed: list[int] = field(init=False)
+    seen: tuple[list[int], list[int]] = field(init=False)
+    g_costs: tuple[list[float], list[float]] = field(init=False)
+    parents: tuple[list[int], list[int]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.closed = [0] * self.size
+        self.seen = ([0] * self.size, [0] * self.size)
+        self.g_costs = ([0.0] * self.size, [0.0] * self.size)
+        self.parents = ([0] * self.size, [0] * self.size)
+
+    def begin(self) -> int:
+        """Start a new search, invalidating every entry of the previous one."""
+        self.generation += 1
+        return self.generation
 
 
 class AStar:
@@ -230,9 +363,10 @@ class AStar:
         Args:
             grid_map: Grid map to search on
         """
-        self.grid_map = grid_map
-        self._last_iterations = 0
-        self._last_path_length = 0
+        self.grid_map: GridMap = grid_map
+        self._last_iterations: int = 0
+        self._last_path_length: int = 0
+        self._scratch: Optional[_SearchScratch] = None
 
     def find_path(
         self,
@@ -243,6 +377,10 @@ class AStar:
     ) -> Optional[list[tuple[int, int]]]:
         """Find path from start to goal using A*.
 
+        Long searches, where start and goal are more than
+        ``BIDIRECTIONAL_MIN_SPAN`` cells apart on either axis, run
+        :meth:`find_path_bidirectional` instead.
+
         Args:
             start: Starting position (x, y)
             goal: Goal position (x, y)
@@ -261,93 +399,109 @@ class AStar:
         if start == goal:
             return [start]
 
-        # Get heuristic function
-        heuristic_func = HEURISTIC_FUNCTIONS[heuristic]
-
-        # Initialize
-        open_set: list[PathNode] = []
-        closed_set: set[tuple[int, int]] = set()
-        g_costs: dict[tuple[int, int], float] = {start: 0.0}
+        span = max(abs(goal[0] - start[0]), abs(goal[1] - start[1]))
+        search = _bidirectional_core if span > BIDIRECTIONAL_MIN_SPAN else _astar_core
+        return self._run(search, start, goal, heuristic, allow_diagonal)
 
-        # Add start node
-        h_cost = heuristic_func(start, goal)
-        start_node = PathNode(f_cost=h_cost, position=start, g_cost=0.0, h_cost=h_cost)
-        heapq.heappush(open_set, start_node)
+    def find_path_bidirectional(
+        self,
+        start: tuple[int, int],
+        goal: tuple[int, int],
+        heuristic: Heuristic = Heuristic.EUCLIDEAN,
+        allow_diagonal: bool = True,
+    ) -> Optional[list[tuple[int, int]]]:
+        """Find path from start to goal searching from both ends at once.
 
-        iterations = 0
+        Returns a path as short as :meth:`find_path` for consistent
+        heuristics, and gives up quickly when either end is walled into a
+        small region.
 
-        while open_set:
-            iterations += 1
+        Args:
+            start: Starting position (x, y)
+            goal: Goal position (x, y)
+            heuristic: Heuristic function to use
+            allow_diagonal: Allow diagonal movement
 
-            # Get node with lowest f_cost
-            current = heapq.heappop(open_set)
+        Returns:
+            List of positions from start to goal, or None if no path
+        """
+        if not self.grid_map.is_walkable(*start):
+            return None
+        if not self.grid_map.is_walkable(*goal):
+            return None
 
-            # Skip if already processed
-            if current.position in closed_set:
-                continue
+        if start == goal:
+            return [start]
 
-            # Found goal
-            if current.position == goal:
-                self._last_iterations = iterations
-                path = self._reconstruct_path(current)
-                self._last_path_length = len(path)
-                return path
-
-            # Mark as processed
-            closed_set.add(current.position)
-
-            # Check neighbors
-            for neighbor_pos in self.grid_map.get_neighbors(
-                *current.position, allow_diagonal=allow_diagonal
-            ):
-                if neighbor_pos in closed_set:
-                    continue
+        return self._run(_bidirectional_core, start, goal, heuristic, allow_diagonal)
 
-                # Calculate movement cost
-                dx = abs(neighbor_pos[0] - current.position[0])
-                dy = abs(neighbor_pos[1] - current.position[1])
-                move_cost = 1.414 if (dx + dy) == 2 else 1.0  # Diagonal cost
-
-                # Calculate g_cost
-                tentative_g = current.g_cost + move_cost
-
-                # Check if this path is better
-                if neighbor_pos not in g_costs or tentative_g < g_costs[neighbor_pos]:
-                    g_costs[neighbor_pos] = tentative_g
-                    h_cost = heuristic_func(neighbor_pos, goal)
-                    f_cost = tentative_g + h_cost
-
-                    neighbor_node = PathNode(
-                        f_cost=f_cost,
-                        position=neighbor_pos,
-                        g_cost=tentative_g,
-                        h_cost=h_cost,
-                        parent=current,
-                    )
-                    heapq.heappush(open_set, neighbor_node)
-
-        # No path found
-        self._last_iterations = iterations
-        self._last_path_length = 0
-        return None
+    def find_paths(
+        self,
+        starts: list[tuple[int, int]],
+        goals: list[tuple[int, int]],
+        heuristic: Heuristic = Heuristic.EUCLIDEAN,
+        allow_diagonal: bool = True,
+    ) -> list[Optional[list[tuple[int, int]]]]:
+        """Find paths for many start/goal pairs, e.g. one per agent.
 
-    def _reconstruct_path(self, node: PathNode) -> list[tuple[int, int]]:
-        """Reconstruct path from goal to start.
+        Searches run one after another on the shared scratch buffers, and a
+        pair that repeats within the batch is only searched once. Last-call
+        statistics describe the final search that actually ran.
 
         Args:
-            node: Goal node
+            starts: Starting positions (x, y), one per request
+            goals: Goal positions (x, y), matched to ``starts`` by index
+            heuristic: Heuristic function to use
+            allow_diagonal: Allow diagonal movement
 
         Returns:
-            List of positions from start to goal
-        """
-        path = []
-        current = node
+            One path (or None) per request, in request order
 
-        while current is not None:
-            path.append(current.position)
-            current = current.parent
+        Raises:
+            ValueError: If ``starts`` and ``goals`` differ in length
+        """
+        if len(starts) != len(goals):
+            raise ValueError(
+                f"Got {len(starts)} starts but {len(goals)} goals; "
+                "each request needs one of each"
+            )
 
-        path.reverse()
+        found: dict[
+            tuple[tuple[int, int], tuple[int, int]], Optional[list[tuple[int, int]]]
+        ] = {}
+        paths: list[Optional[list[tuple[int, int]]]] = []
+        for start, goal in zip(starts, goals):
+            key = (start, goal)
+            if key not in found:
+                found[key] = self.find_path(start, goal, heuristic, allow_diagonal)
+            path = found[key]
+            # Each caller gets its own list to consume
+            paths.append(list(path) if path is not None else None)
+        return paths
+
+    def _run(
+        self,
+        search: Callable[..., tuple[Optional[list[tuple[int, int]]], int]],
+        start: tuple[int, int],
+        goal: tuple[int, int],
+        heuristic: Heuristic,
+        allow_diagonal: bool,
+    ) -> Optional[list[tuple[int, int]]]:
+        """Run a search core and record its statistics."""
+        size = self.grid_map.width * self.grid_map.height
+        if self._scratch is None or self._scratch.size != size:
+            self._scratch = _SearchScratch(size)
+
+        path, iterations = search(
+            self.grid_map,
+            start,
+            goal,
+            _HEURISTIC_XY[heuristic],
+            allow_diagonal,
+            self._scratch,
+        )
+        self._last_iterations = iterations
+        self._last_path_length = len(path) if path else 0
         return path
 
     @property
@@ -361,6 +515,251 @@ class AStar:
         return self._last_path_length
 
 
+def _astar_core(
+    grid_map: GridMap,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    heuristic: _HeuristicXY,
+    allow_diagonal: bool,
+    scratch: Optional[_SearchScratch] = None,
+) -> tuple[Optional[list[tuple[int, int]]], int]:
+    """Run A* between two walkable cells.
+
+    Cells are packed as ``y * width + x`` ints so the open set, costs and
+    parent links hold plain ints instead of node objects. The closed set,
+    best known g-costs and parent links are flat per-cell lists from
+    ``scratch``, stamped with the search generation, so none of them needs
+    hashing or clearing.
+
+    The open set stays on ``heapq``: its sift loops run in C, which beats
+    any heap written in Python (an indexed 4-ary heap with decrease-key
+    was about 3x slower here). Without decrease-key a cell can be pushed
+    more than once, so superseded entries are skipped when popped.
+
+    Args:
+        grid_map: Grid to search
+        start: Starting position (x, y), already known to be walkable
+        goal: Goal position (x, y), already known to be walkable
+        heuristic: Heuristic taking ``(x0, y0, x1, y1)``
+        allow_diagonal: Allow diagonal movement
+        scratch: Reusable per-cell buffers; a fresh set is made if omitted
+
+    Returns:
+        Tuple of (path or None, iterations performed)
+    """
+    width = grid_map.width
+    height = grid_map.height
+    cells = grid_map._cells
+    steps = _STEPS_8 if allow_diagonal else _STEPS_4
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    start_id = start[1] * width + start[0]
+    goal_id = goal[1] * width + goal[0]
+
+    goal_x, goal_y = goal
+
+    if scratch is None:
+        scratch = _SearchScratch(width * height)
+    generation = scratch.begin()
+    closed = scratch.closed
+    seen = scratch.seen[0]
+    g_costs = scratch.g_costs[0]
+    seen[start_id] = generation
+    g_costs[start_id] = 0.0
+
+    came_from = scratch.parents[0]
+
+    open_set = [(heuristic(start[0], start[1], goal_x, goal_y), start_id)]
+
+    iterations = 0
+    while open_set:
+        iterations += 1
+        _, node = heappop(open_set)
+
+        # Skip if already processed
+        if closed[node] == generation:
+            continue
+
+        if node == goal_id:
+            path = []
+            while node != start_id:
+                path.append((node % width, node // width))
+                node = came_from[node]
+            path.append(start)
+            path.reverse()
+            return path, iterations
+
+        closed[node] = generation
+        y, x = divmod(node, width)
+        node_g = g_costs[node]
+
+        for dx, dy, move_cost in steps:
+            nx = x + dx
+            ny = y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = ny * width + nx
+            if not cells[neighbor]:
+                continue
+            # Diagonal moves may not cut past a blocked orthogonal cell
+            if dx and dy and not (cells[node + dx] and cells[neighbor - dx]):
+                continue
+
+            if closed[neighbor] == generation:
+                continue
+
+            tentative_g = node_g + move_cost
+            if seen[neighbor] != generation or tentative_g < g_costs[neighbor]:
+                seen[neighbor] = generation
+                g_costs[neighbor] = tentative_g
+                came_from[neighbor] = node
+                f_cost = tentative_g + heuristic(nx, ny, goal_x, goal_y)
+                heappush(open_set, (f_cost, neighbor))
+
+    return None, iterations
+
+
+def _bidirectional_core(
+    grid_map: GridMap,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    heuristic: _HeuristicXY,
+    allow_diagonal: bool,
+    scratch: Optional[_SearchScratch] = None,
+) -> tuple[Optional[list[tuple[int, int]]], int]:
+    """Run bidirectional A* (NBA*) between two walkable cells.
+
+    One search grows from the start towards the goal and one from the goal
+    towards the start, always advancing the smaller open set. A cell
+    closed by either side is never expanded again, and a popped cell is
+    pruned when its f-cost, or its g-cost plus the other side's lowest
+    f-cost minus its heuristic to the other end, already reaches the best
+    meeting cost. The result is optimal when the heuristic is consistent.
+
+    Args:
+        grid_map: Grid to search
+        start: Starting position (x, y), already known to be walkable
+        goal: Goal position (x, y), already known to be walkable
+        heuristic: Heuristic taking ``(x0, y0, x1, y1)``
+        allow_diagonal: Allow diagonal movement
+        scratch: Reusable per-cell buffers; a fresh set is made if omitted
+
+    Returns:
+        Tuple of (path or None, iterations performed)
+    """
+    width = grid_map.width
+    height = grid_map.height
+    cells = grid_map._cells
+    steps = _STEPS_8 if allow_diagonal else _STEPS_4
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    inf = math.inf
+
+    start_id = start[1] * width + start[0]
+    goal_id = goal[1] * width + goal[0]
+
+    # Index 0 searches forward from start, index 1 backward from goal
+    targets = (goal, start)
+    opens: tuple[list[tuple[float, int]], list[tuple[float, int]]] = (
+        [(heuristic(start[0], start[1], goal[0], goal[1]), start_id)],
+        [(heuristic(goal[0], goal[1], start[0], start[1]), goal_id)],
+    )
+    if scratch is None:
+        scratch = _SearchScratch(width * height)
+    generation = scratch.begin()
+    closed = scratch.closed
+    seen = scratch.seen
+    g_costs = scratch.g_costs
+    seen[0][start_id] = generation
+    g_costs[0][start_id] = 0.0
+    seen[1][goal_id] = generation
+    g_costs[1][goal_id] = 0.0
+
+    came_from = scratch.parents
+
+    best_cost = inf
+    meeting = -1
+    iterations = 0
+    while opens[0] and opens[1]:
+        iterations += 1
+        side = 0 if len(opens[0]) <= len(opens[1]) else 1
+        other = 1 - side
+        open_set = opens[side]
+        g_side = g_costs[side]
+        g_other = g_costs[other]
+        seen_side = seen[side]
+        seen_other = seen[other]
+        target_x, target_y = targets[side]
+        back_x, back_y = targets[other]
+
+        f_cost, node = heappop(open_set)
+        if closed[node] == generation:
+            continue
+        closed[node] = generation
+
+        y, x = divmod(node, width)
+        node_g = g_side[node]
+        if f_cost >= best_cost:
+            continue
+        # Read the other side's live minimum: its heap gains lower-f entries
+        # after each of its expansions, so a cached value would over-prune.
+        other_open = opens[other]
+        lowest_other = other_open[0][0] if other_open else inf
+        if node_g + lowest_other - heuristic(x, y, back_x, back_y) >= best_cost:
+            continue
+
+        links = came_from[side]
+        for dx, dy, move_cost in steps:
+            nx = x + dx
+            ny = y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor = ny * width + nx
+            if not cells[neighbor]:
+                continue
+            # Diagonal moves may not cut past a blocked orthogonal cell
+            if dx and dy and not (cells[node + dx] and cells[neighbor - dx]):
+                continue
+
+            if closed[neighbor] == generation:
+                continue
+
+            tentative_g = node_g + move_cost
+            if seen_side[neighbor] != generation or tentative_g < g_side[neighbor]:
+                seen_side[neighbor] = generation
+                g_side[neighbor] = tentative_g
+                links[neighbor] = node
+                heappush(
+                    open_set,
+                    (tentative_g + heuristic(nx, ny, target_x, target_y), neighbor),
+                )
+                if seen_other[neighbor] != generation:
+                    continue
+                through = tentative_g + g_other[neighbor]
+                if through < best_cost:
+                    best_cost = through
+                    meeting = neighbor
+
+    if meeting < 0:
+        return None, iterations
+
+    path = []
+    node = meeting
+    while node != start_id:
+        path.append((node % width, node // width))
+        node = came_from[0][node]
+    path.append(start)
+    path.reverse()
+
+    node = meeting
+    while node != goal_id:
+        node = came_from[1][node]
+        path.append((node % width, node // width))
+
+    return path, iterations
+
+
 def smooth_path(
     path: list[tuple[int, int]], grid_map: GridMap
 ) -> list[tuple[int, int]]:
@@ -402,7 +801,11 @@ def _has_line_of_sight(
 ) -> bool:
     """Check if there's a clear line of sight between two points.
 
-    Uses Bresenham's line algorithm.
+    Visits the same cells as Bresenham's line algorithm. For shallow lines
+    each row the line crosses is a contiguous x-span, so the span is tested
+    against the row's obstacle bitmask in one go. Steep lines first check
+    whether the segment's bounding box is free of obstacles at all, and
+    only walk the cells one by one when it is not.
 
     Args:
         start: Starting position
@@ -415,6 +818,61 @@ def _has_line_of_sight(
     x0, y0 = start
     x1, y1 = end
 
+    # Both endpoints are on the line, and every other cell lies between them
+    width = grid_map.width
+    height = grid_map.height
+    if not (0 <= x0 < width and 0 <= y0 < height):
+        return False
+    if not (0 <= x1 < width and 0 <= y1 < height):
+        return False
+
+    rows = grid_map._blocked_rows
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    if dx < dy:
+        box = ((1 << (dx + 1)) - 1) << min(x0, x1)
+        for y in range(min(y0, y1), max(y0, y1) + 1):
+            if rows[y] & box:
+                return _bresenham_clear(start, end, grid_map)
+        return True
+
+    rows = grid_map._blocked_rows
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    two_dy = 2 * dy
+
+    # Bresenham puts step i on row (2*i*dy + dx - 1) // (2*dx), so row k
+    # starts at step ((2k - 1) * dx + 2 * dy) // (2 * dy)
+    first = 0
+    for k in range(dy + 1):
+        last = dx if k == dy else ((2 * k + 1) * dx + two_dy) // two_dy - 1
+        xa = x0 + sx * first
+        xb = x0 + sx * last
+        if xa > xb:
+            xa, xb = xb, xa
+        if rows[y0 + sy * k] >> xa & ((1 << (xb - xa + 1)) - 1):
+            return False
+        first = last + 1
+
+    return True
+
+
+def _bresenham_clear(
+    start: tuple[int, int], end: tuple[int, int], grid_map: GridMap
+) -> bool:
+    """Walk Bresenham's line cell by cell, stopping at the first blocked one.
+
+    Args:
+        start: Starting position
+        end: Ending position
+        grid_map: Grid map for collision checking
+
+    Returns:
+        True if every cell on the line is walkable
+    """
+    x0, y0 = start
+    x1, y1 = end
+
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
 
@@ -452,13 +910,32 @@ def path_to_world_coords(
     Returns:
         Path in world coordinates
     """
-    world_path = []
-    for x, y in path:
-        # Center of cell
-        world_x = x * cell_size + cell_size / 2 + offset.x
-        world_y = y * cell_size + cell_size / 2 + offset.y
-        world_path.append(Vector2(world_x, world_y))
-    return world_path
+    points = path_to_world_array(path, cell_size, offset).tolist()
+    return [Vector2(world_x, world_y) for world_x, world_y in points]
+
+
+def path_to_world_array(
+    path: list[tuple[int, int]], cell_size: float, offset: Vector2 = Vector2.zero()
+) -> np.ndarray:
+    """Convert grid path to world coordinates as an ``(N, 2)`` array.
+
+    Same result as :func:`path_to_world_coords` without building a
+    ``Vector2`` per waypoint.
+
+    Args:
+        path: Grid path (cell coordinates)
+        cell_size: Size of each grid cell in world units
+        offset: World offset (default: 0, 0)
+
+    Returns:
+        Float64 array of cell centers in world coordinates
+    """
+    points = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    # Center of cell
+    points *= cell_size
+    points += cell_size / 2
+    points += (offset.x, offset.y)
+    return points
 
 
 def world_to_grid_coords(
@@ -477,3 +954,23 @@ def world_to_grid_coords(
     grid_x = int((position.x - offset.x) / cell_size)
     grid_y = int((position.y - offset.y) / cell_size)
     return (grid_x, grid_y)
+
+
+def world_to_grid_array(
+    positions: np.ndarray, cell_size: float, offset: Vector2 = Vector2.zero()
+) -> np.ndarray:
+    """Convert many world positions to grid positions at once.
+
+    Rounds toward zero like :func:`world_to_grid_coords`.
+
+    Args:
+        positions: Array-like of shape ``(N, 2)`` in world units
+        cell_size: Size of each grid cell in world units
+        offset: World offset (default: 0, 0)
+
+    Returns:
+        Int64 array of shape ``(N, 2)`` with grid positions
+    """
+    points = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    cells = (points - (offset.x, offset.y)) / cell_size
+    return cells.astype(np.int64)
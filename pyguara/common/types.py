@@ -31,6 +31,9 @@ class Vector2(pymunk.Vec2d):
         y (float): The Y component.
     """
 
+    # Keep instances as bare tuples (no per-instance __dict__)
+    __slots__ = ()
+
     @property
     def magnitude(self) -> float:
         """
@@ -58,6 +61,8 @@ class Vector2(pymunk.Vec2d):
 
     def __add__(self, other: Any) -> Vector2:
         """Vector addition."""
+        if type(other) is Vector2:
+            return Vector2(self[0] + other[0], self[1] + other[1])
         if hasattr(other, "x") and hasattr(other, "y"):
             return Vector2(self.x + other.x, self.y + other.y)
         v = super().__add__(other)
@@ -65,6 +70,8 @@ class Vector2(pymunk.Vec2d):
 
     def __sub__(self, other: Any) -> Vector2:
         """Vector subtraction."""
+        if type(other) is Vector2:
+            return Vector2(self[0] - other[0], self[1] - other[1])
         if hasattr(other, "x") and hasattr(other, "y"):
             return Vector2(self.x - other.x, self.y - other.y)
         v = super().__sub__(other)
@@ -73,17 +80,23 @@ class Vector2(pymunk.Vec2d):
     def __mul__(self, other: float) -> Vector2:  # type: ignore[override]
         """Scalar multiplication (Vector * float)."""
         # Ignored override because Tuple expects int (repetition), we want float (math)
+        if type(other) is float or type(other) is int:
+            return Vector2(self[0] * other, self[1] * other)
         v = super().__mul__(other)
         return Vector2(v.x, v.y)
 
     def __rmul__(self, other: float) -> Vector2:  # type: ignore[override]
         """Reverse scalar multiplication (float * Vector)."""
         # Ignored override because Tuple expects int (repetition), we want float (math)
+        if type(other) is float or type(other) is int:
+            return Vector2(self[0] * other, self[1] * other)
         v = super().__rmul__(other)
         return Vector2(v.x, v.y)
 
     def __truediv__(self, other: float) -> Vector2:
         """Scalar division (Vector / float)."""
+        if type(other) is float or type(other) is int:
+            return Vector2(self[0] / other, self[1] / other)
         v = super().__truediv__(other)
         return Vector2(v.x, v.y)
 
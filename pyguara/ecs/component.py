@@ -14,7 +14,7 @@ The allowed methods in components are:
 
 import logging
 import warnings
-from typing import Any, Optional, Protocol, Set, TYPE_CHECKING
+from typing import Any, Dict, Optional, Protocol, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyguara.ecs.entity import Entity
@@ -65,6 +65,32 @@ ALLOWED_METHODS: Set[str] = {
 }
 
 
+# Component type -> single-bit mask, assigned the first time a type is seen.
+# Entities OR these together so "has all of X, Y" is one integer comparison.
+_TYPE_MASKS: Dict[type, int] = {}
+
+
+def component_mask(*component_types: type) -> int:
+    """Return the combined bitmask for one or more component types.
+
+    Each type gets its own bit on first use; Python ints are unbounded, so
+    there is no limit on the number of component types.
+
+    Args:
+        *component_types: Component classes to combine.
+
+    Returns:
+        Bitwise OR of the masks of all given types.
+    """
+    mask = 0
+    for component_type in component_types:
+        bit = _TYPE_MASKS.get(component_type)
+        if bit is None:
+            bit = _TYPE_MASKS[component_type] = 1 << len(_TYPE_MASKS)
+        mask |= bit
+    return mask
+
+
 def _is_property(cls: type, name: str) -> bool:
     """Check if a class attribute is a property."""
     for base in cls.__mro__:
@@ -4,7 +4,7 @@ import re
 import uuid
 from typing import Dict, Optional, Type, TypeVar, Any, Callable, Set
 
-from pyguara.ecs.component import Component
+from pyguara.ecs.component import Component, component_mask
 
 C = TypeVar("C", bound=Component)
 
@@ -33,6 +33,8 @@ class Entity:
             Type[Component], Component
         ] = {}  # Direct attribute cache (e.g., self.transform)
         self._property_cache: Dict[str, Component] = {}
+        # Bitmask of owned component types (see component_mask)
+        self._mask = 0
 
         # Callback hook for the EntityManager to keep indexes in sync
         # Signature: (entity_id: str, component_type: Type[Component]) -> None
@@ -63,6 +65,7 @@ class Entity:
 
         # 1. Store Component
         self._components[component_type] = component
+        self._mask |= component_mask(component_type)
         component.on_attach(self)
 
         # 2. Update Attribute Cache (Optimization B)
@@ -104,6 +107,7 @@ class Entity:
         """
         if component_type in self._components:
             comp = self._components.pop(component_type)
+            self._mask &= ~component_mask(component_type)
             comp.on_detach()
 
             # Remove from property cache
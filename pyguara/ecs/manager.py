@@ -1,11 +1,23 @@
 """Entity Manager implementation for ECS with Spatial Indexing."""
 
-from typing import Dict, Optional, Type, Iterator, Set, Tuple, TypeVar, overload
-from collections import defaultdict
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
+from collections import OrderedDict, defaultdict
 
 from pyguara.ecs.component import Component
 from pyguara.ecs.entity import Entity
-from pyguara.ecs.query_cache import QueryCache
+from pyguara.ecs.query_cache import CachedQueryView, QueryCache
+from pyguara.ecs.sparse_set import SparseSet
 
 # Type variables for component tuple queries
 C1 = TypeVar("C1", bound=Component)
@@ -13,25 +25,36 @@ C2 = TypeVar("C2", bound=Component)
 C3 = TypeVar("C3", bound=Component)
 C4 = TypeVar("C4", bound=Component)
 
+# Number of distinct component combinations whose query results are memoized
+_QUERY_MEMO_SIZE = 64
+
 
 class EntityManager:
     """Manages the lifecycle and querying of entities.
 
     Acts as the central database for the game world.
-    Optimized with Inverted Indexes for O(1) component lookups.
+    Optimized with Inverted Indexes for O(1) component lookups; each index
+    is a SparseSet so query iteration walks a packed list.
     """
 
     def __init__(self) -> None:
         """Initialize the entity manager."""
         self._entities: Dict[str, Entity] = {}
 
-        # The Inverted Index: ComponentType -> Set[EntityID]
+        # The Inverted Index: ComponentType -> SparseSet of (EntityID, Component)
         # This solves the O(N) Query Problem.
-        self._component_index: Dict[Type[Component], Set[str]] = defaultdict(set)
+        self._component_index: Dict[Type[Component], SparseSet] = defaultdict(SparseSet)
 
         # Query cache for hot-path optimizations (P1-008)
         self._query_cache: QueryCache = QueryCache(self)
 
+        # Bumped on every structural change; memoized query results are only
+        # reused while the serial they were computed at is still current.
+        self._serial = 0
+        self._query_memo: OrderedDict[
+            FrozenSet[Type[Component]], Tuple[int, Tuple[str, ...]]
+        ] = OrderedDict()
+
     def create_entity(self, entity_id: Optional[str] = None) -> Entity:
         """Create and register a new entity."""
         entity = Entity(entity_id)
@@ -41,6 +64,7 @@ class EntityManager:
     def add_entity(self, entity: Entity) -> None:
         """Register an existing entity."""
         self._entities[entity.id] = entity
+        self._serial += 1
 
         # Hook into the entity's lifecycle to keep our index updated
         # This dependency injection allows the Entity to notify us without
@@ -49,8 +73,9 @@ class EntityManager:
         entity._on_component_removed = self._on_entity_component_removed
 
         # Index any components that might already exist on this entity
-        for comp_type in entity._components:
-            self._component_index[comp_type].add(entity.id)
+        for comp_type, component in entity._components.items():
+            self._component_index[comp_type].add(entity.id, component)
+            self._query_cache.on_component_added(entity.id, comp_type)
 
     def remove_entity(self, entity_id: str) -> None:
         """Destroy an entity and clean up indexes."""
@@ -62,8 +87,15 @@ class EntityManager:
             for comp_type in entity._components:
                 if comp_type in self._component_index:
                     self._component_index[comp_type].discard(entity_id)
+            self._query_cache.on_entity_removed(entity_id, entity._components)
 
             del self._entities[entity_id]
+            self._serial += 1
+
+    def clear(self) -> None:
+        """Remove all entities, leaving registered cached queries in place."""
+        for entity_id in list(self._entities):
+            self.remove_entity(entity_id)
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Retrieve an entity by ID."""
@@ -80,28 +112,76 @@ class EntityManager:
         Performance: O(K) where K is the number of entities matching the query,
         independent of the total number of entities in the world.
         """
-        if not component_types:
-            return
+        # Resolve IDs up front so callers may modify entities while iterating
+        entities = self._entities
+        for eid in self._query_ids(component_types):
+            entity = entities.get(eid)
+            if entity is not None:  # May have been removed mid-iteration
+                yield entity
+
+    def _query_ids(self, component_types: Sequence[Type[Component]]) -> Sequence[str]:
+        """Return the IDs of entities owning all of ``component_types``.
+
+        Results are memoized per component combination until the next
+        structural change, so several systems running the same query in
+        one frame only walk the index once.
+
+        Args:
+            component_types: Component types the entities must have.
+
+        Returns:
+            Matching entity IDs (immutable, safe to hold across changes).
+        """
+        key = frozenset(component_types)
+        memo = self._query_memo
+        hit = memo.get(key)
+        if hit is not None and hit[0] == self._serial:
+            memo.move_to_end(key)
+            return hit[1]
+
+        result_ids = tuple(self._match_ids(component_types))
+        memo[key] = (self._serial, result_ids)
+        memo.move_to_end(key)
+        if len(memo) > _QUERY_MEMO_SIZE:
+            memo.popitem(last=False)
+        return result_ids
+
+    def _match_ids(self, component_types: Sequence[Type[Component]]) -> List[str]:
+        """Find entities owning all given types, bypassing the memo.
+
+        Walks the dense ID list of the smallest index and checks membership
+        in the others, so cost scales with the rarest component.
 
-        # 1. Get the sets of entity IDs for each requested component
-        # If any component type has no entities, the intersection is empty.
-        sets = []
+        Args:
+            component_types: Component types the entities must have.
+
+        Returns:
+            Matching entity IDs as a new list.
+        """
+        stores = []
         for c_type in component_types:
-            if c_type not in self._component_index:
-                return  # Empty result
-            sets.append(self._component_index[c_type])
+            store = self._component_index.get(c_type)
+            if not store:
+                return []  # No entity has this component
+            stores.append(store)
 
-        # 2. Sort by size (optimization: intersection is faster if we start small)
-        sets.sort(key=len)
+        if not stores:
+            return []
 
-        # 3. Perform intersection
-        result_ids = sets[0]
-        for i in range(1, len(sets)):
-            result_ids = result_ids & sets[i]  # Intersection
+        # Smallest index first: it bounds the walk, and the next-smallest
+        # rejects non-matches earliest in the membership checks.
+        stores.sort(key=len)
+        pivot, others = stores[0], stores[1:]
+        if not others:
+            return list(pivot.dense)
 
-        # 4. Yield actual entities
-        for eid in result_ids:
-            yield self._entities[eid]
+        if len(others) == 1:
+            # Most queries are pairs; skip the all() generator for them
+            other = others[0].sparse
+            return [eid for eid in pivot.dense if eid in other]
+
+        sparses = [store.sparse for store in others]
+        return [eid for eid in pivot.dense if all(eid in sp for sp in sparses)]
 
     def register_cached_query(self, *component_types: Type[Component]) -> None:
         """
@@ -128,7 +208,7 @@ class EntityManager:
 
     def get_entities_with_cached(
         self, *component_types: Type[Component]
-    ) -> Iterator[Entity]:
+    ) -> CachedQueryView:
         """
         Fast cached query for hot-path systems (P1-008 optimization).
 
@@ -142,7 +222,7 @@ class EntityManager:
             *component_types: Component types to query for
 
         Returns:
-            Iterator of entities matching the query
+            View of the matching entities; supports iteration, len() and ``in``
 
         Example:
             # Register once during initialization
@@ -152,16 +232,14 @@ class EntityManager:
             for entity in entity_manager.get_entities_with_cached(Transform, RigidBody):
                 # ... process entity ...
         """
-        cached_ids = self._query_cache.get_cached(*component_types)
+        cached_ids = self._query_cache.get_cached_ids(*component_types)
+
+        if cached_ids is None:
+            # Fallback to standard query if not registered
+            return CachedQueryView(self._query_ids(component_types), self._entities)
 
-        if cached_ids:
-            # Use cached results
-            for eid in cached_ids:
-                if eid in self._entities:  # Safety check
-                    yield self._entities[eid]
-        else:
-            # Fallback to standard query if not cached
-            yield from self.get_entities_with(*component_types)
+        # Wrap the reconciled cache set directly; no per-call copy
+        return CachedQueryView(cached_ids, self._entities)
 
     def _on_entity_component_added(
         self, entity_id: str, component_type: Type[Component]
@@ -177,7 +255,14 @@ class EntityManager:
             entity_id: The ID of the entity that added a component.
             component_type: The type of component that was added.
         """
-        self._component_index[component_type].add(entity_id)
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            return  # Entity was removed from this manager
+
+        self._serial += 1
+        self._component_index[component_type].add(
+            entity_id, entity._components[component_type]
+        )
         # Update query cache
         self._query_cache.on_component_added(entity_id, component_type)
 
@@ -197,6 +282,7 @@ class EntityManager:
         """
         if component_type in self._component_index:
             self._component_index[component_type].discard(entity_id)
+        self._serial += 1
         # Update query cache
         self._query_cache.on_component_removed(entity_id, component_type)
 
@@ -258,28 +344,15 @@ class EntityManager:
                 # Direct component access, no entity.get_component() calls
                 sprite.position = transform.position
         """
-        if not component_types:
+        result_ids = self._query_ids(component_types)
+        if not result_ids:
             return
 
-        # Get entity IDs matching all component types
-        sets = []
-        for c_type in component_types:
-            if c_type not in self._component_index:
-                return  # Empty result
-            sets.append(self._component_index[c_type])
-
-        # Sort by size and intersect
-        sets.sort(key=len)
-        result_ids = sets[0]
-        for i in range(1, len(sets)):
-            result_ids = result_ids & sets[i]
-
-        # Yield component tuples directly (bypasses Entity wrapper)
+        # Read components straight from the sparse sets, in requested order
+        # (bypasses both the Entity wrapper and its component dict)
+        stores = [self._component_index[c_type] for c_type in component_types]
         for eid in result_ids:
-            entity = self._entities[eid]
-            # Build tuple of components in requested order
-            components = tuple(entity._components[c_type] for c_type in component_types)
-            yield components
+            yield tuple(store.components[store.sparse[eid]] for store in stores)
 
     def get_components_with_entity(
         self, *component_types: Type[Component]
@@ -303,22 +376,8 @@ class EntityManager:
                     # Can access entity.id or call entity methods
                     print(f"Fast entity: {entity.id}")
         """
-        if not component_types:
-            return
-
-        # Get entity IDs matching all component types
-        sets = []
-        for c_type in component_types:
-            if c_type not in self._component_index:
-                return
-            sets.append(self._component_index[c_type])
-
-        sets.sort(key=len)
-        result_ids = sets[0]
-        for i in range(1, len(sets)):
-            result_ids = result_ids & sets[i]
-
-        for eid in result_ids:
-            entity = self._entities[eid]
+        entities = self._entities
+        for eid in self._query_ids(component_types):
+            entity = entities[eid]
             components = tuple(entity._components[c_type] for c_type in component_types)
             yield entity, components
@@ -0,0 +1,89 @@
+"""Sparse-set storage for per-component-type entity membership.
+
+A sparse set keeps the entity IDs owning a component type packed in a dense
+list, alongside a parallel list of the component instances, plus a sparse
+mapping from entity ID to its position. Membership tests are O(1), iteration
+is a straight walk over the dense lists, and removal stays O(1) by swapping
+the removed row with the last one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from pyguara.ecs.component import Component
+
+
+@dataclass(slots=True)
+class SparseSet:
+    """Packed storage of the entities owning one component type.
+
+    Attributes:
+        dense: Entity IDs, packed with no gaps (order changes on removal).
+        components: Component instances, parallel to ``dense``.
+        sparse: Lookup from entity ID to its row in ``dense``.
+    """
+
+    dense: List[str] = field(default_factory=list)
+    components: List[Component] = field(default_factory=list)
+    sparse: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, entity_id: str, component: Component) -> None:
+        """Store a component for an entity, replacing any existing one.
+
+        Args:
+            entity_id: Entity owning the component.
+            component: The component instance.
+        """
+        row = self.sparse.get(entity_id)
+        if row is not None:
+            self.components[row] = component
+            return
+
+        self.sparse[entity_id] = len(self.dense)
+        self.dense.append(entity_id)
+        self.components.append(component)
+
+    def discard(self, entity_id: str) -> None:
+        """Remove an entity if present, using swap-and-pop.
+
+        Args:
+            entity_id: Entity to remove.
+        """
+        row = self.sparse.pop(entity_id, None)
+        if row is None:
+            return
+
+        last_id = self.dense.pop()
+        last_component = self.components.pop()
+
+        # Move the former last row into the gap (unless we removed it)
+        if row < len(self.dense):
+            self.dense[row] = last_id
+            self.components[row] = last_component
+            self.sparse[last_id] = row
+
+    def get(self, entity_id: str) -> Optional[Component]:
+        """Get an entity's component, or None if it has none."""
+        row = self.sparse.get(entity_id)
+        return None if row is None else self.components[row]
+
+    def clear(self) -> None:
+        """Remove all entities."""
+        self.dense.clear()
+        self.components.clear()
+        self.sparse.clear()
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Check whether an entity is stored."""
+        return entity_id in self.sparse
+
+    def __len__(self) -> int:
+        """Return the number of stored entities."""
+        return len(self.dense)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over stored entity IDs in dense order."""
+        return iter(self.dense)
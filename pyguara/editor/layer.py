@@ -189,8 +189,7 @@ class EditorTool(Tool):
 
         try:
             # Clear existing entities before loading
-            scene.entity_manager._entities.clear()
-            scene.entity_manager._component_index.clear()
+            scene.entity_manager.clear()
 
             success = serializer.load_scene(scene, filename)
             if success:
@@ -4,28 +4,46 @@ Nine-patch sprites divide an image into 9 sections (corners, edges, center)
 that can be scaled independently while preserving corner details.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from pyguara.common.types import Vector2, Rect
 from pyguara.graphics.protocols import UIRenderer
 
 
-@dataclass
+# Upper bound on cached destination layouts per sprite; animated widgets
+# produce a new rect every frame, so the cache is simply reset when full.
+_DEST_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
 class NinePatchMetrics:
     """Defines the 9-patch division metrics.
 
+    Metrics are immutable so computed patch layouts can be cached per value.
+
     Attributes:
         left: Left edge width in pixels
         right: Right edge width in pixels
         top: Top edge height in pixels
         bottom: Bottom edge height in pixels
+        min_w: Combined width of the left and right edges
+        min_h: Combined height of the top and bottom edges
     """
 
     left: int
     right: int
     top: int
     bottom: int
+    min_w: int = field(init=False, repr=False, compare=False)
+    min_h: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the minimum size implied by the edges."""
+        object.__setattr__(self, "min_w", self.left + self.right)
+        object.__setattr__(self, "min_h", self.top + self.bottom)
 
     @classmethod
     def uniform(cls, size: int) -> "NinePatchMetrics":
@@ -65,6 +83,9 @@ class NinePatchSprite:
     This allows UI elements like buttons and panels to scale properly
     without distorting corners.
 
+    Patch and destination layouts are cached, so the returned rects are
+    shared between calls and must not be modified in place.
+
     Attributes:
         texture_path: Path to the texture atlas/sprite image
         source_rect: Source rectangle in the texture (entire image if None)
@@ -76,6 +97,12 @@ class NinePatchSprite:
     metrics: NinePatchMetrics
     source_rect: Optional[Rect] = None
     min_size: Optional[Vector2] = None
+    _patch_cache: dict[tuple, tuple[Rect, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _dest_cache: dict[tuple, tuple[Rect, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get_min_size(self) -> Vector2:
         """Get the minimum size this nine-patch can be rendered at.
@@ -86,99 +113,124 @@ class NinePatchSprite:
         if self.min_size:
             return self.min_size
 
-        # Calculate from metrics
-        min_width = self.metrics.left + self.metrics.right
-        min_height = self.metrics.top + self.metrics.bottom
-        return Vector2(min_width, min_height)
+        return Vector2(self.metrics.min_w, self.metrics.min_h)
 
-    def get_patch_rects(self, source_width: int, source_height: int) -> list[Rect]:
-        """Calculate source rectangles for each patch.
+    def get_patch_rects_np(self, source_width: int, source_height: int) -> np.ndarray:
+        """Calculate source rectangles for each patch as an array.
 
         Args:
             source_width: Width of the source texture
             source_height: Height of the source texture
 
         Returns:
-            List of 9 Rect objects for source positions
+            int32 array of shape (9, 4) holding (x, y, width, height) rows
             in order: TL, T, TR, L, C, R, BL, B, BR
         """
-        m = self.metrics
-        sw = source_width
-        sh = source_height
-
-        # Source rectangles (from texture)
-        src_rects = [
-            # Top-Left corner
-            Rect(0, 0, m.left, m.top),
-            # Top edge
-            Rect(m.left, 0, sw - m.left - m.right, m.top),
-            # Top-Right corner
-            Rect(sw - m.right, 0, m.right, m.top),
-            # Left edge
-            Rect(0, m.top, m.left, sh - m.top - m.bottom),
-            # Center
-            Rect(m.left, m.top, sw - m.left - m.right, sh - m.top - m.bottom),
-            # Right edge
-            Rect(sw - m.right, m.top, m.right, sh - m.top - m.bottom),
-            # Bottom-Left corner
-            Rect(0, sh - m.bottom, m.left, m.bottom),
-            # Bottom edge
-            Rect(m.left, sh - m.bottom, sw - m.left - m.right, m.bottom),
-            # Bottom-Right corner
-            Rect(sw - m.right, sh - m.bottom, m.right, m.bottom),
-        ]
+        return _patch_layout(self.metrics, 0, 0, source_width, source_height)
+
+    def get_patch_rects(
+        self, source_width: int, source_height: int
+    ) -> tuple[Rect, ...]:
+        """Calculate source rectangles for each patch.
 
+        Args:
+            source_width: Width of the source texture
+            source_height: Height of the source texture
+
+        Returns:
+            Tuple of 9 Rect objects for source positions
+            in order: TL, T, TR, L, C, R, BL, B, BR
+        """
+        key = (self.metrics, source_width, source_height)
+        cached = self._patch_cache.get(key)
+        if cached is not None:
+            return cached
+
+        layout = self.get_patch_rects_np(source_width, source_height)
+        src_rects = tuple(Rect(*row) for row in layout.tolist())
+        self._patch_cache[key] = src_rects
         return src_rects
 
-    def get_dest_rects(self, x: int, y: int, width: int, height: int) -> list[Rect]:
-        """Calculate destination rectangles for rendering.
+    def get_dest_rects_np(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Calculate destination rectangles for rendering as an array.
+
+        Suited to batched renderers that upload many nine-patches at once.
 
         Args:
             x: X position to render at
             y: Y position to render at
-            width: Width to render at (must be >= min_width)
-            height: Height to render at (must be >= min_height)
+            width: Width to render at (clamped to the minimum width)
+            height: Height to render at (clamped to the minimum height)
 
         Returns:
-            List of 9 Rect objects for destination positions
+            int32 array of shape (9, 4) holding (x, y, width, height) rows
             in order: TL, T, TR, L, C, R, BL, B, BR
         """
-        m = self.metrics
-
         # Ensure we don't render smaller than minimum
         min_size = self.get_min_size()
         width = max(width, int(min_size.x))
         height = max(height, int(min_size.y))
+        return _patch_layout(self.metrics, x, y, width, height)
+
+    def get_dest_rects(
+        self, x: int, y: int, width: int, height: int
+    ) -> tuple[Rect, ...]:
+        """Calculate destination rectangles for rendering.
 
-        # Calculate stretched dimensions
-        center_width = width - m.left - m.right
-        center_height = height - m.top - m.bottom
-
-        # Destination rectangles (where to draw)
-        dest_rects = [
-            # Top-Left corner
-            Rect(x, y, m.left, m.top),
-            # Top edge (stretch horizontally)
-            Rect(x + m.left, y, center_width, m.top),
-            # Top-Right corner
-            Rect(x + width - m.right, y, m.right, m.top),
-            # Left edge (stretch vertically)
-            Rect(x, y + m.top, m.left, center_height),
-            # Center (stretch both directions)
-            Rect(x + m.left, y + m.top, center_width, center_height),
-            # Right edge (stretch vertically)
-            Rect(x + width - m.right, y + m.top, m.right, center_height),
-            # Bottom-Left corner
-            Rect(x, y + height - m.bottom, m.left, m.bottom),
-            # Bottom edge (stretch horizontally)
-            Rect(x + m.left, y + height - m.bottom, center_width, m.bottom),
-            # Bottom-Right corner
-            Rect(x + width - m.right, y + height - m.bottom, m.right, m.bottom),
-        ]
+        Args:
+            x: X position to render at
+            y: Y position to render at
+            width: Width to render at (must be >= min_width)
+            height: Height to render at (must be >= min_height)
 
+        Returns:
+            Tuple of 9 Rect objects for destination positions
+            in order: TL, T, TR, L, C, R, BL, B, BR
+        """
+        key = (self.metrics, self.min_size, x, y, width, height)
+        cached = self._dest_cache.get(key)
+        if cached is not None:
+            return cached
+
+        layout = self.get_dest_rects_np(x, y, width, height)
+        dest_rects = tuple(Rect(*row) for row in layout.tolist())
+        if len(self._dest_cache) >= _DEST_CACHE_SIZE:
+            self._dest_cache.clear()
+        self._dest_cache[key] = dest_rects
         return dest_rects
 
 
+def _patch_layout(
+    m: NinePatchMetrics, x: int, y: int, width: int, height: int
+) -> np.ndarray:
+    """Split a rectangle into the 9 patches described by ``m``.
+
+    Corners keep their edge sizes; the middle column and row take up
+    whatever remains of ``width`` and ``height``.
+
+    Args:
+        m: Nine-patch metrics
+        x: Left of the rectangle
+        y: Top of the rectangle
+        width: Rectangle width
+        height: Rectangle height
+
+    Returns:
+        int32 array of shape (9, 4), rows ordered TL, T, TR, L, C, R, BL, B, BR
+    """
+    cols = np.array([x, x + m.left, x + width - m.right], dtype=np.int32)
+    rows = np.array([y, y + m.top, y + height - m.bottom], dtype=np.int32)
+    widths = np.array([m.left, width - m.min_w, m.right], dtype=np.int32)
+    heights = np.array([m.top, height - m.min_h, m.bottom], dtype=np.int32)
+
+    layout = np.empty((9, 4), dtype=np.int32)
+    layout[:, 0] = np.tile(cols, 3)
+    layout[:, 1] = np.repeat(rows, 3)
+    layout[:, 2] = np.tile(widths, 3)
+    layout[:, 3] = np.repeat(heights, 3)
+    return layout
+
+
 def render_ninepatch(
     renderer: UIRenderer,
     ninepatch: NinePatchSprite,
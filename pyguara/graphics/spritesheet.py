@@ -10,6 +10,7 @@ and a TextureFactory protocol for creating backend-specific textures.
 
 from typing import List
 
+import numpy as np
 from PIL import Image
 
 from pyguara.resources.types import Texture
@@ -70,6 +71,34 @@ class SpriteSheet:
         instance._image = image.convert("RGBA")
         return instance
 
+    @classmethod
+    def from_array(
+        cls, array: np.ndarray, factory: TextureFactory, name: str = "sprite_sheet"
+    ) -> "SpriteSheet":
+        """Create a SpriteSheet from an RGBA pixel array.
+
+        The array is wrapped without encoding, so sheets generated
+        procedurally (or in tests) skip the per-pixel PIL path entirely.
+
+        Args:
+            array: A ``(height, width, 4)`` uint8 array of RGBA pixels.
+            factory: Factory for creating backend-specific textures.
+            name: Identifier for the sprite sheet (used in frame names).
+
+        Returns:
+            A new SpriteSheet instance.
+
+        Raises:
+            ValueError: If the array is not a ``(height, width, 4)`` uint8 array.
+        """
+        if array.dtype != np.uint8 or array.ndim != 3 or array.shape[2] != 4:
+            raise ValueError(
+                f"Expected a (height, width, 4) uint8 array, got "
+                f"{array.shape} {array.dtype}"
+            )
+        array = np.ascontiguousarray(array)
+        return cls.from_image(Image.fromarray(array), factory, name)
+
     @property
     def width(self) -> int:
         """Get the width of the sprite sheet in pixels."""
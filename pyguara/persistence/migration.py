@@ -8,10 +8,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+MigrateFn = Callable[[Dict[str, Any]], Dict[str, Any]]
+
 
 @dataclass
 class Migration:
@@ -46,9 +48,13 @@ class Migration:
         Returns:
             Migrated data dictionary.
         """
+        # Lazy %-formatting: this runs once per step per record during bulk
+        # upgrades, so skip building the message when debug is disabled.
         logger.debug(
-            f"Applying migration v{self.from_version} -> v{self.to_version}: "
-            f"{self.description}"
+            "Applying migration v%d -> v%d: %s",
+            self.from_version,
+            self.to_version,
+            self.description,
         )
         return self.migrate_fn(data)
 
@@ -70,7 +76,12 @@ class MigrationManager:
             current_version: The current schema version.
         """
         self.current_version = current_version
-        self._migrations: Dict[int, Migration] = {}  # from_version -> Migration
+        # Keyed by from_version. A dict rather than a list: versions may be
+        # sparse or large (e.g. date-style 20240101) or negative.
+        self._migrations: Dict[int, Migration] = {}
+        # (from_version, current_version) -> resolved chain; reset on register()
+        self._path_cache: Dict[Tuple[int, int], Tuple[Migration, ...]] = {}
+        self._compiled: Dict[Tuple[int, int], MigrateFn] = {}
 
     def register(self, migration: Migration) -> None:
         """Register a migration.
@@ -79,7 +90,7 @@ class MigrationManager:
             migration: The migration to register.
 
         Raises:
-            ValueError: If a migration from this version already exists.
+            ValueError: If migration from this version already exists.
         """
         if migration.from_version in self._migrations:
             raise ValueError(
@@ -93,6 +104,8 @@ class MigrationManager:
             )
 
         self._migrations[migration.from_version] = migration
+        self._path_cache.clear()
+        self._compiled.clear()
         logger.info(
             f"Registered migration v{migration.from_version} -> "
             f"v{migration.to_version}: {migration.description}"
@@ -110,29 +123,44 @@ class MigrationManager:
         Raises:
             ValueError: If no migration path exists.
         """
-        if from_version >= self.current_version:
-            return []
+        return list(self._resolve_path(from_version))
+
+    def _resolve_path(self, from_version: int) -> Tuple[Migration, ...]:
+        """Resolve the migration chain, reusing previously computed chains.
+
+        Raises:
+            ValueError: If no migration path exists.
+        """
+        key = (from_version, self.current_version)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            return cached
 
         path: List[Migration] = []
         version = from_version
 
         while version < self.current_version:
-            if version not in self._migrations:
+            migration = self._migrations.get(version)
+            if migration is None:
                 raise ValueError(
                     f"No migration registered from version {version}. "
                     f"Cannot migrate from v{from_version} to v{self.current_version}"
                 )
 
-            migration = self._migrations[version]
             path.append(migration)
             version = migration.to_version
 
-        return path
+        resolved = tuple(path)
+        self._path_cache[key] = resolved
+        return resolved
 
     def migrate(self, data: Dict[str, Any], from_version: int) -> Dict[str, Any]:
         """Migrate data from a historical version to current.
 
-        Applies all necessary migrations in sequence.
+        Applies all necessary migrations in sequence. The dictionary is
+        threaded through the chain without copying: each migration receives
+        whatever the previous one returned, so steps may mutate ``data`` in
+        place.
 
         Args:
             data: The data dictionary to migrate.
@@ -155,7 +183,7 @@ class MigrationManager:
                 f"({self.current_version}). Downgrade migrations not supported."
             )
 
-        path = self.get_migration_path(from_version)
+        path = self._resolve_path(from_version)
 
         logger.info(
             f"Migrating data from v{from_version} to v{self.current_version} "
@@ -175,6 +203,89 @@ class MigrationManager:
         logger.info(f"Migration complete: v{from_version} -> v{self.current_version}")
         return result
 
+    def compile(self, from_version: int) -> MigrateFn:
+        """Compose the migration chain from a version into a single function.
+
+        The chain is resolved once and its functions are captured in a
+        tuple, so applying it skips path lookup and Migration dispatch. The
+        composed function is cached until the next register() call.
+
+        Args:
+            from_version: Starting schema version.
+
+        Returns:
+            A function that migrates one record to current_version. Failures
+            propagate unwrapped.
+
+        Raises:
+            ValueError: If no migration path exists.
+        """
+        key = (from_version, self.current_version)
+        composed = self._compiled.get(key)
+        if composed is not None:
+            return composed
+
+        fns = tuple(m.migrate_fn for m in self._resolve_path(from_version))
+
+        def composed_fn(data: Dict[str, Any]) -> Dict[str, Any]:
+            for fn in fns:
+                data = fn(data)
+            return data
+
+        self._compiled[key] = composed_fn
+        return composed_fn
+
+    def migrate_many(
+        self, items: Iterable[Dict[str, Any]], from_version: int
+    ) -> List[Dict[str, Any]]:
+        """Migrate a batch of records that share the same schema version.
+
+        The migration chain is compiled once for the whole batch (see
+        compile()) and each record is passed straight through it, with the
+        same in-place contract as migrate().
+
+        Args:
+            items: The data dictionaries to migrate.
+            from_version: The schema version of every item.
+
+        Returns:
+            Migrated data dictionaries, in input order.
+
+        Raises:
+            ValueError: If no migration path exists.
+            MigrationError: If any migration fails; the message names the
+                index of the failing record.
+        """
+        if from_version > self.current_version:
+            raise ValueError(
+                f"Data version ({from_version}) is newer than current version "
+                f"({self.current_version}). Downgrade migrations not supported."
+            )
+
+        path = self._resolve_path(from_version)
+        composed = self.compile(from_version)
+
+        # Only the migration call is guarded: errors raised while iterating
+        # ``items`` belong to the caller and propagate unwrapped.
+        results = []
+        for index, data in enumerate(items):
+            try:
+                results.append(composed(data))
+            except Exception as e:
+                raise MigrationError(
+                    f"Migration v{from_version} -> v{self.current_version} "
+                    f"failed on record {index}: {e}"
+                ) from e
+
+        if path:
+            logger.info(
+                "Migrated %d records from v%d to v%d",
+                len(results),
+                from_version,
+                self.current_version,
+            )
+        return results
+
     def needs_migration(self, from_version: int) -> bool:
         """Check if data needs migration.
 
@@ -1,76 +1,188 @@
 """Serialization logic for converting objects to storage formats."""
 
 import json
+import math
 import pickle
 import dataclasses
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Optional, Dict
+
+import msgpack
 
 from pyguara.persistence.types import SerializationFormat
 from pyguara.common.types import Vector2, Color, Rect
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
+
 # --- Pre-processing for JSON ---
 
 
+def _encode_vector2(o: Vector2) -> Dict[str, Any]:
+    return {"__type__": "Vector2", "x": o.x, "y": o.y}
+
+
+def _encode_color(o: Color) -> Dict[str, Any]:
+    return {"__type__": "Color", "r": o.r, "g": o.g, "b": o.b, "a": o.a}
+
+
+def _encode_rect(o: Rect) -> Dict[str, Any]:
+    return {"__type__": "Rect", "x": o.x, "y": o.y, "w": o.width, "h": o.height}
+
+
+# Exact-type dispatch; subclasses fall through to the isinstance checks
+_ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    Vector2: _encode_vector2,
+    Color: _encode_color,
+    Rect: _encode_rect,
+}
+
+_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+_PASSTHROUGH = (str, int, float, bytes, bytearray, memoryview)
+
+# Field names per dataclass type, resolved on first use
+_DATACLASS_FIELDS: Dict[type, tuple[str, ...]] = {}
+
+
 def prepare_for_json(o: Any) -> Any:
     """
     Recursively convert game objects into JSON-friendly dicts.
 
     This bypasses json.dumps treating iterables (Vector2) as lists,
     and avoids dataclasses.asdict() deepcopy issues with C-types.
+
+    Raises:
+        TypeError: If a value has no JSON-friendly form.
     """
+    cls = type(o)
+    if cls in _PRIMITIVES:
+        return o
+
     # 1. Engine Types
+    encoder = _ENCODERS.get(cls)
+    if encoder is not None:
+        return encoder(o)
+
     if isinstance(o, Vector2):
-        return {"__type__": "Vector2", "x": o.x, "y": o.y}
+        return _encode_vector2(o)
 
     if isinstance(o, Color):
-        return {"__type__": "Color", "r": o.r, "g": o.g, "b": o.b, "a": o.a}
+        return _encode_color(o)
 
     if isinstance(o, Rect):
-        return {"__type__": "Rect", "x": o.x, "y": o.y, "w": o.width, "h": o.height}
+        return _encode_rect(o)
 
     # 2. Dataclasses (Components)
     if dataclasses.is_dataclass(o):
-        data = {}
-        # Manually iterate fields to avoid deepcopy issues in asdict
-        for field in dataclasses.fields(o):
-            value = getattr(o, field.name)
-            data[field.name] = prepare_for_json(value)
+        names = _DATACLASS_FIELDS.get(cls)
+        if names is None:
+            names = tuple(field.name for field in dataclasses.fields(o))
+            _DATACLASS_FIELDS[cls] = names
 
-        if hasattr(o, "__class__"):
-            data["__type__"] = o.__class__.__name__
+        # Manually iterate fields to avoid deepcopy issues in asdict
+        data = {name: prepare_for_json(getattr(o, name)) for name in names}
+        data["__type__"] = cls.__name__
         return data
 
     # 3. Containers
-    if isinstance(o, list):
+    if isinstance(o, (list, tuple)):
         return [prepare_for_json(i) for i in o]
 
     if isinstance(o, dict):
         return {k: prepare_for_json(v) for k, v in o.items()}
 
-    # 4. Primitives
-    return o
+    # 4. Primitive subclasses (IntEnum, StrEnum, ...) and raw bytes for msgpack
+    if isinstance(o, _PASSTHROUGH):
+        return o
+
+    # Reject the rest here rather than in the encoder: orjson would accept
+    # plain Enums, datetimes and UUIDs that the stdlib and msgpack refuse,
+    # so the output would depend on which backend is installed.
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
 
 
 # --- Custom Decoders ---
 
+_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "Vector2": lambda d: Vector2(d["x"], d["y"]),
+    "Color": lambda d: Color(d["r"], d["g"], d["b"], d.get("a", 255)),
+    "Rect": lambda d: Rect(d["x"], d["y"], d["w"], d["h"]),
+}
+
 
 def game_object_hook(dct: Dict[str, Any]) -> Any:
     """Hook to convert JSON dicts back to Objects."""
-    if "__type__" in dct:
-        t = dct["__type__"]
+    t = dct.get("__type__")
+    if isinstance(t, str):
+        decoder = _DECODERS.get(t)
+        if decoder is not None:
+            return decoder(dct)
+
+    # Dataclass reconstruction happens here if we have a registry.
+    # For now, we leave it as a dict with metadata, letting the loader
+    # instantiate the specific Component class.
+    return dct
 
-        if t == "Vector2":
-            return Vector2(dct["x"], dct["y"])
-        if t == "Color":
-            return Color(dct["r"], dct["g"], dct["b"], dct.get("a", 255))
-        if t == "Rect":
-            return Rect(dct["x"], dct["y"], dct["w"], dct["h"])
 
-        # Dataclass reconstruction happens here if we have a registry.
-        # For now, we leave it as a dict with metadata, letting the loader
-        # instantiate the specific Component class.
+def _restore_objects(o: Any) -> Any:
+    """Apply game_object_hook bottom-up, as json.loads(object_hook=...) does."""
+    if isinstance(o, dict):
+        for k, v in o.items():
+            if isinstance(v, (dict, list)):
+                o[k] = _restore_objects(v)
+        return game_object_hook(o)
 
-    return dct
+    if isinstance(o, list):
+        for i, v in enumerate(o):
+            if isinstance(v, (dict, list)):
+                o[i] = _restore_objects(v)
+
+    return o
+
+
+def _has_non_finite(o: Any) -> bool:
+    """Check a prepared JSON tree for NaN or infinite floats."""
+    if isinstance(o, float):
+        return not math.isfinite(o)
+    if isinstance(o, dict):
+        return any(_has_non_finite(v) for v in o.values())
+    if isinstance(o, list):
+        return any(_has_non_finite(v) for v in o)
+    return False
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize prepared data to indented JSON bytes, via orjson if available."""
+    if HAS_ORJSON:
+        try:
+            encoded: bytes = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Ints beyond 64 bits and the like; let the stdlib handle or
+            # reject them with its usual error
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; only then is a walk needed
+            # to tell them apart from real None values
+            if b"null" not in encoded or not _has_non_finite(data):
+                return encoded
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Parse JSON bytes back into game objects, via orjson if available."""
+    if HAS_ORJSON:
+        try:
+            return _restore_objects(orjson.loads(raw))
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, which the stdlib writes and accepts
+            pass
+    return json.loads(raw.decode("utf-8"), object_hook=game_object_hook)
 
 
 class Serializer:
@@ -88,8 +200,11 @@ class Serializer:
 
         if fmt == SerializationFormat.JSON:
             # Pre-process the data tree
-            clean_data = prepare_for_json(data)
-            return json.dumps(clean_data, indent=2).encode("utf-8")
+            return _encode_json(prepare_for_json(data))
+
+        elif fmt == SerializationFormat.MSGPACK:
+            packed: bytes = msgpack.packb(prepare_for_json(data))
+            return packed
 
         elif fmt == SerializationFormat.BINARY:
             return pickle.dumps(data)
@@ -102,7 +217,12 @@ class Serializer:
         fmt = format_type or self.default_format
 
         if fmt == SerializationFormat.JSON:
-            return json.loads(data.decode("utf-8"), object_hook=game_object_hook)
+            return _decode_json(data)
+
+        elif fmt == SerializationFormat.MSGPACK:
+            return msgpack.unpackb(
+                data, object_hook=game_object_hook, strict_map_key=False
+            )
 
         elif fmt == SerializationFormat.BINARY:
             return pickle.loads(data)
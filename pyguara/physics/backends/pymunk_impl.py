@@ -102,12 +102,7 @@ class PymunkEngine(IPhysicsEngine):
             try:
                 # Explicitly remove everything to ensure internal iterators don't run
                 # during garbage collection
-                if self.space.constraints:
-                    self.space.remove(*self.space.constraints)
-                if self.space.shapes:
-                    self.space.remove(*self.space.shapes)
-                if self.space.bodies:
-                    self.space.remove(*self.space.bodies)
+                self.clear_world()
             except Exception:
                 # Ignore errors during object removal
                 pass
@@ -116,6 +111,21 @@ class PymunkEngine(IPhysicsEngine):
             self._bodies.clear()
             self._collision_system = None
 
+    def clear_world(self) -> None:
+        """Remove every joint, shape and body while keeping the space.
+
+        Gravity and collision handlers stay in place, so the engine can be
+        reused for a fresh scene without paying for a new Space.
+        """
+        if self.space:
+            if self.space.constraints:
+                self.space.remove(*self.space.constraints)
+            if self.space.shapes:
+                self.space.remove(*self.space.shapes)
+            if self.space.bodies:
+                self.space.remove(*self.space.bodies)
+        self._bodies.clear()
+
     def set_collision_system(self, collision_system: Any) -> None:
         """Register the CollisionSystem for event routing.
 
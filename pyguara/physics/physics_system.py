@@ -1,12 +1,14 @@
 """System responsible for syncing ECS entities with the Physics Engine."""
 
+from typing import cast
+
 from pyguara.common.components import Transform
 from pyguara.common.types import Vector2
 from pyguara.ecs.entity import Entity
 from pyguara.ecs.manager import EntityManager
 from pyguara.events.dispatcher import EventDispatcher
 from pyguara.physics.components import Collider, RigidBody
-from pyguara.physics.protocols import IPhysicsEngine
+from pyguara.physics.protocols import IPhysicsBody, IPhysicsEngine
 from pyguara.physics.types import BodyType
 
 
@@ -57,41 +59,45 @@ class PhysicsSystem:
         Note:
             P2-013: Refactored to Pull pattern. System queries entities internally.
         """
-        # Query physics entities (Pull pattern)
-        entities = list(self._entity_manager.get_entities_with(Transform, RigidBody))
+        # Query physics entities (Pull pattern). The tuple query hands back the
+        # components directly, so no per-entity get_component lookups are
+        # needed, and dynamic bodies are collected for the write-back pass.
+        dynamic_rows: list[tuple[Transform, IPhysicsBody]] = []
 
         # 1. Sync ECS -> Physics Engine
-        for entity in entities:
-            # OPTIMIZATION: Use get_component instead of attribute access
-            transform = entity.get_component(Transform)
-            rb = entity.get_component(RigidBody)
+        for entity, components in self._entity_manager.get_components_with_entity(
+            Transform, RigidBody
+        ):
+            transform = cast(Transform, components[0])
+            rb = cast(RigidBody, components[1])
 
             # If the body hasn't been created in the engine yet, create it
             # FIX: Check backing field directly
             if rb._body_handle is None:
                 self._create_physics_entity(entity, transform, rb)
 
+            handle = rb._body_handle
+            if not handle:
+                continue
+
             # Sync Transform -> Physics (Kinematic or manual overrides)
             # If we move a kinematic body in game, we must update physics engine
-            # FIX: Use backing field
-            if rb.body_type == BodyType.KINEMATIC and rb._body_handle:
-                rb._body_handle.position = transform.position
-                rb._body_handle.rotation = transform.rotation
+            body_type = rb.body_type
+            if body_type == BodyType.KINEMATIC:
+                handle.position = transform.position
+                handle.rotation = transform.rotation
+            elif body_type == BodyType.DYNAMIC:
+                dynamic_rows.append((transform, handle))
 
         # 2. Step the Simulation
         # FIX: Protocol defines this as 'update', not 'step'
         self._engine.update(dt)
 
         # 3. Sync Physics Engine -> ECS
-        for entity in entities:
-            transform = entity.get_component(Transform)
-            rb = entity.get_component(RigidBody)
-
-            # If physics moved the object, update the game transform
-            # FIX: Use backing field
-            if rb._body_handle and rb.body_type == BodyType.DYNAMIC:
-                transform.position = rb._body_handle.position
-                transform.rotation = rb._body_handle.rotation
+        # If physics moved the object, update the game transform
+        for transform, handle in dynamic_rows:
+            transform.position = handle.position
+            transform.rotation = handle.rotation
 
     def _create_physics_entity(
         self, entity: Entity, transform: Transform, rb: RigidBody
@@ -42,7 +42,7 @@ class PlatformerState(Enum):
     WALL_SLIDE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformerController(BaseComponent):
     """Component for 2D platformer character movement.
 
@@ -129,7 +129,8 @@ class PlatformerController(BaseComponent):
 
     def __post_init__(self) -> None:
         """Initialize base component state."""
-        super().__init__()
+        # slots=True rebuilds the class, which breaks zero-argument super()
+        BaseComponent.__init__(self)
 
     def move_left(self) -> None:
         """Move character left.
@@ -104,8 +104,26 @@ class PrefabLoader(IResourceLoader):
         else:
             raise ValueError(f"Unsupported prefab format: {suffix}")
 
-        # Parse into PrefabData
-        prefab_data = self._parse_prefab_data(raw_data, path)
+        # Use filename as name if not specified
+        return self.load_dict(raw_data, name=file_path.stem, path=path)
+
+    def load_dict(
+        self, data: Dict[str, Any], name: Optional[str] = None, path: str = ""
+    ) -> Prefab:
+        """Build a prefab from already-parsed data, without touching disk.
+
+        Args:
+            data: Raw prefab dictionary, as it would appear in a prefab file.
+            name: Name to use if the data does not specify one.
+            path: Identifier for the resulting resource (empty for in-memory).
+
+        Returns:
+            Prefab resource containing the parsed data.
+
+        Raises:
+            ValueError: If neither the data nor ``name`` provide a name.
+        """
+        prefab_data = self._parse_prefab_data(data, name)
         return Prefab(prefab_data, path)
 
     def _load_json(self, path: Path) -> Dict[str, Any]:
@@ -138,12 +156,14 @@ class PrefabLoader(IResourceLoader):
         result = json.loads(content)
         return result
 
-    def _parse_prefab_data(self, raw: Dict[str, Any], source_path: str) -> PrefabData:
+    def _parse_prefab_data(
+        self, raw: Dict[str, Any], default_name: Optional[str]
+    ) -> PrefabData:
         """Parse raw dictionary into PrefabData.
 
         Args:
-            raw: Raw data from file.
-            source_path: Source file path for error messages.
+            raw: Raw prefab data.
+            default_name: Name to use when the data has none.
 
         Returns:
             Parsed PrefabData.
@@ -152,10 +172,9 @@ class PrefabLoader(IResourceLoader):
             ValueError: If required fields are missing.
         """
         # Required field
-        name = raw.get("name")
+        name = raw.get("name") or default_name
         if not name:
-            # Use filename as name if not specified
-            name = Path(source_path).stem
+            raise ValueError("Prefab data has no 'name' and no default was given")
 
         # Optional fields with defaults
         version = raw.get("version", 1)
@@ -241,6 +260,18 @@ class PrefabCache:
             logger.error(f"Failed to load prefab '{path}': {e}")
             return None
 
+    def put(self, path: str, data: PrefabData) -> None:
+        """Cache prefab data under a path without reading any file.
+
+        Useful for prefabs built in memory (e.g. editor previews) that
+        other prefabs extend by path.
+
+        Args:
+            path: Path the prefab is resolved by.
+            data: Prefab data to cache.
+        """
+        self._cache[path] = data
+
     def get(self, path: str) -> Optional[PrefabData]:
         """Get a cached prefab without loading.
 
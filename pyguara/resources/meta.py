@@ -27,15 +27,62 @@ Example:
 
 import json
 import logging
+import math
+import os
+import sys
 from abc import ABC
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any, Type, TypeVar
+from typing import Optional, Dict, Any, Set, Type, TypeVar
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, which the stdlib writes and accepts
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite(o: Any) -> bool:
+    """Check a JSON-ready value for NaN or infinite floats."""
+    if isinstance(o, float):
+        return not math.isfinite(o)
+    if isinstance(o, dict):
+        return any(_has_non_finite(v) for v in o.values())
+    if isinstance(o, (list, tuple)):
+        return any(_has_non_finite(v) for v in o)
+    return False
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a meta dictionary to indented JSON bytes."""
+    # orjson would write NaN/Infinity as null; meta dicts are small, so
+    # checking first is cheap
+    if HAS_ORJSON and not _has_non_finite(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 class TextureFilter(Enum):
     """Texture filtering mode for scaling."""
 
@@ -50,7 +97,7 @@ class AudioLoadMode(Enum):
     STREAM = "stream"  # Stream from disk (Music)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetMeta(ABC):
     """Base class for asset import metadata.
 
@@ -70,7 +117,7 @@ class AssetMeta(ABC):
         return cls.__name__.replace("Meta", "").lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class TextureMeta(AssetMeta):
     """Import settings for texture assets.
 
@@ -95,7 +142,7 @@ class TextureMeta(AssetMeta):
         return TextureFilter(self.filter)
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioMeta(AssetMeta):
     """Import settings for audio assets.
 
@@ -123,7 +170,7 @@ class AudioMeta(AssetMeta):
         return 10 ** (self.volume_db / 20.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpritesheetMeta(AssetMeta):
     """Import settings for spritesheet assets.
 
@@ -169,9 +216,19 @@ M = TypeVar("M", bound=AssetMeta)
 class MetaLoader:
     """Loads and manages asset metadata from `.meta` files."""
 
-    def __init__(self) -> None:
-        """Initialize the meta loader."""
-        self._cache: Dict[str, AssetMeta] = {}
+    def __init__(self, max_cache_size: int = 1024) -> None:
+        """Initialize the meta loader.
+
+        Args:
+            max_cache_size: Maximum number of cached entries. The least
+                recently used entry is evicted once the limit is exceeded.
+        """
+        self._max_cache_size = max_cache_size
+        # LRU order, oldest first. Missing meta files are cached as None so
+        # repeated misses skip the filesystem.
+        self._cache: OrderedDict[str, Optional[AssetMeta]] = OrderedDict()
+        # Directory -> names of `.meta` files found by prime_directory()
+        self._dir_index: Dict[str, Set[str]] = {}
 
     def get_meta_path(self, asset_path: str) -> Path:
         """Get the `.meta` file path for an asset.
@@ -182,7 +239,7 @@ class MetaLoader:
         Returns:
             Path to the corresponding `.meta` file.
         """
-        return Path(f"{asset_path}.meta")
+        return Path(asset_path + ".meta")
 
     def has_meta(self, asset_path: str) -> bool:
         """Check if an asset has a `.meta` file.
@@ -192,8 +249,71 @@ class MetaLoader:
 
         Returns:
             True if a `.meta` file exists.
+
+        Note:
+            To load a meta file, call load_meta() directly instead of
+            guarding it with has_meta(); it returns None for missing files
+            without a separate existence check.
+        """
+        indexed = self._indexed_meta_exists(asset_path)
+        if indexed is not None:
+            return indexed
+        return os.path.exists(asset_path + ".meta")
+
+    def prime_directory(self, directory: str) -> None:
+        """Index the `.meta` files of a directory with a single listing.
+
+        After priming, existence checks for assets in that directory are
+        answered from memory instead of one filesystem stat per asset.
+
+        Args:
+            directory: Directory containing assets and their `.meta` files.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                names = {e.name for e in entries if e.name.endswith(".meta")}
+        except OSError as e:
+            logger.warning("Failed to scan directory '%s': %s", directory, e)
+            return
+        self._dir_index[os.path.normpath(directory)] = names
+
+    def scan_tree(self, root: str) -> Dict[str, AssetMeta]:
+        """Load every `.meta` file under a directory tree in one walk.
+
+        Each visited directory is primed as in prime_directory(), so later
+        lookups for assets without a meta file need no filesystem access,
+        and every parsed meta is cached.
+
+        Args:
+            root: Root directory of the asset tree.
+
+        Returns:
+            Mapping of asset path to its loaded meta. Invalid meta files are
+            logged and left out.
         """
-        return self.get_meta_path(asset_path).exists()
+        found: Dict[str, AssetMeta] = {}
+        for dirpath, _dirnames, filenames in os.walk(root):
+            names = {name for name in filenames if name.endswith(".meta")}
+            self._dir_index[os.path.normpath(dirpath)] = names
+            for name in names:
+                asset_path = os.path.join(dirpath, name[: -len(".meta")])
+                meta = self.load_meta(asset_path)
+                if meta is not None:
+                    found[asset_path] = meta
+        return found
+
+    def _indexed_meta_exists(self, asset_path: str) -> Optional[bool]:
+        """Answer existence from a primed directory index.
+
+        Returns:
+            Whether the `.meta` file exists, or None if the asset's directory
+            has not been primed.
+        """
+        directory, name = os.path.split(asset_path)
+        names = self._dir_index.get(os.path.normpath(directory))
+        if names is None:
+            return None
+        return f"{name}.meta" in names
 
     def load_meta(
         self, asset_path: str, expected_type: Optional[Type[M]] = None
@@ -210,17 +330,28 @@ class MetaLoader:
         Returns:
             The loaded AssetMeta, or None if no meta file exists.
         """
+        # Interned keys let repeated lookups for the same path hit the dict's
+        # identity fast path instead of a full string comparison
+        asset_path = sys.intern(asset_path)
+
         # Check cache first
         if asset_path in self._cache:
+            self._cache.move_to_end(asset_path)
             return self._cache[asset_path]
 
-        meta_path = self.get_meta_path(asset_path)
-        if not meta_path.exists():
+        if self._indexed_meta_exists(asset_path) is False:
+            self._cache_put(asset_path, None)
             return None
+        # Plain string path: this is the hot path, so skip Path construction
+        meta_path = asset_path + ".meta"
 
+        # Open directly rather than stat first; a missing file is a cached miss
         try:
-            with open(meta_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(meta_path, "rb") as f:
+                data = _decode_json(f.read())
+        except FileNotFoundError:
+            self._cache_put(asset_path, None)
+            return None
         except json.JSONDecodeError as e:
             logger.warning("Invalid JSON in meta file '%s': %s", meta_path, e.msg)
             return None
@@ -228,24 +359,28 @@ class MetaLoader:
             logger.warning("Failed to read meta file '%s': %s", meta_path, e)
             return None
 
-        # Determine meta type
+        # Determine meta type: explicit "type" field, else the file extension
         type_name = data.pop("type", None)
         if type_name is None:
-            # Infer from file extension
-            ext = Path(asset_path).suffix.lower()
-            type_name = EXTENSION_TO_META_TYPE.get(ext)
-
-        if type_name is None:
-            logger.warning(
-                "Cannot determine meta type for '%s' - no 'type' field and unknown extension",
-                asset_path,
+            ext = os.path.splitext(asset_path)[1].lower()
+            # Resolved per call so extensions registered at runtime apply
+            meta_class = META_TYPES.get(EXTENSION_TO_META_TYPE.get(ext, ""))
+            if meta_class is None:
+                logger.warning(
+                    "Cannot determine meta type for '%s' - no 'type' field and unknown extension",
+                    asset_path,
+                )
+                return None
+            type_name = meta_class.get_type_name()
+        else:
+            # Reject non-string values up front: JSON lists/objects are
+            # unhashable and would raise inside the registry lookup
+            meta_class = (
+                META_TYPES.get(type_name) if isinstance(type_name, str) else None
             )
-            return None
-
-        meta_class = META_TYPES.get(type_name)
-        if meta_class is None:
-            logger.warning("Unknown meta type '%s' in '%s'", type_name, meta_path)
-            return None
+            if meta_class is None:
+                logger.warning("Unknown meta type '%s' in '%s'", type_name, meta_path)
+                return None
 
         # Validate expected type if specified
         if expected_type is not None and meta_class != expected_type:
@@ -258,17 +393,18 @@ class MetaLoader:
 
         # Create meta object, ignoring unknown fields
         try:
-            # Filter to only known fields
-            valid_fields = {
-                k: v for k, v in data.items() if k in meta_class.__dataclass_fields__
-            }
-            meta = meta_class(**valid_fields)
+            known = meta_class.__dataclass_fields__
+            if data.keys() <= known.keys():
+                # Common case: the decoded dict is already a valid kwargs map
+                meta = meta_class(**data)
+            else:
+                meta = meta_class(**{k: v for k, v in data.items() if k in known})
         except (TypeError, ValueError) as e:
             logger.warning("Invalid data in meta file '%s': %s", meta_path, e)
             return None
 
         # Cache and return
-        self._cache[asset_path] = meta
+        self._cache_put(asset_path, meta)
         logger.debug("Loaded meta for '%s': %s", asset_path, type_name)
         return meta
 
@@ -294,20 +430,42 @@ class MetaLoader:
             asset_path: Path to the asset file.
             meta: The metadata to save.
 
+        If the file already holds identical content it is left untouched
+        (no write, no mtime change). Otherwise the new content is written to
+        a temporary file and moved into place, so readers never observe a
+        partially written meta file.
+
         Returns:
             True if saved successfully, False otherwise.
         """
-        meta_path = self.get_meta_path(asset_path)
+        asset_path = sys.intern(asset_path)
+        meta_path = asset_path + ".meta"
 
         try:
             data = meta.to_dict()
             data["type"] = meta.get_type_name()
-
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            encoded = _encode_json(data)
+
+            try:
+                with open(meta_path, "rb") as f:
+                    unchanged = f.read() == encoded
+            except FileNotFoundError:
+                unchanged = False
+
+            if not unchanged:
+                tmp_path = meta_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp_path, meta_path)
+
+            # Keep a primed directory index in sync with the new file
+            directory, name = os.path.split(asset_path)
+            names = self._dir_index.get(os.path.normpath(directory))
+            if names is not None:
+                names.add(f"{name}.meta")
 
             # Update cache
-            self._cache[asset_path] = meta
+            self._cache_put(asset_path, meta)
             logger.debug("Saved meta for '%s'", asset_path)
             return True
 
@@ -315,9 +473,17 @@ class MetaLoader:
             logger.error("Failed to save meta file '%s': %s", meta_path, e)
             return False
 
+    def _cache_put(self, asset_path: str, meta: Optional[AssetMeta]) -> None:
+        """Insert or refresh a cache entry, evicting the oldest if over the limit."""
+        self._cache[asset_path] = meta
+        self._cache.move_to_end(asset_path)
+        if len(self._cache) > self._max_cache_size:
+            self._cache.popitem(last=False)
+
     def clear_cache(self) -> None:
-        """Clear the metadata cache."""
+        """Clear the metadata cache and any primed directory indexes."""
         self._cache.clear()
+        self._dir_index.clear()
 
 
 # Global meta loader instance
@@ -1,5 +1,7 @@
 """Entity Inspector tool for ECS debugging."""
 
+import dataclasses
+
 import pygame
 from typing import Optional, Any
 
@@ -134,7 +136,7 @@ class EntityInspector(Tool):
             y += 20
 
             # Inspect Component Data (Primitives only for brevity)
-            for attr, value in component.__dict__.items():
+            for attr, value in self._component_items(component):
                 if attr.startswith("_"):
                     continue
 
@@ -150,6 +152,16 @@ class EntityInspector(Tool):
 
             y += 10  # Spacing between components
 
+    @staticmethod
+    def _component_items(component: Any) -> list[tuple[str, Any]]:
+        """List a component's attributes, including slotted dataclasses."""
+        if dataclasses.is_dataclass(component):
+            return [
+                (f.name, getattr(component, f.name))
+                for f in dataclasses.fields(component)
+            ]
+        return list(getattr(component, "__dict__", {}).items())
+
     def process_event(self, event: Any) -> bool:
         """Handle cycling selection.
 
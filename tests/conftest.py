@@ -1,8 +1,13 @@
 """Pytest configuration and fixtures."""
 
+from typing import Any, Callable, Iterator, List, Tuple
+
 import pytest
+from pyguara.common.types import Vector2
 from pyguara.di.container import DIContainer
 from pyguara.events.dispatcher import EventDispatcher
+from pyguara.input.manager import InputManager
+from pyguara.physics.backends.pymunk_impl import PymunkEngine
 
 
 # Define fake classes for Pygame types to satisfy dataclasses and inheritance
@@ -47,3 +52,46 @@ def container():
 def event_dispatcher():
     """Provide an event dispatcher."""
     return EventDispatcher()
+
+
+@pytest.fixture
+def collector() -> Callable[[], Tuple[List[Any], Callable[[Any], None]]]:
+    """Provide a factory for event sinks.
+
+    Each call returns a fresh list and its bound ``append`` method, which can
+    be subscribed directly as a handler instead of wrapping it in a lambda.
+    """
+
+    def make() -> Tuple[List[Any], Callable[[Any], None]]:
+        items: List[Any] = []
+        return items, items.append
+
+    return make
+
+
+@pytest.fixture
+def input_manager(event_dispatcher):
+    """Provide an input manager bound to the test's event dispatcher."""
+    return InputManager(event_dispatcher)
+
+
+@pytest.fixture(scope="session")
+def pymunk_engine() -> Iterator[PymunkEngine]:
+    """One initialized pymunk engine shared by the whole test session.
+
+    Prefer ``pymunk_world``, which empties the space after each test; use
+    this directly only from fixtures that manage their own teardown.
+    """
+    engine = PymunkEngine()
+    engine.initialize(Vector2(0, 0))
+    yield engine
+    engine.cleanup()
+
+
+@pytest.fixture
+def pymunk_world(pymunk_engine: PymunkEngine) -> Iterator[PymunkEngine]:
+    """Provide the shared pymunk engine with an empty, gravity-free space."""
+    yield pymunk_engine
+    pymunk_engine.clear_world()
+    if pymunk_engine.space is not None:
+        pymunk_engine.space.gravity = (0, 0)
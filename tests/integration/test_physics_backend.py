@@ -2,7 +2,13 @@
 
 from pyguara.common.types import Vector2
 from pyguara.physics.backends.pymunk_impl import PymunkEngine
-from pyguara.physics.types import BodyType
+from pyguara.physics.types import (
+    BodyType,
+    CollisionLayer,
+    JointType,
+    PhysicsMaterial,
+    ShapeType,
+)
 
 
 def test_pymunk_engine_initialization():
@@ -35,10 +41,9 @@ def test_pymunk_engine_collision_handlers():
     # but successful execution implies handlers were added via the correct API.
 
 
-def test_pymunk_body_creation():
+def test_pymunk_body_creation(pymunk_world):
     """PymunkEngine should create bodies."""
-    engine = PymunkEngine()
-    engine.initialize(gravity=Vector2(0, 0))
+    engine = pymunk_world
 
     body = engine.create_body("entity1", BodyType.DYNAMIC, Vector2(10, 20))
     # Pymunk requires mass/moment for dynamic bodies
@@ -50,3 +55,40 @@ def test_pymunk_body_creation():
 
     # Update simulation
     engine.update(0.1)
+
+
+def test_pymunk_clear_world_keeps_space(pymunk_world):
+    """clear_world should empty the space but leave it usable."""
+    engine = pymunk_world
+    engine.space.gravity = (0, 980)
+    body_a = engine.create_body("a", BodyType.DYNAMIC, Vector2(0, 0))
+    body_b = engine.create_body("b", BodyType.DYNAMIC, Vector2(10, 0))
+    engine.add_shape(
+        body_a,
+        ShapeType.CIRCLE,
+        [5],
+        Vector2(0, 0),
+        PhysicsMaterial(),
+        CollisionLayer(),
+        False,
+    )
+    engine.create_joint(
+        body_a,
+        body_b,
+        JointType.PIN,
+        Vector2(0, 0),
+        Vector2(0, 0),
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        False,
+    )
+
+    space = engine.space
+    engine.clear_world()
+
+    assert engine.space is space
+    assert space.gravity == (0, 980)
+    assert not space.bodies and not space.shapes and not space.constraints
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import pytest
 
 from pyguara.ecs.manager import EntityManager
-from pyguara.ecs.component import BaseComponent, StrictComponent
+from pyguara.ecs.component import BaseComponent, StrictComponent, component_mask
 from pyguara.ecs.entity import Entity
 
 
@@ -121,6 +121,77 @@ def test_snake_case_conversion() -> None:
     assert Entity._get_snake_name(AIController) == "ai_controller"
 
 
+def test_component_mask_tracks_components() -> None:
+    entity = Entity()
+    pos_bit, health_bit = component_mask(Position), component_mask(Health)
+
+    assert pos_bit != health_bit
+    assert component_mask(Position, Health) == pos_bit | health_bit
+
+    entity.add_component(Position())
+    entity.add_component(Health())
+    assert entity._mask == pos_bit | health_bit
+
+    entity.remove_component(Position)
+    assert entity._mask == health_bit
+
+
+def test_remove_entities_while_querying() -> None:
+    manager = EntityManager()
+    entities = [manager.create_entity() for _ in range(4)]
+    for entity in entities:
+        entity.add_component(Position())
+
+    visited = []
+    for entity in manager.get_entities_with(Position):
+        visited.append(entity.id)
+        manager.remove_entity(entity.id)
+        # Also remove one that has not been yielded yet
+        if entity is entities[0]:
+            manager.remove_entity(entities[2].id)
+
+    assert visited == [entities[0].id, entities[1].id, entities[3].id]
+    assert list(manager.get_entities_with(Position)) == []
+
+
+def test_get_components_reads_from_index() -> None:
+    manager = EntityManager()
+    entity = manager.create_entity()
+    pos, health = Position(1, 2), Health(50)
+    entity.add_component(pos)
+    entity.add_component(health)
+    manager.create_entity().add_component(Health())
+
+    assert list(manager.get_components(Health, Position)) == [(health, pos)]
+
+
+def test_query_results_memoized_until_change() -> None:
+    manager = EntityManager()
+    entity = manager.create_entity()
+    entity.add_component(Position())
+
+    first = manager._query_ids((Position,))
+    assert manager._query_ids((Position,)) is first
+
+    entity.add_component(Health())
+    assert manager._query_ids((Position,)) is not first
+    assert [e.id for e in manager.get_entities_with(Position, Health)] == [entity.id]
+
+    entity.remove_component(Position)
+    assert list(manager.get_entities_with(Position, Health)) == []
+
+
+def test_clear_removes_all_entities() -> None:
+    manager = EntityManager()
+    manager.create_entity().add_component(Position())
+    assert len(list(manager.get_entities_with(Position))) == 1
+
+    manager.clear()
+
+    assert list(manager.get_all_entities()) == []
+    assert list(manager.get_entities_with(Position)) == []
+
+
 # ==================== Component Removal Tests (P0-001) ====================
 
 
@@ -24,91 +24,85 @@ pygame.JOYBUTTONDOWN = 5
 pygame.JOYAXISMOTION = 6
 pygame.K_SPACE = 32
 
+# Hoisted enum members and shared action definitions used across tests.
+_KB = InputDevice.KEYBOARD
+_GP = InputDevice.GAMEPAD
+_CTX_PLAY = InputContext.GAMEPLAY
+_CTX_MENU = InputContext.MENU
+_ACT_JUMP = InputAction("jump", ActionType.PRESS)
 
-def test_input_registration(event_dispatcher: Any) -> None:
-    manager = InputManager(event_dispatcher)
-    # Mock Joystick init
 
+def test_input_registration(input_manager: InputManager) -> None:
     # Manually register an action
-    action = InputAction(name="jump", action_type=ActionType.PRESS)
-    manager._registered_actions["jump"] = action
+    input_manager._registered_actions["jump"] = _ACT_JUMP
 
     # Bind Space -> Jump
-    manager._bindings.bind(
-        InputDevice.KEYBOARD, pygame.K_SPACE, "jump", InputContext.GAMEPLAY
-    )
+    input_manager._bindings.bind(_KB, pygame.K_SPACE, "jump", _CTX_PLAY)
 
     # Verify internal state
-    actions = manager._bindings.get_actions(
-        InputDevice.KEYBOARD, pygame.K_SPACE, InputContext.GAMEPLAY
-    )
+    actions = input_manager._bindings.get_actions(_KB, pygame.K_SPACE, _CTX_PLAY)
     assert "jump" in actions
 
 
-def test_keyboard_event_processing(event_dispatcher: Any) -> None:
-    manager = InputManager(event_dispatcher)
-
+def test_keyboard_event_processing(
+    input_manager: InputManager, event_dispatcher: Any, collector: Any
+) -> None:
     # Register "jump"
-    action = InputAction("jump", ActionType.PRESS)
-    manager._registered_actions["jump"] = action
-    manager._bindings.bind(InputDevice.KEYBOARD, pygame.K_SPACE, "jump")
+    input_manager._registered_actions["jump"] = _ACT_JUMP
+    input_manager._bindings.bind(_KB, pygame.K_SPACE, "jump")
 
     # Spy on events
-    events = []
-    event_dispatcher.subscribe(OnActionEvent, lambda e: events.append(e))
+    events, on_action = collector()
+    event_dispatcher.subscribe(OnActionEvent, on_action)
 
     # Simulate KeyDown
     mock_event = MagicMock()
     mock_event.type = pygame.KEYDOWN
     mock_event.key = pygame.K_SPACE
 
-    manager.process_event(mock_event)
+    input_manager.process_event(mock_event)
 
     assert len(events) == 1
     assert events[0].action_name == "jump"
     assert events[0].value == 1.0
 
 
-def test_context_switching(event_dispatcher: Any) -> None:
-    manager = InputManager(event_dispatcher)
-
+def test_context_switching(
+    input_manager: InputManager, event_dispatcher: Any, collector: Any
+) -> None:
     # Bind same key to different actions in different contexts
-    manager._registered_actions["jump"] = InputAction("jump")
-    manager._registered_actions["select"] = InputAction("select")
+    input_manager._registered_actions["jump"] = InputAction("jump")
+    input_manager._registered_actions["select"] = InputAction("select")
 
-    manager._bindings.bind(
-        InputDevice.KEYBOARD, pygame.K_SPACE, "jump", InputContext.GAMEPLAY
-    )
-    manager._bindings.bind(
-        InputDevice.KEYBOARD, pygame.K_SPACE, "select", InputContext.MENU
-    )
+    input_manager._bindings.bind(_KB, pygame.K_SPACE, "jump", _CTX_PLAY)
+    input_manager._bindings.bind(_KB, pygame.K_SPACE, "select", _CTX_MENU)
 
-    events = []
-    event_dispatcher.subscribe(OnActionEvent, lambda e: events.append(e.action_name))
+    events, on_action = collector()
+    event_dispatcher.subscribe(OnActionEvent, on_action)
 
     mock_event = MagicMock()
     mock_event.type = pygame.KEYDOWN
     mock_event.key = pygame.K_SPACE
 
     # Default is GAMEPLAY
-    manager.process_event(mock_event)
-    assert events[-1] == "jump"
+    input_manager.process_event(mock_event)
+    assert events[-1].action_name == "jump"
 
     # Switch to MENU
-    manager._context = InputContext.MENU
-    manager.process_event(mock_event)
-    assert events[-1] == "select"
-
+    input_manager._context = _CTX_MENU
+    input_manager.process_event(mock_event)
+    assert events[-1].action_name == "select"
 
-def test_deadzone_filtering(event_dispatcher: Any) -> None:
-    manager = InputManager(event_dispatcher)
 
+def test_deadzone_filtering(
+    input_manager: InputManager, event_dispatcher: Any, collector: Any
+) -> None:
     action = InputAction("move_x", ActionType.ANALOG, deadzone=0.2)
-    manager._registered_actions["move_x"] = action
-    manager._bindings.bind(InputDevice.GAMEPAD, 0, "move_x")  # Axis 0
+    input_manager._registered_actions["move_x"] = action
+    input_manager._bindings.bind(_GP, 0, "move_x")  # Axis 0
 
-    events = []
-    event_dispatcher.subscribe(OnActionEvent, lambda e: events.append(e.value))
+    events, on_action = collector()
+    event_dispatcher.subscribe(OnActionEvent, on_action)
 
     # Small movement (drift)
     mock_event = MagicMock()
@@ -116,22 +110,64 @@ def test_deadzone_filtering(event_dispatcher: Any) -> None:
     mock_event.axis = 0
     mock_event.value = 0.1
 
-    manager.process_event(mock_event)
+    input_manager.process_event(mock_event)
     # Should not dispatch or dispatch 0? Logic says "if abs < deadzone: value = 0"
     # But then "if action_def.action_type == ActionType.ANALOG: _dispatch_action"
     # So it dispatches 0.0.
     assert len(events) == 1
-    assert events[0] == 0.0
+    assert events[0].value == 0.0
 
     # Large movement
     mock_event.value = 0.8
-    manager.process_event(mock_event)
-    assert events[1] == 0.8
+    input_manager.process_event(mock_event)
+    assert events[1].value == 0.8
 
 
 # ========== Gamepad Tests ==========
 
 
+class FakeJoystick:
+    """Plain stand-in for pygame.joystick.Joystick without Mock call tracking.
+
+    Tests drive input by writing to ``buttons`` and ``axes`` directly.
+    """
+
+    def __init__(
+        self, instance_id: int, name: str, num_buttons: int = 17, num_axes: int = 6
+    ) -> None:
+        self._instance_id = instance_id
+        self._name = name
+        self.buttons = [False] * num_buttons
+        self.axes = [0.0] * num_axes
+
+    def init(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+    def get_instance_id(self) -> int:
+        return self._instance_id
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_numbuttons(self) -> int:
+        return len(self.buttons)
+
+    def get_numaxes(self) -> int:
+        return len(self.axes)
+
+    def get_button(self, button: int) -> bool:
+        return self.buttons[button]
+
+    def get_axis(self, axis: int) -> float:
+        return self.axes[axis]
+
+    def rumble(self, low: float, high: float, duration: int) -> bool:
+        return False
+
+
 def test_gamepad_manager_initialization(event_dispatcher: Any) -> None:
     """Test that GamepadManager initializes correctly."""
     config = GamepadConfig(deadzone=0.2, vibration_enabled=True)
@@ -147,12 +183,9 @@ def test_gamepad_detection(
     mock_joystick_class: Any, mock_get_count: Any, event_dispatcher: Any
 ) -> None:
     """Test gamepad detection on initialization."""
-    # Mock one controller
+    # One controller
     mock_get_count.return_value = 1
-    mock_joystick = Mock()
-    mock_joystick.get_instance_id.return_value = 0
-    mock_joystick.get_name.return_value = "Test Controller"
-    mock_joystick_class.return_value = mock_joystick
+    mock_joystick_class.return_value = FakeJoystick(0, "Test Controller")
 
     manager = GamepadManager(event_dispatcher)
 
@@ -165,28 +198,25 @@ def test_gamepad_detection(
 @patch("pygame.joystick.get_count")
 @patch("pygame.joystick.Joystick")
 def test_gamepad_button_press_event(
-    mock_joystick_class: Any, mock_get_count: Any, event_dispatcher: Any
+    mock_joystick_class: Any,
+    mock_get_count: Any,
+    event_dispatcher: Any,
+    collector: Any,
 ) -> None:
     """Test that button press events are fired correctly."""
-    # Setup mock controller
+    # Setup controller
     mock_get_count.return_value = 1
-    mock_joystick = Mock()
-    mock_joystick.get_instance_id.return_value = 0
-    mock_joystick.get_name.return_value = "Test Controller"
-    mock_joystick.get_numbuttons.return_value = 17
-    mock_joystick.get_numaxes.return_value = 6
-    mock_joystick.get_button.return_value = False
-    mock_joystick.get_axis.return_value = 0.0
-    mock_joystick_class.return_value = mock_joystick
+    joystick = FakeJoystick(0, "Test Controller")
+    mock_joystick_class.return_value = joystick
 
     manager = GamepadManager(event_dispatcher)
 
     # Subscribe to button events
-    events: list[GamepadButtonEvent] = []
-    event_dispatcher.subscribe(GamepadButtonEvent, lambda e: events.append(e))
+    events, on_event = collector()
+    event_dispatcher.subscribe(GamepadButtonEvent, on_event)
 
     # Simulate button press (A button)
-    mock_joystick.get_button.side_effect = lambda btn: btn == 0  # A button
+    joystick.buttons[0] = True
 
     manager.update()
 
@@ -200,29 +230,26 @@ def test_gamepad_button_press_event(
 @patch("pygame.joystick.get_count")
 @patch("pygame.joystick.Joystick")
 def test_gamepad_axis_with_deadzone(
-    mock_joystick_class: Any, mock_get_count: Any, event_dispatcher: Any
+    mock_joystick_class: Any,
+    mock_get_count: Any,
+    event_dispatcher: Any,
+    collector: Any,
 ) -> None:
     """Test axis values with deadzone application."""
-    # Setup mock controller
+    # Setup controller
     mock_get_count.return_value = 1
-    mock_joystick = Mock()
-    mock_joystick.get_instance_id.return_value = 0
-    mock_joystick.get_name.return_value = "Test Controller"
-    mock_joystick.get_numbuttons.return_value = 17
-    mock_joystick.get_numaxes.return_value = 6
-    mock_joystick.get_button.return_value = False
-    mock_joystick.get_axis.return_value = 0.0
-    mock_joystick_class.return_value = mock_joystick
+    joystick = FakeJoystick(0, "Test Controller")
+    mock_joystick_class.return_value = joystick
 
     config = GamepadConfig(deadzone=0.15)
     manager = GamepadManager(event_dispatcher, config)
 
     # Subscribe to axis events
-    events: list[GamepadAxisEvent] = []
-    event_dispatcher.subscribe(GamepadAxisEvent, lambda e: events.append(e))
+    events, on_event = collector()
+    event_dispatcher.subscribe(GamepadAxisEvent, on_event)
 
     # Simulate small axis movement (within deadzone)
-    mock_joystick.get_axis.side_effect = lambda axis: 0.1 if axis == 0 else 0.0
+    joystick.axes[0] = 0.1
 
     manager.update()
 
@@ -230,7 +257,7 @@ def test_gamepad_axis_with_deadzone(
     assert len(events) == 0
 
     # Simulate large axis movement (outside deadzone)
-    mock_joystick.get_axis.side_effect = lambda axis: 0.5 if axis == 0 else 0.0
+    joystick.axes[0] = 0.5
 
     manager.update()
 
@@ -248,22 +275,12 @@ def test_gamepad_multiple_controllers(
     mock_joystick_class: Any, mock_get_count: Any, event_dispatcher: Any
 ) -> None:
     """Test multiple controllers can be used simultaneously."""
-    # Mock two controllers
+    # Two controllers
     mock_get_count.return_value = 2
-
-    mock_joystick1 = Mock()
-    mock_joystick1.get_instance_id.return_value = 0
-    mock_joystick1.get_name.return_value = "Controller 1"
-    mock_joystick1.get_numbuttons.return_value = 17
-    mock_joystick1.get_numaxes.return_value = 6
-
-    mock_joystick2 = Mock()
-    mock_joystick2.get_instance_id.return_value = 1
-    mock_joystick2.get_name.return_value = "Controller 2"
-    mock_joystick2.get_numbuttons.return_value = 17
-    mock_joystick2.get_numaxes.return_value = 6
-
-    mock_joystick_class.side_effect = [mock_joystick1, mock_joystick2]
+    mock_joystick_class.side_effect = [
+        FakeJoystick(0, "Controller 1"),
+        FakeJoystick(1, "Controller 2"),
+    ]
 
     manager = GamepadManager(event_dispatcher)
 
@@ -290,14 +307,7 @@ def test_gamepad_hot_plug_detection(
 
     # Simulate controller connection
     mock_get_count.return_value = 1
-    mock_joystick = Mock()
-    mock_joystick.get_instance_id.return_value = 0
-    mock_joystick.get_name.return_value = "New Controller"
-    mock_joystick.get_numbuttons.return_value = 17
-    mock_joystick.get_numaxes.return_value = 6
-    mock_joystick.get_button.return_value = False
-    mock_joystick.get_axis.return_value = 0.0
-    mock_joystick_class.return_value = mock_joystick
+    mock_joystick_class.return_value = FakeJoystick(0, "New Controller")
 
     manager.update()  # Should detect new controller
 
@@ -318,16 +328,10 @@ def test_gamepad_query_methods(
     mock_joystick_class: Any, mock_get_count: Any, event_dispatcher: Any
 ) -> None:
     """Test get_button() and get_axis() query methods."""
-    # Setup mock controller
+    # Setup controller
     mock_get_count.return_value = 1
-    mock_joystick = Mock()
-    mock_joystick.get_instance_id.return_value = 0
-    mock_joystick.get_name.return_value = "Test Controller"
-    mock_joystick.get_numbuttons.return_value = 17
-    mock_joystick.get_numaxes.return_value = 6
-    mock_joystick.get_button.return_value = False
-    mock_joystick.get_axis.return_value = 0.0
-    mock_joystick_class.return_value = mock_joystick
+    joystick = FakeJoystick(0, "Test Controller")
+    mock_joystick_class.return_value = joystick
 
     manager = GamepadManager(event_dispatcher)
 
@@ -336,8 +340,8 @@ def test_gamepad_query_methods(
     assert manager.get_axis(0, GamepadAxis.LEFT_STICK_X) == 0.0
 
     # Simulate button press
-    mock_joystick.get_button.side_effect = lambda btn: btn == 0  # A button
-    mock_joystick.get_axis.side_effect = lambda axis: 0.5 if axis == 0 else 0.0
+    joystick.buttons[0] = True
+    joystick.axes[0] = 0.5
 
     manager.update()
 
@@ -4,10 +4,13 @@ Tests MetaLoader, TextureMeta, AudioMeta, SpritesheetMeta and related functional
 """
 
 import json
+import math
+import os
 import pytest
 from pathlib import Path
 
 from pyguara.resources.meta import (
+    AssetMeta,
     TextureFilter,
     AudioLoadMode,
     TextureMeta,
@@ -257,6 +260,51 @@ class TestMetaLoaderBasics:
         asset_path = tmp_path / "test.png"
         assert loader.has_meta(str(asset_path)) is False
 
+    def test_cache_evicts_least_recently_used(self) -> None:
+        loader = MetaLoader(max_cache_size=2)
+        loader._cache_put("a.png", TextureMeta())
+        loader._cache_put("b.png", TextureMeta())
+        loader.load_meta("a.png")  # Touch "a" so "b" becomes the oldest
+        loader._cache_put("c.png", TextureMeta())
+
+        assert list(loader._cache) == ["a.png", "c.png"]
+
+    def test_prime_directory_answers_has_meta(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        (tmp_path / "hero.png.meta").write_text("{}")
+        (tmp_path / "other.png").write_text("")
+        loader.prime_directory(str(tmp_path))
+
+        assert loader._dir_index[str(tmp_path)] == {"hero.png.meta"}
+        assert loader.has_meta(str(tmp_path / "hero.png")) is True
+        assert loader.has_meta(str(tmp_path / "other.png")) is False
+
+    def test_prime_directory_updated_by_save(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        loader.prime_directory(str(tmp_path))
+        asset_path = str(tmp_path / "new.png")
+        assert loader.has_meta(asset_path) is False
+
+        loader.save_meta(asset_path, TextureMeta())
+        assert loader.has_meta(asset_path) is True
+
+    def test_scan_tree_loads_nested_metas(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        (tmp_path / "sfx").mkdir()
+        (tmp_path / "hero.png.meta").write_text(json.dumps({"filter": "linear"}))
+        (tmp_path / "sfx" / "jump.wav.meta").write_text(json.dumps({"type": "audio"}))
+        (tmp_path / "sfx" / "bad.wav.meta").write_text("not json")
+
+        found = loader.scan_tree(str(tmp_path))
+
+        assert set(found) == {
+            str(tmp_path / "hero.png"),
+            str(tmp_path / "sfx" / "jump.wav"),
+        }
+        assert isinstance(found[str(tmp_path / "sfx" / "jump.wav")], AudioMeta)
+        # Directories were primed, so unknown assets resolve without I/O
+        assert loader.has_meta(str(tmp_path / "sfx" / "land.wav")) is False
+
     def test_clear_cache(self) -> None:
         loader = MetaLoader()
         loader._cache["test"] = TextureMeta()
@@ -275,6 +323,17 @@ class TestMetaLoaderLoadMeta:
         result = loader.load_meta(str(asset_path))
         assert result is None
 
+    def test_load_meta_caches_missing_file(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        asset_path = str(tmp_path / "test.png")
+        assert loader.load_meta(asset_path) is None
+        assert asset_path in loader._cache
+
+        # Saving replaces the cached miss
+        meta = TextureMeta()
+        loader.save_meta(asset_path, meta)
+        assert loader.load_meta(asset_path) is meta
+
     def test_load_meta_texture(self, tmp_path: Path) -> None:
         loader = MetaLoader()
         asset_path = tmp_path / "test.png"
@@ -301,6 +360,20 @@ class TestMetaLoaderLoadMeta:
         assert result.load_mode == "stream"
         assert result.volume_db == -3.0
 
+    def test_load_meta_non_finite_values(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        asset_path = tmp_path / "silent.ogg"
+        meta_path = tmp_path / "silent.ogg.meta"
+        # The stdlib writes (and accepts) the non-standard Infinity literal
+        meta_path.write_text(json.dumps({"type": "audio", "volume_db": -math.inf}))
+
+        result = loader.load_meta(str(asset_path))
+        assert isinstance(result, AudioMeta)
+        assert result.volume_db == -math.inf
+
+        loader.save_meta(str(asset_path), result)
+        assert json.loads(meta_path.read_text())["volume_db"] == -math.inf
+
     def test_load_meta_spritesheet(self, tmp_path: Path) -> None:
         loader = MetaLoader()
         asset_path = tmp_path / "sprites.png"
@@ -364,6 +437,15 @@ class TestMetaLoaderLoadMeta:
         result = loader.load_meta(str(asset_path))
         assert result is None
 
+    def test_load_meta_non_string_type(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        asset_path = tmp_path / "test.png"
+        meta_path = tmp_path / "test.png.meta"
+        meta_path.write_text(json.dumps({"type": ["texture"]}))
+
+        result = loader.load_meta(str(asset_path))
+        assert result is None
+
     def test_load_meta_no_type_unknown_extension(self, tmp_path: Path) -> None:
         loader = MetaLoader()
         asset_path = tmp_path / "test.xyz"
@@ -373,6 +455,19 @@ class TestMetaLoaderLoadMeta:
         result = loader.load_meta(str(asset_path))
         assert result is None
 
+    def test_load_meta_extension_registered_at_runtime(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(EXTENSION_TO_META_TYPE, ".webp", "texture")
+        loader = MetaLoader()
+        asset_path = tmp_path / "test.webp"
+        meta_path = tmp_path / "test.webp.meta"
+        meta_path.write_text(json.dumps({"filter": "linear"}))
+
+        result = loader.load_meta(str(asset_path))
+        assert isinstance(result, TextureMeta)
+        assert result.filter == "linear"
+
     def test_load_meta_ignores_unknown_fields(self, tmp_path: Path) -> None:
         loader = MetaLoader()
         asset_path = tmp_path / "test.png"
@@ -489,77 +584,91 @@ class TestMetaLoaderSaveMeta:
         data = json.loads(meta_path.read_text())
         assert data["filter"] == "linear"
 
+    def test_save_meta_skips_unchanged_content(self, tmp_path: Path) -> None:
+        loader = MetaLoader()
+        asset_path = str(tmp_path / "test.png")
+        meta_path = tmp_path / "test.png.meta"
 
-class TestMetaLoaderRoundtrip:
-    """Tests for save/load roundtrip integrity."""
+        assert loader.save_meta(asset_path, TextureMeta(filter="linear"))
+        os.utime(meta_path, ns=(0, 0))
 
-    def test_roundtrip_texture_meta(self, tmp_path: Path) -> None:
-        loader = MetaLoader()
-        asset_path = tmp_path / "test.png"
-        original = TextureMeta(
-            filter="linear",
-            mipmaps=True,
-            premultiply_alpha=True,
-            srgb=False,
-            wrap_s="repeat",
-            wrap_t="mirror",
-        )
+        # Identical content: file is not rewritten
+        assert loader.save_meta(asset_path, TextureMeta(filter="linear"))
+        assert meta_path.stat().st_mtime_ns == 0
 
-        loader.save_meta(str(asset_path), original)
-        loader.clear_cache()  # Force reload from disk
-        loaded = loader.load_meta(str(asset_path))
+        # Changed content: file is replaced, no temp file left behind
+        assert loader.save_meta(asset_path, TextureMeta(filter="nearest"))
+        assert meta_path.stat().st_mtime_ns != 0
+        assert not (tmp_path / "test.png.meta.tmp").exists()
 
-        assert isinstance(loaded, TextureMeta)
-        assert loaded.filter == original.filter
-        assert loaded.mipmaps == original.mipmaps
-        assert loaded.premultiply_alpha == original.premultiply_alpha
-        assert loaded.srgb == original.srgb
-        assert loaded.wrap_s == original.wrap_s
-        assert loaded.wrap_t == original.wrap_t
 
-    def test_roundtrip_audio_meta(self, tmp_path: Path) -> None:
-        loader = MetaLoader()
-        asset_path = tmp_path / "test.ogg"
-        original = AudioMeta(
-            load_mode="stream",
-            volume_db=-12.0,
-            loop_start=5.0,
-            loop_end=120.0,
-            normalize=True,
-        )
+@pytest.fixture(scope="class")
+def roundtrip_loader() -> MetaLoader:
+    """One loader shared by all roundtrip cases."""
+    return MetaLoader()
 
-        loader.save_meta(str(asset_path), original)
-        loader.clear_cache()
-        loaded = loader.load_meta(str(asset_path))
 
-        assert isinstance(loaded, AudioMeta)
-        assert loaded.load_mode == original.load_mode
-        assert loaded.volume_db == original.volume_db
-        assert loaded.loop_start == original.loop_start
-        assert loaded.loop_end == original.loop_end
-        assert loaded.normalize == original.normalize
+@pytest.fixture(scope="class")
+def roundtrip_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory shared by all roundtrip cases (unique file per case)."""
+    return tmp_path_factory.mktemp("roundtrip")
 
-    def test_roundtrip_spritesheet_meta(self, tmp_path: Path) -> None:
-        loader = MetaLoader()
-        asset_path = tmp_path / "sprites.png"
-        original = SpritesheetMeta(
-            frame_width=64,
-            frame_height=48,
-            margin=2,
-            spacing=1,
-            filter="linear",
-        )
 
-        loader.save_meta(str(asset_path), original)
-        loader.clear_cache()
-        loaded = loader.load_meta(str(asset_path))
-
-        assert isinstance(loaded, SpritesheetMeta)
-        assert loaded.frame_width == original.frame_width
-        assert loaded.frame_height == original.frame_height
-        assert loaded.margin == original.margin
-        assert loaded.spacing == original.spacing
-        assert loaded.filter == original.filter
+class TestMetaLoaderRoundtrip:
+    """Tests for save/load roundtrip integrity."""
+
+    @pytest.mark.parametrize(
+        ("filename", "original"),
+        [
+            (
+                "test.png",
+                TextureMeta(
+                    filter="linear",
+                    mipmaps=True,
+                    premultiply_alpha=True,
+                    srgb=False,
+                    wrap_s="repeat",
+                    wrap_t="mirror",
+                ),
+            ),
+            (
+                "test.ogg",
+                AudioMeta(
+                    load_mode="stream",
+                    volume_db=-12.0,
+                    loop_start=5.0,
+                    loop_end=120.0,
+                    normalize=True,
+                ),
+            ),
+            (
+                "sprites.png",
+                SpritesheetMeta(
+                    frame_width=64,
+                    frame_height=48,
+                    margin=2,
+                    spacing=1,
+                    filter="linear",
+                ),
+            ),
+        ],
+        ids=["texture", "audio", "spritesheet"],
+    )
+    def test_roundtrip(
+        self,
+        roundtrip_loader: MetaLoader,
+        roundtrip_dir: Path,
+        filename: str,
+        original: AssetMeta,
+    ) -> None:
+        asset_path = str(roundtrip_dir / filename)
+
+        roundtrip_loader.save_meta(asset_path, original)
+        roundtrip_loader.clear_cache()  # Force reload from disk
+        loaded = roundtrip_loader.load_meta(asset_path)
+
+        assert type(loaded) is type(original)
+        assert loaded == original
 
 
 # =============================================================================
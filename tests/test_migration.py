@@ -86,6 +86,22 @@ class TestMigrationManager:
         with pytest.raises(ValueError, match="already registered"):
             manager.register(m2)
 
+    def test_register_sparse_versions(self):
+        """Test that negative and date-style versions register and chain."""
+        manager = MigrationManager(current_version=20240101)
+
+        def migrate_fn(data):
+            return data
+
+        manager.register(Migration(-1, 2, migrate_fn))
+        manager.register(Migration(2, 20240101, migrate_fn))
+
+        assert len(manager._migrations) == 2
+        assert [m.to_version for m in manager.get_migration_path(-1)] == [
+            2,
+            20240101,
+        ]
+
     def test_register_migration_exceeds_current_version(self):
         """Test that migration cannot exceed current version."""
         manager = MigrationManager(current_version=2)
@@ -133,6 +149,20 @@ class TestMigrationManager:
         with pytest.raises(ValueError, match="No migration registered"):
             manager.get_migration_path(1)
 
+    def test_get_migration_path_cached_until_register(self):
+        """Test that resolved paths are reused and reset by register()."""
+        manager = MigrationManager(current_version=3)
+
+        def migrate_fn(data):
+            return data
+
+        manager.register(Migration(1, 2, migrate_fn))
+        assert not manager.has_migration_path(1)
+
+        manager.register(Migration(2, 3, migrate_fn))
+        assert manager._resolve_path(1) is manager._resolve_path(1)
+        assert len(manager.get_migration_path(1)) == 2
+
     def test_get_migration_path_already_current(self):
         """Test that no path is returned when already at current version."""
         manager = MigrationManager(current_version=2)
@@ -186,6 +216,78 @@ class TestMigrationManager:
         assert result["stats"]["health"] == 100
         assert result["stats"]["max"] == 100
 
+    def test_migrate_many(self):
+        """Test migrating a batch of records through one resolved chain."""
+        manager = MigrationManager(current_version=3)
+
+        def v1_to_v2(data):
+            data["health"] = data.pop("hp")
+            return data
+
+        def v2_to_v3(data):
+            data["max_health"] = data["health"]
+            return data
+
+        manager.register(Migration(1, 2, v1_to_v2))
+        manager.register(Migration(2, 3, v2_to_v3))
+
+        records = [{"hp": 10}, {"hp": 20}]
+        results = manager.migrate_many(records, from_version=1)
+
+        assert results == [
+            {"health": 10, "max_health": 10},
+            {"health": 20, "max_health": 20},
+        ]
+        assert results[0] is records[0]  # migrated in place
+
+    def test_compile_composes_chain(self):
+        """Test that compile() returns one cached function for the chain."""
+        manager = MigrationManager(current_version=3)
+        manager.register(Migration(1, 2, lambda d: {**d, "a": 1}))
+        manager.register(Migration(2, 3, lambda d: {**d, "b": d["a"] + 1}))
+
+        composed = manager.compile(1)
+        assert composed({}) == {"a": 1, "b": 2}
+        assert manager.compile(1) is composed
+        assert manager.compile(3)({"x": 0}) == {"x": 0}
+
+    def test_migrate_many_failure_raises_error(self):
+        """Test that a failing step in a batch raises MigrationError."""
+        manager = MigrationManager(current_version=2)
+
+        def bad_migration(data):
+            raise KeyError("missing field")
+
+        manager.register(Migration(1, 2, bad_migration))
+
+        with pytest.raises(MigrationError, match="failed"):
+            manager.migrate_many([{"data": "value"}], from_version=1)
+
+    def test_migrate_many_failure_names_record(self):
+        """Test that a batch failure reports the index of the bad record."""
+        manager = MigrationManager(current_version=2)
+
+        def v1_to_v2(data):
+            data["health"] = data.pop("hp")
+            return data
+
+        manager.register(Migration(1, 2, v1_to_v2))
+
+        with pytest.raises(MigrationError, match="record 1"):
+            manager.migrate_many([{"hp": 1}, {}], from_version=1)
+
+    def test_migrate_many_iteration_error_not_wrapped(self):
+        """Test that errors from the caller's iterable propagate unwrapped."""
+        manager = MigrationManager(current_version=2)
+        manager.register(Migration(1, 2, lambda d: d))
+
+        def records():
+            yield {"hp": 1}
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            manager.migrate_many(records(), from_version=1)
+
     def test_migrate_already_current(self):
         """Test that data at current version is unchanged."""
         manager = MigrationManager(current_version=2)
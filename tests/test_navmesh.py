@@ -1,5 +1,6 @@
 """Tests for navigation mesh system."""
 
+import numpy as np
 import pytest
 
 from pyguara.ai.navmesh import (
@@ -95,6 +96,67 @@ class TestNavMeshPolygon:
         assert polygon.contains_point(Vector2(0.1, 5))
         assert polygon.contains_point(Vector2(5, 0.1))
 
+    def test_contains_point_concave(self):
+        """Ray casting should handle concave outlines and horizontal edges."""
+        # L-shape: the notch at the top-right is outside the polygon
+        vertices = [
+            Vector2(0, 0),
+            Vector2(10, 0),
+            Vector2(10, 5),
+            Vector2(5, 5),
+            Vector2(5, 10),
+            Vector2(0, 10),
+        ]
+        polygon = NavMeshPolygon(id=0, vertices=vertices)
+
+        assert polygon.contains_point(Vector2(2, 8))
+        assert polygon.contains_point(Vector2(8, 2))
+        assert not polygon.contains_point(Vector2(8, 8))
+        assert not polygon.contains_point(Vector2(2, 10.5))
+
+    def test_specialized_shapes_match_ray_cast(self):
+        """Rectangle and triangle fast paths should agree with the general test."""
+        rect = create_rectangle_polygon(0, 0, 0, 10, 10)
+        tri = NavMeshPolygon(
+            id=1, vertices=[Vector2(0, 0), Vector2(10, 10), Vector2(10, 0)]
+        )
+        # Same outlines with an extra collinear vertex take the general path
+        rect_general = NavMeshPolygon(
+            id=2, vertices=[*rect.vertices[:2], Vector2(10, 5), *rect.vertices[2:]]
+        )
+        tri_general = NavMeshPolygon(
+            id=3, vertices=[*tri.vertices[:2], Vector2(10, 5), tri.vertices[2]]
+        )
+        assert rect._is_rect and tri._triangle is not None
+        assert not rect_general._is_rect and tri_general._triangle is None
+
+        points = [Vector2(x, y) for x in range(-1, 12) for y in range(-1, 12)]
+        points += [
+            Vector2(x, y)
+            for x, y in np.random.default_rng(1).uniform(-2, 12, size=(200, 2))
+        ]
+        for point in points:
+            assert rect.contains_point(point) == rect_general.contains_point(point)
+        for point in points[169:]:
+            assert tri.contains_point(point) == tri_general.contains_point(point)
+
+    def test_bowtie_is_not_a_rectangle(self):
+        """Four bounding-box corners in crossed order must not use the rect path."""
+        bowtie = NavMeshPolygon(
+            id=0,
+            vertices=[Vector2(0, 0), Vector2(10, 10), Vector2(10, 0), Vector2(0, 10)],
+        )
+
+        assert not bowtie._is_rect
+
+    def test_polygons_compare_by_fields(self):
+        """Cached coordinate arrays should not take part in equality."""
+        vertices = [Vector2(0, 0), Vector2(10, 0), Vector2(5, 10)]
+
+        assert NavMeshPolygon(id=0, vertices=vertices) == NavMeshPolygon(
+            id=0, vertices=list(vertices)
+        )
+
     def test_get_shared_edge_adjacent(self):
         """Should find shared edge between adjacent polygons."""
         # Two squares sharing an edge
@@ -126,6 +188,39 @@ class TestNavMeshPolygon:
             start == Vector2(10, 10) and end == Vector2(10, 0)
         )
 
+    def test_get_shared_edge_within_tolerance(self):
+        """Edges should match regardless of direction and float noise."""
+        poly1 = NavMeshPolygon(
+            id=0, vertices=[Vector2(0, 0), Vector2(10, 0), Vector2(5, 10)]
+        )
+        poly2 = NavMeshPolygon(
+            id=1,
+            vertices=[Vector2(0.0001, 0), Vector2(5, -10), Vector2(10.0001, 0)],
+        )
+
+        assert poly1.get_shared_edge(poly2) == (Vector2(0, 0), Vector2(10, 0))
+
+    def test_get_shared_edge_across_snap_boundary(self):
+        """Points within tolerance that round to adjacent buckets still match."""
+        left = create_rectangle_polygon(0, 0, 0, 2.0005, 1)
+        right = NavMeshPolygon(
+            id=1,
+            vertices=[
+                Vector2(2.0004, 0),
+                Vector2(4, 0),
+                Vector2(4, 1),
+                Vector2(2.0004, 1),
+            ],
+        )
+        assert left.get_shared_edge(right) is not None
+
+        navmesh = NavMesh()
+        navmesh.add_polygon(left)
+        navmesh.add_polygon(right)
+        navmesh.build_connections()
+
+        assert navmesh.get_neighbors(0) == (1,)
+
     def test_get_shared_edge_not_adjacent(self):
         """Should return None for non-adjacent polygons."""
         poly1 = NavMeshPolygon(
@@ -273,6 +368,25 @@ class TestNavMesh:
 
         assert navmesh.polygon_count == 0
 
+    def test_remove_polygon_keeps_lookup_consistent(self):
+        """Removing from the middle should keep every other id reachable."""
+        navmesh = NavMesh()
+        for i in range(4):
+            navmesh.add_polygon(create_rectangle_polygon(i, i * 10, 0, 10, 10))
+
+        navmesh.remove_polygon(1)
+        navmesh.remove_polygon(99)  # unknown ids are ignored
+
+        assert navmesh.polygon_count == 3
+        assert navmesh.get_polygon(1) is None
+        for i in (0, 2, 3):
+            assert navmesh.get_polygon(i).id == i
+        assert navmesh.get_polygon_at(Vector2(35, 5)).id == 3
+
+        navmesh.remove_polygon(3)
+        navmesh.add_polygon(create_rectangle_polygon(3, 30, 0, 10, 10))
+        assert navmesh.get_polygon(3).id == 3
+
     def test_get_polygon(self):
         """Should retrieve polygon by ID."""
         navmesh = NavMesh()
@@ -337,6 +451,59 @@ class TestNavMesh:
 
         assert found is None
 
+    def test_get_polygon_at_non_finite(self):
+        """Should return None for NaN or infinite points instead of raising."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(create_rectangle_polygon(0, 0, 0, 10, 10))
+
+        assert navmesh.get_polygon_at(Vector2(float("nan"), 1)) is None
+        assert navmesh.get_polygon_at(Vector2(1, float("inf"))) is None
+        assert navmesh.get_polygon_at(Vector2(float("-inf"), 1)) is None
+
+    def test_get_polygons_at_batch(self):
+        """Should locate many points at once, -1 for points outside."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(create_rectangle_polygon(7, 0, 0, 10, 10))
+        navmesh.add_polygon(
+            NavMeshPolygon(
+                id=3, vertices=[Vector2(10, 0), Vector2(20, 0), Vector2(15, 10)]
+            )
+        )
+
+        ids = navmesh.get_polygons_at(
+            np.array([[5, 5], [15, 2], [19, 9], [50, 50], [1, 9]])
+        )
+
+        assert ids.tolist() == [7, 3, -1, -1, 7]
+
+    def test_get_polygons_at_matches_scalar_queries(self):
+        """Batch results should agree with per-polygon contains_point."""
+        navmesh = NavMesh()
+        for i in range(4):
+            navmesh.add_polygon(create_rectangle_polygon(i, i * 10, 0, 10, 10))
+        navmesh.add_polygon(
+            NavMeshPolygon(
+                id=9, vertices=[Vector2(0, 10), Vector2(40, 10), Vector2(20, 30)]
+            )
+        )
+        points = np.random.default_rng(0).uniform(-5, 45, size=(200, 2))
+
+        ids = navmesh.get_polygons_at(points)
+
+        for (x, y), found in zip(points, ids):
+            expected = [
+                i
+                for i in (0, 1, 2, 3, 9)
+                if navmesh.get_polygon(i).contains_point(Vector2(x, y))
+            ]
+            assert found == (expected[0] if expected else -1)
+
+    def test_get_polygons_at_empty_mesh(self):
+        """Empty navmesh should report every point as outside."""
+        ids = NavMesh().get_polygons_at(np.zeros((3, 2)))
+
+        assert ids.tolist() == [-1, -1, -1]
+
     def test_build_connections(self):
         """Should build connections between adjacent polygons."""
         navmesh = NavMesh()
@@ -401,6 +568,116 @@ class TestNavMesh:
         assert len(poly1.neighbors) == 0
         assert len(poly2.neighbors) == 0
 
+    def test_build_connections_grid_of_mixed_sizes(self):
+        """Grid bucketing should find every adjacency an exhaustive scan would."""
+        navmesh = NavMesh()
+        for row in range(4):
+            for col in range(4):
+                navmesh.add_polygon(
+                    create_rectangle_polygon(row * 4 + col, col * 10, row * 10, 10, 10)
+                )
+        # Two wide strips below, spanning several grid cells each
+        navmesh.add_polygon(create_rectangle_polygon(16, 0, 40, 40, 10))
+        navmesh.add_polygon(create_rectangle_polygon(17, 0, 50, 40, 10))
+
+        navmesh.build_connections()
+
+        # 24 edges inside the 4x4 grid plus the one between the strips
+        assert navmesh.edge_count == 25
+        assert navmesh.get_neighbors(16) == (17,)
+        assert navmesh.get_polygon_at(Vector2(35, 45)).id == 16
+
+    def test_spatial_grid_bounded_with_one_huge_polygon(self):
+        """One oversized polygon must not blow up the grid's cell count."""
+        navmesh = NavMesh()
+        for i in range(20):
+            navmesh.add_polygon(create_rectangle_polygon(i, i, 0, 1, 1))
+        navmesh.add_polygon(create_rectangle_polygon(20, 0, 10, 3000, 3000))
+
+        navmesh.build_connections()
+
+        assert len(navmesh._get_grid().cells) < 1000
+        # Strip of unit squares is chained; the big one touches none of them
+        assert navmesh.edge_count == 19
+        assert navmesh.get_polygon_at(Vector2(0.5, 0.5)).id == 0
+        assert navmesh.get_polygon_at(Vector2(1500, 1500)).id == 20
+
+    def test_spatial_grid_bounded_with_long_thin_polygon(self):
+        """A long thin strip must not blow up the grid's cell count."""
+        navmesh = NavMesh()
+        for i in range(1000):
+            navmesh.add_polygon(create_rectangle_polygon(i, i, 0, 1, 1))
+        # Sits on top of the squares, sharing no full edge with any of them
+        navmesh.add_polygon(create_rectangle_polygon(1000, 0, 1, 100000, 0.01))
+
+        navmesh.build_connections()
+
+        grid = navmesh._get_grid()
+        assert len(grid.cells) < 10000
+        assert grid.large == [1000]
+        assert navmesh.edge_count == 999
+        assert navmesh.get_polygon_at(Vector2(500.5, 0.5)).id == 500
+        assert navmesh.get_polygon_at(Vector2(50000, 1.005)).id == 1000
+
+    def test_large_polygon_connects_to_bucketed_neighbor(self):
+        """Polygons kept out of the grid should still find their neighbours."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(create_rectangle_polygon(0, 0, 0, 1000, 1))
+        navmesh.add_polygon(create_rectangle_polygon(1, 1000, 0, 1, 1))
+        navmesh.add_polygon(create_rectangle_polygon(2, 1001, 0, 1, 1))
+
+        navmesh.build_connections()
+
+        assert navmesh._get_grid().large == [0]
+        assert navmesh.get_neighbors(0) == (1,)
+        assert navmesh.get_neighbors(1) == (0, 2)
+
+    def test_scalar_and_batch_agree_on_edges(self):
+        """Point-on-edge results must match between the two lookup APIs."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(
+            NavMeshPolygon(
+                id=0, vertices=[Vector2(0, 0), Vector2(10, 0), Vector2(0, 10)]
+            )
+        )
+        navmesh.add_polygon(
+            NavMeshPolygon(
+                id=1, vertices=[Vector2(10, 0), Vector2(10, 10), Vector2(0, 10)]
+            )
+        )
+        navmesh.add_polygon(create_rectangle_polygon(2, 10, 0, 10, 10))
+
+        points = [
+            (5, 0),  # Triangle bottom edge
+            (0, 5),  # Triangle left edge
+            (5, 5),  # Shared hypotenuse
+            (10, 5),  # Triangle / rect shared edge
+            (0, 0),
+            (10, 0),
+            (10, 10),
+            (3, 3),  # Strictly inside
+            (20, 10),
+        ]
+
+        scalar = []
+        for x, y in points:
+            polygon = navmesh.get_polygon_at(Vector2(x, y))
+            scalar.append(polygon.id if polygon else -1)
+
+        assert scalar == list(navmesh.get_polygons_at(np.array(points, float)))
+        assert scalar[0] == -1
+        assert scalar[7] == 0
+
+    def test_get_polygon_at_after_remove(self):
+        """Point queries should not return removed polygons."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(create_rectangle_polygon(0, 0, 0, 10, 10))
+        assert navmesh.get_polygon_at(Vector2(5, 5)) is not None
+
+        navmesh.remove_polygon(0)
+
+        assert navmesh.get_polygon_at(Vector2(5, 5)) is None
+
     def test_get_neighbors(self):
         """Should get neighbors of a polygon."""
         navmesh = NavMesh()
@@ -548,6 +825,17 @@ class TestNavMeshPathfinder:
         assert path[0] == Vector2(5, 5)
         assert path[-1] == Vector2(15, 5)
 
+    def test_pathfinding_non_finite_point(self):
+        """Should return None when start or goal is not a finite point."""
+        navmesh = NavMesh()
+        navmesh.add_polygon(create_rectangle_polygon(0, 0, 0, 10, 10))
+        navmesh.build_connections()
+
+        pathfinder = NavMeshPathfinder(navmesh)
+
+        assert pathfinder.find_path(Vector2(float("nan"), 5), Vector2(5, 5)) is None
+        assert pathfinder.find_path(Vector2(5, 5), Vector2(5, float("inf"))) is None
+
     def test_pathfinding_start_outside(self):
         """Should return None when start is outside navmesh."""
         navmesh = NavMesh()
@@ -647,6 +935,88 @@ class TestNavMeshPathfinder:
         assert path[0] == Vector2(5, 5)
         assert path[-1] == Vector2(45, 5)
 
+    def test_pathfinding_straight_corridor_is_smoothed(self):
+        """Funnel smoothing should collapse a straight corridor to two points."""
+        navmesh = NavMesh()
+        for i in range(5):
+            navmesh.add_polygon(create_rectangle_polygon(i, i * 10, 0, 10, 10))
+        navmesh.build_connections()
+        pathfinder = NavMeshPathfinder(navmesh)
+
+        path = pathfinder.find_path(Vector2(5, 5), Vector2(45, 5))
+        unsmoothed = pathfinder.find_path(Vector2(5, 5), Vector2(45, 5), smooth=False)
+
+        assert path == [Vector2(5, 5), Vector2(45, 5)]
+        assert len(unsmoothed) == 5  # start, three centers, goal
+
+    def test_pathfinding_smoothed_bends_at_corners(self):
+        """Smoothed paths should bend exactly at the inner corners they wrap."""
+        navmesh = NavMesh()
+        # U-shaped corridor: right along the bottom, up, then back left
+        cells = [(0, 0), (10, 0), (20, 0), (20, 10), (20, 20), (10, 20), (0, 20)]
+        for i, (x, y) in enumerate(cells):
+            navmesh.add_polygon(create_rectangle_polygon(i, x, y, 10, 10))
+        navmesh.build_connections()
+        pathfinder = NavMeshPathfinder(navmesh)
+
+        path = pathfinder.find_path(Vector2(2, 5), Vector2(2, 25))
+
+        assert path == [Vector2(2, 5), Vector2(20, 10), Vector2(20, 20), Vector2(2, 25)]
+
+    def test_pathfinding_smoothed_turns_either_way(self):
+        """Funnel should handle both left and right turns."""
+        for direction in (1, -1):
+            navmesh = NavMesh()
+            navmesh.add_polygon(create_rectangle_polygon(0, 0, 0, 10, 10))
+            navmesh.add_polygon(create_rectangle_polygon(1, 10, 0, 10, 10))
+            navmesh.add_polygon(create_rectangle_polygon(2, 10, 10 * direction, 10, 10))
+            navmesh.build_connections()
+            goal = Vector2(15, 5 + 13 * direction)
+
+            path = NavMeshPathfinder(navmesh).find_path(Vector2(5, 5), goal)
+
+            corner = Vector2(10, 10) if direction == 1 else Vector2(10, 0)
+            assert path == [Vector2(5, 5), corner, goal]
+
+    def test_pathfinding_graph_cached_until_navmesh_changes(self):
+        """Search graph should be reused until the navmesh is mutated."""
+        navmesh = NavMesh()
+        for i in range(3):
+            navmesh.add_polygon(create_rectangle_polygon(i, i * 10, 0, 10, 10))
+        navmesh.build_connections()
+        pathfinder = NavMeshPathfinder(navmesh)
+
+        assert pathfinder.find_path(Vector2(5, 5), Vector2(25, 5)) is not None
+        graph = pathfinder._graph
+        pathfinder.find_path(Vector2(5, 5), Vector2(15, 5))
+        assert pathfinder._graph is graph
+
+        # Dropping the middle polygon disconnects the ends
+        navmesh.remove_polygon(1)
+        navmesh.build_connections()
+
+        assert pathfinder.find_path(Vector2(5, 5), Vector2(25, 5)) is None
+        assert pathfinder._graph is not graph
+
+    def test_polygon_path_is_shortest(self):
+        """A* should return a minimal polygon chain through a grid."""
+        navmesh = NavMesh()
+        for row in range(3):
+            for col in range(3):
+                navmesh.add_polygon(
+                    create_rectangle_polygon(row * 3 + col, col * 10, row * 10, 10, 10)
+                )
+        navmesh.build_connections()
+        pathfinder = NavMeshPathfinder(navmesh)
+
+        path = pathfinder._find_polygon_path(0, 8)
+
+        assert path is not None
+        assert path[0] == 0 and path[-1] == 8
+        assert len(path) == 5
+        for a, b in zip(path, path[1:]):
+            assert b in navmesh.get_neighbors(a)
+
 
 class TestHelperFunctions:
     """Test helper functions."""
@@ -1,5 +1,10 @@
 """Tests for nine-patch sprite system."""
 
+import dataclasses
+
+import numpy as np
+import pytest
+
 from pyguara.common.types import Vector2, Rect
 from pyguara.graphics.ninepatch import (
     NinePatchMetrics,
@@ -37,6 +42,20 @@ class TestNinePatchMetrics:
         assert metrics.top == 15
         assert metrics.bottom == 20
 
+    def test_metrics_are_immutable(self):
+        """Metrics should be frozen so layouts can be cached by value."""
+        metrics = NinePatchMetrics.uniform(10)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metrics.left = 5  # type: ignore[misc]
+
+    def test_metrics_precompute_min_size(self):
+        """Metrics should carry the summed edge sizes."""
+        metrics = NinePatchMetrics(left=5, right=10, top=15, bottom=20)
+
+        assert (metrics.min_w, metrics.min_h) == (15, 35)
+        assert not hasattr(metrics, "__dict__")
+
 
 class TestNinePatchSprite:
     """Test nine-patch sprite functionality."""
@@ -187,6 +206,49 @@ class TestNinePatchSprite:
         assert dest_rects[2].x == 10  # Right corner at x=10
         assert dest_rects[8].y == 10  # Bottom corner at y=10
 
+    def test_rects_cached_per_layout(self):
+        """Repeated calls with the same arguments should reuse the layout."""
+        sprite = NinePatchSprite(
+            texture_path="button.png", metrics=NinePatchMetrics.uniform(10)
+        )
+
+        assert sprite.get_patch_rects(100, 100) is sprite.get_patch_rects(100, 100)
+        assert sprite.get_dest_rects(0, 0, 50, 50) is sprite.get_dest_rects(
+            0, 0, 50, 50
+        )
+        assert sprite.get_dest_rects(5, 0, 50, 50)[0] == Rect(5, 0, 10, 10)
+
+    def test_rects_follow_metrics_reassignment(self):
+        """Swapping metrics should not return a stale cached layout."""
+        sprite = NinePatchSprite(
+            texture_path="button.png", metrics=NinePatchMetrics.uniform(10)
+        )
+        sprite.get_patch_rects(100, 100)
+        sprite.get_dest_rects(0, 0, 50, 50)
+
+        sprite.metrics = NinePatchMetrics.uniform(4)
+
+        assert sprite.get_patch_rects(100, 100)[0] == Rect(0, 0, 4, 4)
+        assert sprite.get_dest_rects(0, 0, 50, 50)[4] == Rect(4, 4, 42, 42)
+
+    def test_rect_arrays_match_rects(self):
+        """Array layouts should hold the same rects as the Rect API."""
+        metrics = NinePatchMetrics(left=5, right=15, top=10, bottom=20)
+        sprite = NinePatchSprite(texture_path="button.png", metrics=metrics)
+
+        src = sprite.get_patch_rects_np(100, 100)
+        dest = sprite.get_dest_rects_np(50, 30, 10, 10)
+
+        assert src.shape == (9, 4) and src.dtype == np.int32
+        assert [Rect(*r) for r in src.tolist()] == list(
+            sprite.get_patch_rects(100, 100)
+        )
+        assert [Rect(*r) for r in dest.tolist()] == list(
+            sprite.get_dest_rects(50, 30, 10, 10)
+        )
+        # Clamped to the 20x30 minimum size
+        assert dest[8].tolist() == [55, 40, 15, 20]
+
 
 class TestNinePatchUsagePatterns:
     """Test common usage patterns for nine-patch sprites."""
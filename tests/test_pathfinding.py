@@ -1,17 +1,30 @@
 """Tests for A* pathfinding system."""
 
+import itertools
+import random
+
+import numpy as np
 import pytest
 
 from pyguara.ai.pathfinding import (
+    _HEURISTIC_XY,
+    DIAGONAL_COST,
+    HEURISTIC_FUNCTIONS,
     AStar,
     GridMap,
     Heuristic,
+    _astar_core,
+    _bidirectional_core,
+    _bresenham_clear,
+    _has_line_of_sight,
     diagonal_distance,
     euclidean_distance,
     manhattan_distance,
     octile_distance,
+    path_to_world_array,
     path_to_world_coords,
     smooth_path,
+    world_to_grid_array,
     world_to_grid_coords,
 )
 from pyguara.common.types import Vector2
@@ -44,9 +57,28 @@ class TestHeuristicFunctions:
         assert octile_distance((0, 0), (5, 0)) == pytest.approx(5.0)
         # Pure diagonal
         assert octile_distance((0, 0), (5, 5)) == pytest.approx(5 * 1.414, rel=0.01)
-        # Mixed
-        dist = octile_distance((0, 0), (3, 5))
-        assert dist > 0
+        # Mixed: 3 diagonal steps plus 2 straight ones, in either orientation
+        expected = 2 + 3 * DIAGONAL_COST
+        assert octile_distance((0, 0), (3, 5)) == pytest.approx(expected)
+        assert octile_distance((5, 3), (0, 0)) == pytest.approx(expected)
+
+    def test_octile_matches_open_grid_path_cost(self):
+        """On an open grid octile distance is exactly the optimal path cost."""
+        grid = GridMap(12, 12)
+        astar = AStar(grid)
+        for goal in [(11, 0), (11, 11), (4, 9), (10, 3)]:
+            path = astar.find_path((0, 0), goal, heuristic=Heuristic.OCTILE)
+            assert path is not None
+            assert _path_cost(grid, path) == pytest.approx(
+                octile_distance((0, 0), goal)
+            )
+
+    def test_search_heuristics_match_public_functions(self):
+        """The coordinate-argument heuristics used by A* should agree."""
+        for heuristic, func in HEURISTIC_FUNCTIONS.items():
+            search_func = _HEURISTIC_XY[heuristic]
+            for start, goal in [((0, 0), (3, 4)), ((7, 2), (1, 9)), ((4, 4), (4, 4))]:
+                assert search_func(*start, *goal) == func(start, goal)
 
 
 class TestGridMap:
@@ -141,6 +173,70 @@ class TestGridMap:
         # Should not include NE diagonal (3, 1) because path is blocked
         assert (3, 1) not in neighbors
 
+    def test_get_neighbors_matches_is_walkable(self):
+        """Neighbor lists should follow is_walkable, including off the grid."""
+        rng = random.Random(3)
+        grid = GridMap(width=6, height=5)
+        for _ in range(10):
+            grid.add_obstacle(rng.randrange(6), rng.randrange(5))
+
+        for x in range(-1, 7):
+            for y in range(-1, 6):
+                expected = []
+                for dx, dy in itertools.product((-1, 0, 1), repeat=2):
+                    nx, ny = x + dx, y + dy
+                    if (dx, dy) == (0, 0) or not grid.is_walkable(nx, ny):
+                        continue
+                    if (
+                        dx
+                        and dy
+                        and not (grid.is_walkable(nx, y) and grid.is_walkable(x, ny))
+                    ):
+                        continue
+                    expected.append((nx, ny))
+
+                assert sorted(grid.get_neighbors(x, y)) == expected
+                assert sorted(grid.get_neighbors(x, y, allow_diagonal=False)) == [
+                    n for n in expected if n[0] == x or n[1] == y
+                ]
+
+    def test_walkable_array_view(self):
+        """The NumPy view should share storage with the walkability grid."""
+        grid = GridMap(width=4, height=3)
+        grid.add_obstacle(3, 1)
+        grid.remove_obstacle(9, 9)  # out of bounds is ignored
+
+        assert grid._walkable.shape == (3, 4)
+        assert grid._walkable[1, 3] == 0
+        assert int(grid._walkable.sum()) == 11
+        assert grid._blocked_rows == [0, 0b1000, 0]
+
+        grid.clear_obstacles()
+        assert grid._blocked_rows == [0, 0, 0]
+
+    def test_snapshot_is_isolated_and_read_only(self):
+        """Snapshots should freeze walkability and reject changes."""
+        grid = GridMap(width=6, height=4)
+        grid.add_obstacle(2, 1)
+        snap = grid.snapshot()
+
+        assert grid.snapshot() is snap  # unchanged grid reuses it
+        assert snap.version == grid.version == 1
+        assert not snap.is_walkable(2, 1)
+
+        grid.add_obstacle(3, 3)
+        grid.remove_obstacle(2, 1)
+
+        assert snap.is_walkable(3, 3) and not snap.is_walkable(2, 1)
+        assert snap._blocked_rows == [0, 0b100, 0, 0]
+        assert grid.snapshot() is not snap
+        assert grid.snapshot().is_walkable(2, 1)
+        assert AStar(snap).find_path((0, 1), (5, 1)) is not None
+        with pytest.raises(RuntimeError):
+            snap.add_obstacle(0, 0)
+        with pytest.raises(RuntimeError):
+            snap.clear_obstacles()
+
     def test_clear_obstacles(self):
         """Should clear all obstacles."""
         grid = GridMap(width=5, height=5)
@@ -331,6 +427,135 @@ class TestAStar:
         assert path[0] == (0, 0)
         assert path[-1] == (10, 10)
 
+    def test_path_is_optimal_and_connected(self):
+        """Found paths should be shortest and step only between valid cells."""
+        grid = GridMap(width=12, height=12)
+        for y in range(0, 10):
+            grid.add_obstacle(6, y)
+        pathfinder = AStar(grid)
+
+        path = pathfinder.find_path(start=(0, 0), goal=(11, 0))
+
+        assert path is not None
+        # Down to the gap at y=10, two steps through it, back up: 9 diagonal
+        # and 13 straight moves is the cheapest route around the wall
+        assert _path_cost(grid, path) == pytest.approx(9 * 1.414 + 13)
+
+    def test_bidirectional_matches_unidirectional_cost(self):
+        """Searching from both ends should find equally short paths."""
+        rng = random.Random(11)
+        for density in (0.0, 0.15, 0.3):
+            grid = GridMap(width=40, height=40)
+            for _ in range(int(1600 * density)):
+                grid.add_obstacle(rng.randrange(40), rng.randrange(40))
+            grid.remove_obstacle(0, 0)
+            grid.remove_obstacle(39, 39)
+            pathfinder = AStar(grid)
+
+            for allow_diagonal in (True, False):
+                path = pathfinder.find_path_bidirectional(
+                    (0, 0), (39, 39), Heuristic.OCTILE, allow_diagonal
+                )
+                expected = pathfinder._run(
+                    _astar_core, (0, 0), (39, 39), Heuristic.OCTILE, allow_diagonal
+                )
+                if expected is None:
+                    assert path is None
+                    continue
+                assert path is not None
+                assert path[0] == (0, 0) and path[-1] == (39, 39)
+                assert _path_cost(grid, path) == pytest.approx(
+                    _path_cost(grid, expected)
+                )
+
+    def test_bidirectional_prune_uses_live_frontier(self):
+        """Regression: a stale frontier bound must not prune the optimum."""
+        grid = GridMap(width=18, height=2)
+        for obstacle in ((2, 1), (4, 0), (17, 0)):
+            grid.add_obstacle(*obstacle)
+
+        path = AStar(grid).find_path(
+            (0, 0), (17, 1), Heuristic.MANHATTAN, allow_diagonal=False
+        )
+
+        assert path is not None
+        assert len(path) - 1 == 18
+
+    def test_replans_reuse_scratch_buffers(self):
+        """Back-to-back searches should share buffers without leaking state."""
+        rng = random.Random(5)
+        grid = GridMap(width=30, height=30)
+        pathfinder = AStar(grid)
+        pathfinder.find_path((0, 0), (29, 29))
+        scratch = pathfinder._scratch
+
+        for _ in range(20):
+            grid.add_obstacle(rng.randrange(1, 29), rng.randrange(1, 29))
+            for start, goal in [((0, 0), (29, 29)), ((3, 27), (8, 20))]:
+                for search in (_astar_core, _bidirectional_core):
+                    path = pathfinder._run(search, start, goal, Heuristic.OCTILE, True)
+                    fresh, _ = search(
+                        grid, start, goal, _HEURISTIC_XY[Heuristic.OCTILE], True
+                    )
+                    assert path == fresh
+
+        assert pathfinder._scratch is scratch
+
+        pathfinder.grid_map = GridMap(width=5, height=4)
+        assert pathfinder.find_path((0, 0), (4, 3)) is not None
+        assert pathfinder._scratch.size == 20
+
+    def test_find_paths_batch(self):
+        """Batched requests should match individual searches, in order."""
+        grid = GridMap(width=12, height=12)
+        for y in range(0, 10):
+            grid.add_obstacle(6, y)
+        pathfinder = AStar(grid)
+        starts = [(0, 0), (0, 0), (11, 11), (6, 0), (0, 0)]
+        goals = [(11, 0), (3, 3), (0, 11), (0, 0), (11, 0)]
+
+        paths = pathfinder.find_paths(starts, goals)
+
+        assert len(paths) == 5
+        for start, goal, path in zip(starts, goals, paths):
+            assert path == AStar(grid).find_path(start, goal)
+        assert paths[3] is None  # starts inside the wall
+        # Repeated requests get equal but independent lists
+        assert paths[4] == paths[0] and paths[4] is not paths[0]
+
+    def test_find_paths_length_mismatch(self):
+        """Starts and goals must pair up."""
+        pathfinder = AStar(GridMap(width=5, height=5))
+
+        with pytest.raises(ValueError):
+            pathfinder.find_paths([(0, 0), (1, 1)], [(4, 4)])
+
+    def test_long_search_to_sealed_goal_stops_early(self):
+        """A goal walled into a small room should fail without a full flood."""
+        grid = GridMap(width=60, height=60)
+        for i in range(50, 55):
+            for wall in (50, 54):
+                grid.add_obstacle(i, wall)
+                grid.add_obstacle(wall, i)
+        pathfinder = AStar(grid)
+
+        assert pathfinder.find_path((0, 0), (52, 52)) is None
+        assert pathfinder.last_iterations < 20
+
+
+def _path_cost(grid, path):
+    """Check that a path only takes legal steps and return its cost."""
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        assert max(abs(x1 - x0), abs(y1 - y0)) == 1
+        assert grid.is_walkable(x1, y1)
+        if x0 != x1 and y0 != y1:
+            assert grid.is_walkable(x1, y0) and grid.is_walkable(x0, y1)
+            cost += 1.414
+        else:
+            cost += 1.0
+    return cost
+
 
 class TestPathSmoothing:
     """Test path smoothing functionality."""
@@ -400,6 +625,22 @@ class TestPathSmoothing:
         # Can't go directly due to obstacle
         assert (1, 1) not in smoothed
 
+    def test_line_of_sight_matches_bresenham(self):
+        """Row-span line of sight should agree with the cell-by-cell walk."""
+        rng = random.Random(7)
+        # Wide and tall grids to exercise both shallow and steep lines
+        for width, height in [(70, 12), (12, 70)]:
+            grid = GridMap(width=width, height=height)
+            for _ in range(60):
+                grid.add_obstacle(rng.randrange(width), rng.randrange(height))
+
+            for _ in range(2000):
+                start = (rng.randrange(-2, width + 2), rng.randrange(-2, height + 2))
+                end = (rng.randrange(-2, width + 2), rng.randrange(-2, height + 2))
+                assert _has_line_of_sight(start, end, grid) == _bresenham_clear(
+                    start, end, grid
+                )
+
 
 class TestCoordinateConversion:
     """Test coordinate conversion utilities."""
@@ -464,6 +705,25 @@ class TestCoordinateConversion:
 
         assert world_path == []
 
+    def test_array_conversions_match_scalar(self):
+        """Batched conversions should agree with the per-point functions."""
+        path = [(0, 0), (3, 1), (7, 4)]
+        offset = Vector2(-40.0, 12.5)
+
+        points = path_to_world_array(path, 24.0, offset)
+        assert points.shape == (3, 2)
+        assert [Vector2(x, y) for x, y in points.tolist()] == path_to_world_coords(
+            path, 24.0, offset
+        )
+        assert path_to_world_array([], 24.0).shape == (0, 2)
+
+        positions = np.array([[0.0, 0.0], [100.0, 150.0], [-50.0, 31.9]])
+        cells = world_to_grid_array(positions, 32.0, offset)
+        expected = [
+            world_to_grid_coords(Vector2(x, y), 32.0, offset) for x, y in positions
+        ]
+        assert [tuple(cell) for cell in cells.tolist()] == expected
+
     def test_round_trip_conversion(self):
         """Converting world -> grid -> world should be consistent."""
         cell_size = 32.0
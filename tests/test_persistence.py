@@ -1,4 +1,11 @@
 import dataclasses
+import enum
+import json
+import math
+
+import pytest
+
+from pyguara.persistence import serializer as serializer_module
 from pyguara.persistence.serializer import Serializer, SerializationFormat
 from pyguara.common.types import Vector2, Color
 
@@ -54,3 +61,86 @@ def test_json_dataclass_roundtrip():
     assert res_dict["name"] == "Player"
     assert isinstance(res_dict["position"], Vector2)
     assert isinstance(res_dict["color"], Color)
+
+
+def test_json_nested_containers():
+    s = Serializer()
+    data = {
+        "path": [Vector2(1, 2), Vector2(3.5, 4)],
+        "palette": {"bg": Color(1, 2, 3), "tags": ["a", "b"]},
+        "count": 3,
+    }
+
+    res = s.deserialize(s.serialize(data, SerializationFormat.JSON))
+
+    assert res["path"] == [Vector2(1, 2), Vector2(3.5, 4)]
+    assert isinstance(res["path"][0], Vector2)
+    assert isinstance(res["palette"]["bg"], Color)
+    assert res["palette"]["tags"] == ["a", "b"]
+    assert res["count"] == 3
+
+
+def test_msgpack_roundtrip():
+    s = Serializer()
+    comp = TestComponent("Player", Vector2(1.5, -2), Color(10, 20, 30, 40))
+
+    data = s.serialize(comp, SerializationFormat.MSGPACK)
+    res_dict = s.deserialize(data, SerializationFormat.MSGPACK)
+
+    assert len(data) < len(s.serialize(comp, SerializationFormat.JSON))
+    assert res_dict["__type__"] == "TestComponent"
+    assert res_dict["position"] == Vector2(1.5, -2)
+    assert isinstance(res_dict["color"], Color)
+    assert res_dict["color"].a == 40
+
+
+def test_json_matches_without_orjson(monkeypatch):
+    s = Serializer()
+    data = {"spawn": Vector2(4, 5), "zones": [{"tint": Color(9, 8, 7)}]}
+    fast = s.serialize(data)
+
+    monkeypatch.setattr(serializer_module, "HAS_ORJSON", False)
+    slow = s.serialize(data)
+
+    assert json.loads(fast) == json.loads(slow)
+    assert s.deserialize(fast) == s.deserialize(slow)
+
+
+class Mood(enum.Enum):
+    CALM = "calm"
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_json_rejects_plain_enum_with_either_backend(monkeypatch, has_orjson):
+    monkeypatch.setattr(
+        serializer_module, "HAS_ORJSON", serializer_module.HAS_ORJSON and has_orjson
+    )
+    s = Serializer()
+
+    with pytest.raises(TypeError, match="Mood"):
+        s.serialize({"mood": Mood.CALM})
+
+
+def test_json_keeps_non_finite_floats():
+    s = Serializer()
+    data = {"hp": math.inf, "drain": -math.inf, "ratio": math.nan, "owner": None}
+
+    raw = s.serialize(data)
+    restored = s.deserialize(raw)
+
+    assert b"Infinity" in raw
+    assert restored["hp"] == math.inf
+    assert restored["drain"] == -math.inf
+    assert math.isnan(restored["ratio"])
+    assert restored["owner"] is None
+
+
+def test_json_loads_stdlib_non_finite_saves():
+    s = Serializer()
+    # As written by the stdlib-only serializer
+    raw = json.dumps({"hp": math.inf, "pos": {"__type__": "Vector2", "x": 1, "y": 2}})
+
+    restored = s.deserialize(raw.encode("utf-8"))
+
+    assert restored["hp"] == math.inf
+    assert restored["pos"] == Vector2(1, 2)
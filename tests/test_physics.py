@@ -89,3 +89,34 @@ def test_simulation_sync_kinematic(event_dispatcher):
 
     # Physics body should have moved to match ECS
     assert mock_body.position == Vector2(100, 100)
+
+
+def test_simulation_sync_mixed_body_types(event_dispatcher):
+    """Each body type should sync in its own direction within one update."""
+    mock_engine = MagicMock()
+    manager = EntityManager()
+    sys = PhysicsSystem(mock_engine, manager, event_dispatcher)
+
+    bodies = {}
+    transforms = {}
+    for body_type in (BodyType.DYNAMIC, BodyType.KINEMATIC, BodyType.STATIC):
+        body = MagicMock()
+        body.position = Vector2(1, 2)
+        body.rotation = 0.5
+        e = manager.create_entity()
+        transforms[body_type] = e.add_component(
+            Transform(position=Vector2(7, 8), rotation=0.25)
+        )
+        rb = e.add_component(RigidBody(body_type=body_type))
+        rb._body_handle = body
+        bodies[body_type] = body
+
+    sys.update(0.1)
+
+    assert transforms[BodyType.DYNAMIC].position == Vector2(1, 2)
+    assert transforms[BodyType.DYNAMIC].rotation == 0.5
+    assert bodies[BodyType.KINEMATIC].position == Vector2(7, 8)
+    assert bodies[BodyType.KINEMATIC].rotation == 0.25
+    assert transforms[BodyType.STATIC].position == Vector2(7, 8)
+    assert bodies[BodyType.STATIC].position == Vector2(1, 2)
+    mock_engine.update.assert_called_once_with(0.1)
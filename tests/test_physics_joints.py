@@ -1,7 +1,13 @@
 """Tests for physics joint system."""
 
+from dataclasses import dataclass
+from typing import Iterator
+
+import pytest
+
 from pyguara.common.components import Transform
 from pyguara.common.types import Vector2
+from pyguara.ecs.entity import Entity
 from pyguara.ecs.manager import EntityManager
 from pyguara.physics.backends.pymunk_impl import PymunkEngine
 from pyguara.physics.components import Collider, RigidBody
@@ -12,8 +18,30 @@ from pyguara.physics.joints import (
     create_slider_joint,
     create_spring_joint,
 )
+from pyguara.physics.protocols import IPhysicsBody
 from pyguara.physics.types import BodyType, JointType, ShapeType
 
+# Vector2 is an immutable tuple, so one zero vector serves every test.
+_ZERO = Vector2.zero()
+
+_ALL_JOINT_TYPES = frozenset(JointType)
+
+_JOINT_DEFAULTS = {
+    "anchor_a": _ZERO,
+    "anchor_b": _ZERO,
+    "min_distance": 0.0,
+    "max_distance": 0.0,
+    "stiffness": 0.0,
+    "damping": 0.0,
+    "max_force": 0.0,
+    "collide_connected": False,
+}
+
+
+def _joint_kwargs(**overrides):
+    """Return create_joint keyword arguments with the defaults filled in."""
+    return {**_JOINT_DEFAULTS, **overrides}
+
 
 class TestJointComponent:
     """Test Joint component creation and factory functions."""
@@ -22,10 +50,10 @@ class TestJointComponent:
         """Joint component should be created with default values."""
         joint = Joint()
 
-        assert joint.joint_type == JointType.PIN
+        assert joint.joint_type is JointType.PIN
         assert joint.target_entity_id == ""
-        assert joint.anchor_a == Vector2.zero()
-        assert joint.anchor_b == Vector2.zero()
+        assert joint.anchor_a == _ZERO
+        assert joint.anchor_b == _ZERO
         assert joint._joint_handle is None
 
     def test_create_pin_joint(self):
@@ -38,7 +66,7 @@ class TestJointComponent:
             collide_connected=True,
         )
 
-        assert joint.joint_type == JointType.PIN
+        assert joint.joint_type is JointType.PIN
         assert joint.target_entity_id == "target123"
         assert joint.anchor_a == Vector2(10, 20)
         assert joint.anchor_b == Vector2(30, 40)
@@ -51,7 +79,7 @@ class TestJointComponent:
             target_entity_id="target456", distance=100.0, max_force=500.0
         )
 
-        assert joint.joint_type == JointType.DISTANCE
+        assert joint.joint_type is JointType.DISTANCE
         assert joint.target_entity_id == "target456"
         assert joint.min_distance == 100.0
         assert joint.max_distance == 100.0
@@ -66,7 +94,7 @@ class TestJointComponent:
             damping=15.0,
         )
 
-        assert joint.joint_type == JointType.SPRING
+        assert joint.joint_type is JointType.SPRING
         assert joint.target_entity_id == "target789"
         assert joint.min_distance == 50.0
         assert joint.max_distance == 50.0
@@ -79,7 +107,7 @@ class TestJointComponent:
             target_entity_id="targetABC", min_distance=10.0, max_distance=100.0
         )
 
-        assert joint.joint_type == JointType.SLIDER
+        assert joint.joint_type is JointType.SLIDER
         assert joint.target_entity_id == "targetABC"
         assert joint.min_distance == 10.0
         assert joint.max_distance == 100.0
@@ -88,213 +116,140 @@ class TestJointComponent:
         """Joint factory functions should use default anchors."""
         joint = create_pin_joint(target_entity_id="test")
 
-        assert joint.anchor_a == Vector2.zero()
-        assert joint.anchor_b == Vector2.zero()
-
-
-class TestPymunkJointCreation:
-    """Test joint creation in pymunk backend."""
-
-    def setup_method(self):
-        """Set up physics engine and entities for testing."""
-        self.engine = PymunkEngine()
-        self.engine.initialize(Vector2(0, 0))  # No gravity for simpler tests
+        assert joint.anchor_a == _ZERO
+        assert joint.anchor_b == _ZERO
 
-        self.manager = EntityManager()
 
-        # Create two entities with physics bodies
-        self.entity_a = self.manager.create_entity()
-        self.entity_a.add_component(Transform(position=Vector2(100, 100)))
-        self.entity_a.add_component(RigidBody(mass=1.0, body_type=BodyType.DYNAMIC))
-        self.entity_a.add_component(
-            Collider(shape_type=ShapeType.CIRCLE, dimensions=[10])
-        )
+@dataclass
+class _JointWorld:
+    """A pymunk engine with two dynamic bodies ready to be jointed."""
 
-        self.entity_b = self.manager.create_entity()
-        self.entity_b.add_component(Transform(position=Vector2(200, 100)))
-        self.entity_b.add_component(RigidBody(mass=1.0, body_type=BodyType.DYNAMIC))
-        self.entity_b.add_component(
-            Collider(shape_type=ShapeType.CIRCLE, dimensions=[10])
-        )
+    engine: PymunkEngine
+    body_a: IPhysicsBody
+    body_b: IPhysicsBody
 
-        # Create physics bodies
-        self.body_a = self.engine.create_body(
-            self.entity_a.id, BodyType.DYNAMIC, Vector2(100, 100)
-        )
-        self.body_b = self.engine.create_body(
-            self.entity_b.id, BodyType.DYNAMIC, Vector2(200, 100)
-        )
 
-    def test_create_pin_joint_pymunk(self):
-        """Pymunk backend should create pin joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.PIN,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
-        )
+@pytest.fixture(scope="class")
+def shared_joint_world(pymunk_engine: PymunkEngine) -> Iterator[_JointWorld]:
+    """One body pair on the session engine, shared by every joint case."""
+    engine = pymunk_engine  # No gravity for simpler tests
 
-        assert joint_handle is not None
+    manager = EntityManager()
+    entity_a = manager.create_entity()
+    entity_b = manager.create_entity()
 
-    def test_create_distance_joint_pymunk(self):
-        """Pymunk backend should create distance joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.DISTANCE,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=100.0,
-            max_distance=100.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
-        )
+    yield _JointWorld(
+        engine=engine,
+        body_a=engine.create_body(entity_a.id, BodyType.DYNAMIC, Vector2(100, 100)),
+        body_b=engine.create_body(entity_b.id, BodyType.DYNAMIC, Vector2(200, 100)),
+    )
+    engine.clear_world()
 
-        assert joint_handle is not None
 
-    def test_create_spring_joint_pymunk(self):
-        """Pymunk backend should create spring joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.SPRING,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=100.0,
-            max_distance=100.0,
-            stiffness=200.0,
-            damping=10.0,
-            max_force=0.0,
-            collide_connected=False,
-        )
+@pytest.fixture
+def joint_world(shared_joint_world: _JointWorld) -> Iterator[_JointWorld]:
+    """Shared joint world, with any joints a test left behind removed."""
+    yield shared_joint_world
+    space = shared_joint_world.engine.space
+    if space is not None:
+        for constraint in list(space.constraints):
+            shared_joint_world.engine.destroy_joint(constraint)
 
-        assert joint_handle is not None
 
-    def test_create_slider_joint_pymunk(self):
-        """Pymunk backend should create slider joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.SLIDER,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=50.0,
-            max_distance=150.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
-        )
-
-        assert joint_handle is not None
-
-    def test_create_gear_joint_pymunk(self):
-        """Pymunk backend should create gear joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.GEAR,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
-        )
-
-        assert joint_handle is not None
+class TestPymunkJointCreation:
+    """Test joint creation in pymunk backend."""
 
-    def test_create_motor_joint_pymunk(self):
-        """Pymunk backend should create motor joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.MOTOR,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
+    # Keep the class on one xdist worker under --dist loadgroup so the shared
+    # engine fixture is built once rather than once per worker.
+    pytestmark = pytest.mark.xdist_group("pymunk_joint")
+
+    @pytest.mark.parametrize(
+        (
+            "joint_type",
+            "min_distance",
+            "max_distance",
+            "stiffness",
+            "damping",
+            "expected_cls",
+        ),
+        [
+            (JointType.PIN, 0.0, 0.0, 0.0, 0.0, "PinJoint"),
+            # A fixed distance is modelled as a very stiff spring
+            (JointType.DISTANCE, 100.0, 100.0, 0.0, 0.0, "DampedSpring"),
+            (JointType.DISTANCE, 50.0, 100.0, 0.0, 0.0, "SlideJoint"),
+            (JointType.SPRING, 100.0, 100.0, 200.0, 10.0, "DampedSpring"),
+            (JointType.SLIDER, 50.0, 150.0, 0.0, 0.0, "SlideJoint"),
+            (JointType.GEAR, 0.0, 0.0, 0.0, 0.0, "GearJoint"),
+            (JointType.MOTOR, 0.0, 0.0, 0.0, 0.0, "SimpleMotor"),
+        ],
+    )
+    def test_create_joint_pymunk(
+        self,
+        joint_world,
+        joint_type,
+        min_distance,
+        max_distance,
+        stiffness,
+        damping,
+        expected_cls,
+    ):
+        """Pymunk backend should map every joint type to its constraint."""
+        joint_handle = joint_world.engine.create_joint(
+            joint_world.body_a,
+            joint_world.body_b,
+            **_joint_kwargs(
+                joint_type=joint_type,
+                min_distance=min_distance,
+                max_distance=max_distance,
+                stiffness=stiffness,
+                damping=damping,
+            ),
         )
 
-        assert joint_handle is not None
+        assert type(joint_handle).__name__ == expected_cls
+        assert joint_handle in joint_world.engine.space.constraints
 
-    def test_joint_with_max_force(self):
+    def test_joint_with_max_force(self, joint_world):
         """Joints should support max force limits."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.PIN,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=1000.0,
-            collide_connected=False,
+        joint_handle = joint_world.engine.create_joint(
+            joint_world.body_a,
+            joint_world.body_b,
+            **_joint_kwargs(joint_type=JointType.PIN, max_force=1000.0),
         )
 
         assert joint_handle is not None
         assert joint_handle.max_force == 1000.0
 
-    def test_joint_collide_connected(self):
+    def test_joint_collide_connected(self, joint_world):
         """Joints should support collide_connected flag."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.PIN,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=True,
+        joint_handle = joint_world.engine.create_joint(
+            joint_world.body_a,
+            joint_world.body_b,
+            **_joint_kwargs(joint_type=JointType.PIN, collide_connected=True),
         )
 
         assert joint_handle is not None
         # Pymunk uses 1/0 instead of True/False
         assert joint_handle.collide_bodies == 1
 
-    def test_destroy_joint(self):
+    def test_destroy_joint(self, joint_world):
         """Engine should destroy joints."""
-        joint_handle = self.engine.create_joint(
-            body_a=self.body_a,
-            body_b=self.body_b,
-            joint_type=JointType.PIN,
-            anchor_a=Vector2.zero(),
-            anchor_b=Vector2.zero(),
-            min_distance=0.0,
-            max_distance=0.0,
-            stiffness=0.0,
-            damping=0.0,
-            max_force=0.0,
-            collide_connected=False,
+        joint_handle = joint_world.engine.create_joint(
+            joint_world.body_a,
+            joint_world.body_b,
+            **_joint_kwargs(joint_type=JointType.PIN),
         )
 
+        assert joint_handle in joint_world.engine.space.constraints
+
         # Should not raise
-        self.engine.destroy_joint(joint_handle)
+        joint_world.engine.destroy_joint(joint_handle)
+        assert joint_handle not in joint_world.engine.space.constraints
 
-    def test_destroy_none_joint(self):
+    def test_destroy_none_joint(self, joint_world):
         """destroy_joint should handle None gracefully."""
         # Should not raise
-        self.engine.destroy_joint(None)
+        joint_world.engine.destroy_joint(None)
 
 
 class TestJointTypes:
@@ -302,7 +257,7 @@ class TestJointTypes:
 
     def test_all_joint_types_in_enum(self):
         """JointType enum should have all expected types."""
-        expected_types = {
+        assert _ALL_JOINT_TYPES == {
             JointType.PIN,
             JointType.DISTANCE,
             JointType.SPRING,
@@ -311,31 +266,43 @@ class TestJointTypes:
             JointType.MOTOR,
         }
 
-        actual_types = set(JointType)
-
-        assert actual_types == expected_types
-
     def test_joint_type_enum_values(self):
         """JointType enum values should be distinct."""
-        types = list(JointType)
-        assert len(types) == len(set(types))
+        assert len(list(JointType)) == len(_ALL_JOINT_TYPES)
+
+
+@pytest.fixture
+def manager() -> EntityManager:
+    """Provide an empty entity manager."""
+    return EntityManager()
+
+
+def _body_entity(
+    manager: EntityManager,
+    position: Vector2,
+    mass: float = 1.0,
+    body_type: BodyType = BodyType.DYNAMIC,
+    radius: float | None = None,
+) -> Entity:
+    """Create an entity with a transform, rigid body and optional circle."""
+    entity = manager.create_entity()
+    entity.add_component(Transform(position=position))
+    entity.add_component(RigidBody(mass=mass, body_type=body_type))
+    if radius is not None:
+        entity.add_component(Collider(shape_type=ShapeType.CIRCLE, dimensions=[radius]))
+    return entity
 
 
 class TestJointUsagePatterns:
     """Test practical joint usage patterns."""
 
-    def test_rope_segment_pattern(self):
+    def test_rope_segment_pattern(self, manager):
         """Joint components can form rope-like structures."""
-        manager = EntityManager()
-
         # Create rope segments
-        segments = []
-        for i in range(3):
-            segment = manager.create_entity()
-            segment.add_component(Transform(position=Vector2(100, 100 + i * 20)))
-            segment.add_component(RigidBody(mass=0.5, body_type=BodyType.DYNAMIC))
-            segment.add_component(Collider(shape_type=ShapeType.CIRCLE, dimensions=[5]))
-            segments.append(segment)
+        segments = [
+            _body_entity(manager, Vector2(100, 100 + i * 20), mass=0.5, radius=5)
+            for i in range(3)
+        ]
 
         # Connect segments with distance joints
         for i in range(len(segments) - 1):
@@ -349,17 +316,10 @@ class TestJointUsagePatterns:
         assert segments[1].has_component(Joint)
         assert not segments[2].has_component(Joint)
 
-    def test_hinge_pattern(self):
+    def test_hinge_pattern(self, manager):
         """Pin joints can create hinges."""
-        manager = EntityManager()
-
-        door = manager.create_entity()
-        door.add_component(Transform(position=Vector2(200, 200)))
-        door.add_component(RigidBody(mass=5.0, body_type=BodyType.DYNAMIC))
-
-        wall = manager.create_entity()
-        wall.add_component(Transform(position=Vector2(150, 200)))
-        wall.add_component(RigidBody(body_type=BodyType.STATIC))
+        door = _body_entity(manager, Vector2(200, 200), mass=5.0)
+        wall = _body_entity(manager, Vector2(150, 200), body_type=BodyType.STATIC)
 
         # Create hinge joint
         hinge = create_pin_joint(
@@ -371,19 +331,12 @@ class TestJointUsagePatterns:
 
         assert door.has_component(Joint)
         joint = door.get_component(Joint)
-        assert joint.joint_type == JointType.PIN
+        assert joint.joint_type is JointType.PIN
 
-    def test_spring_suspension_pattern(self):
+    def test_spring_suspension_pattern(self, manager):
         """Spring joints can create suspension systems."""
-        manager = EntityManager()
-
-        chassis = manager.create_entity()
-        chassis.add_component(Transform(position=Vector2(300, 200)))
-        chassis.add_component(RigidBody(mass=10.0, body_type=BodyType.DYNAMIC))
-
-        wheel = manager.create_entity()
-        wheel.add_component(Transform(position=Vector2(300, 250)))
-        wheel.add_component(RigidBody(mass=1.0, body_type=BodyType.DYNAMIC))
+        chassis = _body_entity(manager, Vector2(300, 200), mass=10.0)
+        wheel = _body_entity(manager, Vector2(300, 250))
 
         # Create spring suspension
         suspension = create_spring_joint(
@@ -396,6 +349,6 @@ class TestJointUsagePatterns:
 
         assert wheel.has_component(Joint)
         joint = wheel.get_component(Joint)
-        assert joint.joint_type == JointType.SPRING
+        assert joint.joint_type is JointType.SPRING
         assert joint.stiffness == 300.0
         assert joint.damping == 25.0
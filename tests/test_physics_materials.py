@@ -1,10 +1,41 @@
 """Tests for physics material presets."""
 
+import math
+from operator import attrgetter
+
+import numpy as np
 import pytest
 
 from pyguara.physics.materials import Materials, MaterialConstants
 from pyguara.physics.types import PhysicsMaterial
 
+_ALL_MATERIALS = (
+    Materials.DEFAULT,
+    Materials.WOOD,
+    Materials.METAL,
+    Materials.STONE,
+    Materials.RUBBER,
+    Materials.ICE,
+    Materials.GLASS,
+    Materials.SUPER_BALL,
+    Materials.PLAYER,
+    Materials.GROUND,
+)
+
+# (name, friction, restitution, density) for every preset
+_PRESETS = [
+    ("DEFAULT", 0.5, 0.0, 1.0),  # balanced
+    ("WOOD", 0.6, 0.3, 0.7),  # moderate friction, slight bounce
+    ("METAL", 0.4, 0.2, 8.0),  # lower friction, high density
+    ("STONE", 0.8, 0.1, 2.5),  # high friction, low bounce
+    ("RUBBER", 0.9, 0.8, 1.1),  # high friction and bounce
+    ("ICE", 0.05, 0.1, 0.9),  # very slippery
+    ("GLASS", 0.1, 0.7, 2.4),  # low friction, high bounce
+    ("SUPER_BALL", 0.6, 0.95, 1.0),  # extremely bouncy
+    ("PLAYER", 0.7, 0.0, 1.0),  # good traction, no bounce
+    ("GROUND", 0.7, 0.0, 0.0),  # good traction, no bounce, zero density
+]
+
 
 class TestMaterialPresets:
     """Test material preset definitions and properties."""
@@ -14,76 +45,12 @@ class TestMaterialPresets:
         assert Materials is not None
         assert isinstance(Materials, MaterialConstants)
 
-    def test_default_material(self):
-        """DEFAULT material should have balanced properties."""
-        mat = Materials.DEFAULT
-        assert isinstance(mat, PhysicsMaterial)
-        assert mat.friction == 0.5
-        assert mat.restitution == 0.0
-        assert mat.density == 1.0
-
-    def test_wood_material(self):
-        """WOOD material should have moderate friction and slight bounce."""
-        mat = Materials.WOOD
-        assert mat.friction == 0.6
-        assert mat.restitution == 0.3
-        assert mat.density == 0.7
-
-    def test_metal_material(self):
-        """METAL material should have lower friction, high density."""
-        mat = Materials.METAL
-        assert mat.friction == 0.4
-        assert mat.restitution == 0.2
-        assert mat.density == 8.0
-
-    def test_stone_material(self):
-        """STONE material should have high friction, low bounce."""
-        mat = Materials.STONE
-        assert mat.friction == 0.8
-        assert mat.restitution == 0.1
-        assert mat.density == 2.5
-
-    def test_rubber_material(self):
-        """RUBBER material should have high friction and bounce."""
-        mat = Materials.RUBBER
-        assert mat.friction == 0.9
-        assert mat.restitution == 0.8
-        assert mat.density == 1.1
-
-    def test_ice_material(self):
-        """ICE material should be very slippery (low friction)."""
-        mat = Materials.ICE
-        assert mat.friction == 0.05
-        assert mat.restitution == 0.1
-        assert mat.density == 0.9
-
-    def test_glass_material(self):
-        """GLASS material should have low friction, high bounce."""
-        mat = Materials.GLASS
-        assert mat.friction == 0.1
-        assert mat.restitution == 0.7
-        assert mat.density == 2.4
-
-    def test_super_ball_material(self):
-        """SUPER_BALL material should be extremely bouncy."""
-        mat = Materials.SUPER_BALL
-        assert mat.friction == 0.6
-        assert mat.restitution == 0.95
-        assert mat.density == 1.0
-
-    def test_player_material(self):
-        """PLAYER material should have good traction, no bounce."""
-        mat = Materials.PLAYER
-        assert mat.friction == 0.7
-        assert mat.restitution == 0.0
-        assert mat.density == 1.0
-
-    def test_ground_material(self):
-        """GROUND material should have good traction, no bounce, zero density."""
-        mat = Materials.GROUND
-        assert mat.friction == 0.7
-        assert mat.restitution == 0.0
-        assert mat.density == 0.0
+    @pytest.mark.parametrize(("name", "friction", "restitution", "density"), _PRESETS)
+    def test_preset_values(self, name, friction, restitution, density):
+        """Each preset should carry its documented physical properties."""
+        mat = getattr(Materials, name)
+        expected = (friction, restitution, density)
+        assert (mat.friction, mat.restitution, mat.density) == expected
 
     def test_material_instances_are_independent(self):
         """Material preset instances should be independent objects."""
@@ -97,45 +64,25 @@ class TestMaterialPresets:
 
     def test_materials_have_unique_properties(self):
         """Each material should have distinct properties."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        # Check that at least some materials differ
-        frictions = {mat.friction for mat in materials}
-        restitutions = {mat.restitution for mat in materials}
-        densities = {mat.density for mat in materials}
+        # Check that at least some materials differ: one row per preset,
+        # columns are friction, restitution, density
+        props = np.array(
+            [(mat.friction, mat.restitution, mat.density) for mat in _ALL_MATERIALS]
+        )
 
-        assert len(frictions) > 5, "Materials should have varied friction values"
-        assert len(restitutions) > 3, "Materials should have varied restitution values"
-        assert len(densities) > 5, "Materials should have varied density values"
+        assert np.unique(props[:, 0]).size > 5, (
+            "Materials should have varied friction values"
+        )
+        assert np.unique(props[:, 1]).size > 3, (
+            "Materials should have varied restitution values"
+        )
+        assert np.unique(props[:, 2]).size > 5, (
+            "Materials should have varied density values"
+        )
 
     def test_material_instances_are_physics_materials(self):
-        """All preset materials should be PhysicsMaterial instances."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert isinstance(mat, PhysicsMaterial)
+        """All preset materials should be plain PhysicsMaterial instances."""
+        assert all(type(mat) is PhysicsMaterial for mat in _ALL_MATERIALS)
 
 
 class TestMaterialUsage:
@@ -191,109 +138,29 @@ class TestMaterialUsage:
 class TestMaterialPhysicsRealism:
     """Test that material properties follow physical realism."""
 
-    def test_friction_values_in_valid_range(self):
-        """All friction values should be in valid range [0, 1+]."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert 0.0 <= mat.friction <= 1.0, f"Invalid friction: {mat.friction}"
-
-    def test_restitution_values_in_valid_range(self):
-        """All restitution values should be in valid range [0, 1]."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert 0.0 <= mat.restitution <= 1.0, (
-                f"Invalid restitution: {mat.restitution}"
-            )
-
-    def test_density_values_are_non_negative(self):
-        """All density values should be non-negative."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert mat.density >= 0.0, f"Invalid density: {mat.density}"
+    @pytest.mark.parametrize(
+        ("attr", "lo", "hi"),
+        [
+            ("friction", 0.0, 1.0),
+            ("restitution", 0.0, 1.0),
+            ("density", 0.0, math.inf),
+        ],
+    )
+    def test_property_values_in_valid_range(self, attr, lo, hi):
+        """Friction and restitution lie in [0, 1]; density is non-negative."""
+        for mat in _ALL_MATERIALS:
+            value = getattr(mat, attr)
+            assert lo <= value <= hi, f"Invalid {attr}: {value}"
 
     def test_ice_is_slipperiest(self):
         """ICE should have the lowest friction among all materials."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert Materials.ICE.friction <= mat.friction
+        assert min(_ALL_MATERIALS, key=attrgetter("friction")) is Materials.ICE
 
     def test_super_ball_is_bounciest(self):
         """SUPER_BALL should have the highest restitution."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.METAL,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert Materials.SUPER_BALL.restitution >= mat.restitution
+        bounciest = max(_ALL_MATERIALS, key=attrgetter("restitution"))
+        assert bounciest is Materials.SUPER_BALL
 
     def test_metal_has_highest_density(self):
         """METAL should have the highest density among all materials."""
-        materials = [
-            Materials.DEFAULT,
-            Materials.WOOD,
-            Materials.STONE,
-            Materials.RUBBER,
-            Materials.ICE,
-            Materials.GLASS,
-            Materials.SUPER_BALL,
-            Materials.PLAYER,
-            Materials.GROUND,
-        ]
-
-        for mat in materials:
-            assert Materials.METAL.density >= mat.density
+        assert max(_ALL_MATERIALS, key=attrgetter("density")) is Materials.METAL
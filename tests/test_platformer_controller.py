@@ -1,5 +1,7 @@
 """Tests for platformer controller system."""
 
+import pytest
+
 from pyguara.common.components import Transform
 from pyguara.common.types import Vector2
 from pyguara.ecs.manager import EntityManager
@@ -10,12 +12,32 @@ from pyguara.physics.platformer_system import PlatformerSystem
 from pyguara.physics.types import BodyType, ShapeType
 
 
+class _StubBody:
+    """Minimal stand-in for a physics body handle."""
+
+    def __init__(self):
+        """Start at rest."""
+        self.velocity = Vector2(0, 0)
+
+
+@pytest.fixture(scope="module")
+def default_controller():
+    """A default controller for tests that only read it; do not mutate."""
+    return PlatformerController()
+
+
+@pytest.fixture
+def controller():
+    """Provide a fresh default controller."""
+    return PlatformerController()
+
+
 class TestPlatformerControllerComponent:
     """Test PlatformerController component."""
 
-    def test_controller_creation(self):
+    def test_controller_creation(self, default_controller):
         """PlatformerController should be created with default values."""
-        controller = PlatformerController()
+        controller = default_controller
 
         assert controller.move_speed == 200.0
         assert controller.jump_force == 400.0
@@ -24,6 +46,13 @@ class TestPlatformerControllerComponent:
         assert controller.wall_slide_enabled is True
         assert controller.wall_jump_enabled is True
 
+    def test_controller_is_slotted(self, controller):
+        """Controller state lives in slots, so typos cannot add attributes."""
+        assert not hasattr(controller, "__dict__")
+        assert controller.entity is None
+        with pytest.raises(AttributeError):
+            controller.is_grounded_typo = True
+
     def test_controller_custom_values(self):
         """PlatformerController can be created with custom parameters."""
         controller = PlatformerController(
@@ -38,85 +67,66 @@ class TestPlatformerControllerComponent:
         assert controller.coyote_time == 0.2
         assert controller.wall_slide_enabled is False
 
-    def test_move_left(self):
-        """move_left should set move input and facing."""
-        controller = PlatformerController()
-        controller.move_left()
-
-        assert controller.move_input == -1.0
-        assert controller.facing_right is False
-
-    def test_move_right(self):
-        """move_right should set move input and facing."""
-        controller = PlatformerController()
-        controller.move_right()
-
-        assert controller.move_input == 1.0
-        assert controller.facing_right is True
-
-    def test_stop_move(self):
-        """stop_move should reset move input."""
-        controller = PlatformerController()
-        controller.move_right()
-        controller.stop_move()
-
-        assert controller.move_input == 0.0
-
-    def test_jump_request(self):
+    @pytest.mark.parametrize(
+        ("calls", "expected_input", "expected_facing_right"),
+        [
+            (("move_left",), -1.0, False),
+            (("move_right",), 1.0, True),
+            (("move_right", "stop_move"), 0.0, True),  # stop keeps facing
+        ],
+    )
+    def test_move_setters(
+        self, controller, calls, expected_input, expected_facing_right
+    ):
+        """Move setters should update move input and facing."""
+        for name in calls:
+            getattr(controller, name)()
+
+        assert controller.move_input == expected_input
+        assert controller.facing_right is expected_facing_right
+
+    def test_jump_request(self, controller):
         """jump should request a jump and set buffer timer."""
-        controller = PlatformerController()
         controller.jump()
 
         assert controller._jump_requested is True
         assert controller.jump_buffer_timer > 0
 
-    def test_can_jump_when_grounded(self):
-        """can_jump should return True when grounded."""
-        controller = PlatformerController()
-        controller.is_grounded = True
-
-        assert controller.can_jump() is True
-
-    def test_can_jump_in_coyote_time(self):
-        """can_jump should return True during coyote time."""
-        controller = PlatformerController()
-        controller.is_grounded = False
-        controller.coyote_timer = 0.1
-
-        assert controller.can_jump() is True
-
-    def test_cannot_jump_airborne(self):
-        """can_jump should return False when airborne without coyote time."""
-        controller = PlatformerController()
-        controller.is_grounded = False
-        controller.coyote_timer = 0.0
-
-        assert controller.can_jump() is False
-
-    def test_can_wall_jump_left(self):
-        """can_wall_jump should return True when on left wall."""
-        controller = PlatformerController()
-        controller.on_wall_left = True
-
-        assert controller.can_wall_jump() is True
-
-    def test_can_wall_jump_right(self):
-        """can_wall_jump should return True when on right wall."""
-        controller = PlatformerController()
-        controller.on_wall_right = True
-
-        assert controller.can_wall_jump() is True
-
-    def test_cannot_wall_jump_when_disabled(self):
-        """can_wall_jump should return False when wall jumping is disabled."""
-        controller = PlatformerController(wall_jump_enabled=False)
-        controller.on_wall_left = True
-
-        assert controller.can_wall_jump() is False
-
-    def test_is_wall_sliding(self):
+    @pytest.mark.parametrize(
+        ("grounded", "coyote_timer", "expected"),
+        [
+            (True, 0.0, True),  # on the ground
+            (False, 0.1, True),  # just left a ledge, still in coyote time
+            (False, 0.0, False),  # airborne and coyote time expired
+        ],
+    )
+    def test_can_jump(self, grounded, coyote_timer, expected):
+        """can_jump should allow grounded or coyote-time jumps only."""
+        controller = PlatformerController(coyote_time=0.15)
+        controller.is_grounded = grounded
+        controller.coyote_timer = coyote_timer
+
+        assert controller.can_jump() is expected
+
+    @pytest.mark.parametrize(
+        ("on_left", "on_right", "enabled", "expected"),
+        [
+            (True, False, True, True),
+            (False, True, True, True),
+            (False, False, True, False),
+            (True, False, False, False),  # wall jumping disabled
+        ],
+    )
+    def test_can_wall_jump(self, on_left, on_right, enabled, expected):
+        """can_wall_jump needs a wall contact and wall jumping enabled."""
+        controller = PlatformerController(wall_jump_enabled=enabled)
+        controller.on_wall_left = on_left
+        controller.on_wall_right = on_right
+
+        assert controller.can_wall_jump() is expected
+
+    def test_is_wall_sliding(self, controller):
         """is_wall_sliding should check current state."""
-        controller = PlatformerController()
         controller.current_state = PlatformerState.WALL_SLIDE
 
         assert controller.is_wall_sliding() is True
@@ -124,9 +134,8 @@ class TestPlatformerControllerComponent:
         controller.current_state = PlatformerState.GROUNDED
         assert controller.is_wall_sliding() is False
 
-    def test_reset_jump_state(self):
+    def test_reset_jump_state(self, controller):
         """reset_jump_state should clear jump-related state."""
-        controller = PlatformerController()
         controller._jump_requested = True
         controller.jump_buffer_timer = 0.1
         controller.coyote_timer = 0.1
@@ -141,11 +150,21 @@ class TestPlatformerControllerComponent:
 class TestPlatformerSystem:
     """Test PlatformerSystem integration."""
 
+    @classmethod
+    def setup_class(cls):
+        """Create one physics engine for the whole class."""
+        cls.physics_engine = PymunkEngine()
+        cls.physics_engine.initialize(Vector2(0, 980))  # Gravity
+
+    @classmethod
+    def teardown_class(cls):
+        """Release the shared physics engine."""
+        cls.physics_engine.cleanup()
+
     def setup_method(self):
-        """Set up test environment."""
+        """Start each test with no entities and an empty physics world."""
+        self.physics_engine.clear_world()
         self.manager = EntityManager()
-        self.physics_engine = PymunkEngine()
-        self.physics_engine.initialize(Vector2(0, 980))  # Gravity
         self.platformer_system = PlatformerSystem(self.manager, self.physics_engine)
 
     def test_system_creation(self):
@@ -179,11 +198,8 @@ class TestPlatformerSystem:
         controller.jump_buffer_timer = 0.1
         entity.add_component(controller)
 
-        # Create physics body
-        body = self.physics_engine.create_body(
-            entity.id, BodyType.DYNAMIC, Vector2(100, 100)
-        )
-        entity.get_component(RigidBody)._body_handle = body
+        # The system only reads and writes velocity on the body handle
+        entity.get_component(RigidBody)._body_handle = _StubBody()
 
         # Update system
         dt = 1 / 60  # 60 FPS
@@ -203,11 +219,8 @@ class TestPlatformerSystem:
         controller.move_right()
         entity.add_component(controller)
 
-        # Create physics body
-        body = self.physics_engine.create_body(
-            entity.id, BodyType.DYNAMIC, Vector2(100, 100)
-        )
-        entity.get_component(RigidBody)._body_handle = body
+        # The system only reads and writes velocity on the body handle
+        entity.get_component(RigidBody)._body_handle = _StubBody()
 
         # Update system
         self.platformer_system.update(1 / 60)
@@ -216,57 +229,60 @@ class TestPlatformerSystem:
         controller = entity.get_component(PlatformerController)
         assert controller.move_input == 0.0
 
-
-class TestPlatformerStates:
-    """Test state transitions."""
-
-    def test_grounded_state(self):
-        """Controller should be in GROUNDED state when on ground."""
+    def test_update_drives_physics_body(self):
+        """System should steer a real pymunk body through its handle."""
+        entity = self.manager.create_entity()
+        entity.add_component(Transform(position=Vector2(100, 100)))
+        entity.add_component(RigidBody(body_type=BodyType.DYNAMIC))
         controller = PlatformerController()
-        controller.is_grounded = True
-        controller.current_state = PlatformerState.GROUNDED
+        controller.move_right()
+        entity.add_component(controller)
 
-        assert controller.current_state == PlatformerState.GROUNDED
+        body = self.physics_engine.create_body(
+            entity.id, BodyType.DYNAMIC, Vector2(100, 100)
+        )
+        entity.get_component(RigidBody)._body_handle = body
 
-    def test_airborne_state(self):
-        """Controller should be in AIRBORNE state when in air."""
-        controller = PlatformerController()
-        controller.is_grounded = False
-        controller.on_wall_left = False
-        controller.on_wall_right = False
-        controller.current_state = PlatformerState.AIRBORNE
+        self.platformer_system.update(1 / 60)
 
-        assert controller.current_state == PlatformerState.AIRBORNE
+        # Airborne (no ground in the world), so air control scales the push
+        expected_x = controller.move_speed * controller.air_control
+        expected_x *= controller.acceleration
+        assert controller.current_state is PlatformerState.AIRBORNE
+        assert body.velocity.x == pytest.approx(expected_x)
 
-    def test_wall_slide_state(self):
-        """Controller should be in WALL_SLIDE state when on wall."""
-        controller = PlatformerController()
-        controller.is_grounded = False
-        controller.on_wall_left = True
-        controller.current_state = PlatformerState.WALL_SLIDE
 
-        assert controller.current_state == PlatformerState.WALL_SLIDE
+class TestPlatformerStates:
+    """Test state transitions."""
+
+    @pytest.mark.parametrize(
+        ("grounded", "on_left", "on_right", "slide_enabled", "expected"),
+        [
+            (True, False, False, True, PlatformerState.GROUNDED),
+            (True, True, False, True, PlatformerState.GROUNDED),  # ground wins
+            (False, False, False, True, PlatformerState.AIRBORNE),
+            (False, True, False, True, PlatformerState.WALL_SLIDE),
+            (False, False, True, True, PlatformerState.WALL_SLIDE),
+            (False, True, False, False, PlatformerState.AIRBORNE),
+        ],
+    )
+    def test_state_from_contacts(
+        self, grounded, on_left, on_right, slide_enabled, expected
+    ):
+        """The system should derive the state from ground and wall contacts."""
+        controller = PlatformerController(wall_slide_enabled=slide_enabled)
+        controller.is_grounded = grounded
+        controller.on_wall_left = on_left
+        controller.on_wall_right = on_right
+
+        PlatformerSystem(EntityManager(), PymunkEngine())._update_state(controller)
+
+        assert controller.current_state is expected
 
 
 class TestCoyoteTime:
     """Test coyote time mechanics."""
 
-    def test_coyote_time_allows_jump(self):
-        """Character can jump during coyote time after leaving ground."""
-        controller = PlatformerController(coyote_time=0.15)
-        controller.is_grounded = False
-        controller.coyote_timer = 0.10  # Still in coyote time
-
-        assert controller.can_jump() is True
-
-    def test_coyote_time_expires(self):
-        """Character cannot jump after coyote time expires."""
-        controller = PlatformerController(coyote_time=0.15)
-        controller.is_grounded = False
-        controller.coyote_timer = 0.0  # Coyote time expired
-
-        assert controller.can_jump() is False
-
     def test_coyote_timer_decreases(self):
         """Coyote timer should decrease over time."""
         # This is tested indirectly through the system test_timer_updates
@@ -300,20 +316,6 @@ class TestWallMechanics:
 
         assert controller.on_wall_left is True
 
-    def test_wall_jump_from_left_wall(self):
-        """Wall jump from left wall should jump right."""
-        controller = PlatformerController()
-        controller.on_wall_left = True
-
-        assert controller.can_wall_jump() is True
-
-    def test_wall_jump_from_right_wall(self):
-        """Wall jump from right wall should jump left."""
-        controller = PlatformerController()
-        controller.on_wall_right = True
-
-        assert controller.can_wall_jump() is True
-
     def test_wall_slide_disabled(self):
         """Wall mechanics can be disabled."""
         controller = PlatformerController(wall_slide_enabled=False)
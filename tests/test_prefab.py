@@ -1,9 +1,8 @@
 """Tests for the prefab system."""
 
 import json
+import logging
 import pytest
-import tempfile
-from pathlib import Path
 
 from pyguara.common.components import Transform, Tag
 from pyguara.ecs.manager import EntityManager
@@ -12,25 +11,48 @@ from pyguara.prefabs.loader import PrefabLoader, PrefabCache, Prefab
 from pyguara.prefabs.registry import ComponentRegistry
 from pyguara.prefabs.types import PrefabData, PrefabChild
 
-
-@pytest.fixture
+_SIMPLE_PREFAB = PrefabData(
+    name="SimpleEntity",
+    components={
+        "Transform": {"position": {"x": 100, "y": 200}},
+        "Tag": {"name": "player"},
+    },
+)
+
+_PARENT_PREFAB = PrefabData(
+    name="Parent",
+    components={
+        "Transform": {"position": {"x": 10, "y": 10}, "rotation": 45.0},
+    },
+)
+
+_CHILD_PREFAB = PrefabData(
+    name="Child",
+    extends="parent.prefab.json",
+    components={
+        "Transform": {"position": {"x": 100, "y": 100}},  # Override position
+    },
+)
+
+
+@pytest.fixture(scope="module")
 def component_registry():
-    """Create a component registry with common components."""
+    """Create a component registry with common components (read-only)."""
     registry = ComponentRegistry()
     registry.register(Transform)
     registry.register(Tag)
     return registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def entity_manager():
-    """Create an entity manager."""
+    """Create an entity manager shared by the module's factory tests."""
     return EntityManager()
 
 
 @pytest.fixture
 def prefab_factory(entity_manager, component_registry):
-    """Create a prefab factory."""
+    """Create a prefab factory (per test, since resolvers are set on it)."""
     return PrefabFactory(entity_manager, component_registry)
 
 
@@ -68,11 +90,16 @@ class TestComponentRegistry:
         assert "Transform" in components
         assert "Tag" in components
 
-    def test_clear_registry(self, component_registry):
+    def test_clear_registry(self):
         """Test clearing the registry."""
-        component_registry.clear()
-        assert not component_registry.has("Transform")
-        assert not component_registry.has("Tag")
+        # Use a throwaway registry; the fixture one is shared by the module
+        registry = ComponentRegistry()
+        registry.register(Transform)
+        registry.register(Tag)
+
+        registry.clear()
+        assert not registry.has("Transform")
+        assert not registry.has("Tag")
 
 
 class TestPrefabData:
@@ -105,59 +132,60 @@ class TestPrefabData:
 class TestPrefabLoader:
     """Tests for PrefabLoader."""
 
-    def test_load_json_prefab(self):
+    def test_load_json_prefab(self, tmp_path):
         """Test loading a JSON prefab file."""
         loader = PrefabLoader()
+        path = tmp_path / "entity.prefab.json"
+        path.write_text(json.dumps({"name": "TestEntity", "components": {}}))
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".prefab.json", delete=False
-        ) as f:
-            json.dump(
-                {
-                    "name": "TestEntity",
-                    "version": 1,
-                    "components": {"Transform": {"position": {"x": 50, "y": 100}}},
-                },
-                f,
-            )
-            f.flush()
-
-            prefab = loader.load(f.name)
-            assert isinstance(prefab, Prefab)
-            assert prefab.data.name == "TestEntity"
-            assert prefab.data.version == 1
-            assert "Transform" in prefab.data.components
-
-            Path(f.name).unlink()
-
-    def test_load_prefab_file(self):
-        """Test loading a .prefab file (auto-detect format)."""
+        prefab = loader.load(str(path))
+        assert isinstance(prefab, Prefab)
+        assert prefab.path == str(path)
+        assert prefab.data.name == "TestEntity"
+
+    def test_load_dict(self):
+        """Test building a prefab from in-memory data."""
         loader = PrefabLoader()
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".prefab", delete=False) as f:
-            json.dump({"name": "AutoDetect", "components": {}}, f)
-            f.flush()
+        prefab = loader.load_dict(
+            {
+                "name": "TestEntity",
+                "version": 1,
+                "components": {"Transform": {"position": {"x": 50, "y": 100}}},
+            }
+        )
+        assert isinstance(prefab, Prefab)
+        assert prefab.data.name == "TestEntity"
+        assert prefab.data.version == 1
+        assert "Transform" in prefab.data.components
 
-            prefab = loader.load(f.name)
-            assert prefab.data.name == "AutoDetect"
+    def test_load_dict_name_fallback(self):
+        """Test that load_dict uses the given name only when data has none."""
+        loader = PrefabLoader()
 
-            Path(f.name).unlink()
+        assert loader.load_dict({}, name="Fallback").data.name == "Fallback"
+        assert loader.load_dict({"name": "Own"}, name="Fallback").data.name == "Own"
+        with pytest.raises(ValueError):
+            loader.load_dict({"components": {}})
 
-    def test_load_prefab_uses_filename_as_name(self):
-        """Test that filename is used if name not specified."""
+    def test_load_prefab_file(self, tmp_path):
+        """Test loading a .prefab file (auto-detect format)."""
         loader = PrefabLoader()
+        path = tmp_path / "auto.prefab"
+        path.write_text(json.dumps({"name": "AutoDetect", "components": {}}))
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".prefab.json", delete=False
-        ) as f:
-            json.dump({"components": {}}, f)
-            f.flush()
+        prefab = loader.load(str(path))
+        assert prefab.data.name == "AutoDetect"
 
-            prefab = loader.load(f.name)
-            # Name should be the stem without suffixes
-            assert prefab.data.name == Path(f.name).stem
+    def test_load_prefab_uses_filename_as_name(self, tmp_path):
+        """Test that filename is used if name not specified."""
+        loader = PrefabLoader()
+        path = tmp_path / "unnamed.prefab.json"
+        path.write_text(json.dumps({"components": {}}))
 
-            Path(f.name).unlink()
+        prefab = loader.load(str(path))
+        # Name should be the stem without the final suffix
+        assert prefab.data.name == path.stem
 
     def test_load_nonexistent_file(self):
         """Test loading nonexistent file raises error."""
@@ -169,44 +197,39 @@ class TestPrefabLoader:
 class TestPrefabCache:
     """Tests for PrefabCache."""
 
-    def test_cache_load(self):
+    def test_cache_load(self, tmp_path):
         """Test loading and caching a prefab."""
         cache = PrefabCache()
+        path = tmp_path / "cached.prefab.json"
+        path.write_text(json.dumps({"name": "Cached", "components": {}}))
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".prefab.json", delete=False
-        ) as f:
-            json.dump({"name": "Cached", "components": {}}, f)
-            f.flush()
+        # First load
+        prefab = cache.load(str(path))
+        assert prefab is not None
+        assert prefab.name == "Cached"
 
-            # First load
-            prefab = cache.load(f.name)
-            assert prefab is not None
-            assert prefab.name == "Cached"
+        # Second load should return cached
+        prefab2 = cache.load(str(path))
+        assert prefab2 is prefab
 
-            # Second load should return cached
-            prefab2 = cache.load(f.name)
-            assert prefab2 is prefab
+    def test_cache_put(self):
+        """Test that put() data is served by load() without touching disk."""
+        cache = PrefabCache()
+        data = PrefabData(name="InMemory", components={})
 
-            Path(f.name).unlink()
+        cache.put("memory/entity.prefab.json", data)
+
+        assert cache.is_cached("memory/entity.prefab.json")
+        assert cache.load("memory/entity.prefab.json") is data
 
     def test_cache_invalidate(self):
         """Test invalidating cached prefab."""
         cache = PrefabCache()
+        cache.put("stale.prefab.json", PrefabData(name="ToInvalidate"))
+        assert cache.is_cached("stale.prefab.json")
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".prefab.json", delete=False
-        ) as f:
-            json.dump({"name": "ToInvalidate", "components": {}}, f)
-            f.flush()
-
-            cache.load(f.name)
-            assert cache.is_cached(f.name)
-
-            cache.invalidate(f.name)
-            assert not cache.is_cached(f.name)
-
-            Path(f.name).unlink()
+        cache.invalidate("stale.prefab.json")
+        assert not cache.is_cached("stale.prefab.json")
 
 
 class TestPrefabFactory:
@@ -214,15 +237,7 @@ class TestPrefabFactory:
 
     def test_create_simple_entity(self, prefab_factory, entity_manager):
         """Test creating an entity from prefab."""
-        prefab = PrefabData(
-            name="SimpleEntity",
-            components={
-                "Transform": {"position": {"x": 100, "y": 200}},
-                "Tag": {"name": "player"},
-            },
-        )
-
-        entity = prefab_factory.create(prefab)
+        entity = prefab_factory.create(_SIMPLE_PREFAB)
 
         assert entity is not None
         assert entity.id is not None
@@ -238,20 +253,17 @@ class TestPrefabFactory:
 
     def test_create_entity_with_overrides(self, prefab_factory):
         """Test creating entity with component overrides."""
-        prefab = PrefabData(
-            name="WithOverrides",
-            components={
-                "Transform": {"position": {"x": 0, "y": 0}},
-            },
-        )
-
         entity = prefab_factory.create(
-            prefab, overrides={"Transform": {"position": {"x": 500, "y": 600}}}
+            _SIMPLE_PREFAB, overrides={"Transform": {"position": {"x": 500, "y": 600}}}
         )
 
         transform = entity.get_component(Transform)
         assert transform.position.x == 500
         assert transform.position.y == 600
+        # The shared prefab data must not be touched by overrides
+        assert _SIMPLE_PREFAB.components["Transform"] == {
+            "position": {"x": 100, "y": 200}
+        }
 
     def test_create_entity_with_custom_id(self, prefab_factory):
         """Test creating entity with custom ID."""
@@ -261,30 +273,16 @@ class TestPrefabFactory:
 
     def test_create_with_inheritance(self, prefab_factory):
         """Test prefab inheritance."""
-        parent_prefab = PrefabData(
-            name="Parent",
-            components={
-                "Transform": {"position": {"x": 10, "y": 10}, "rotation": 45.0},
-            },
-        )
-
-        child_prefab = PrefabData(
-            name="Child",
-            extends="parent.prefab.json",
-            components={
-                "Transform": {"position": {"x": 100, "y": 100}},  # Override position
-            },
-        )
 
         # Set up resolver
         def resolve(path):
             if "parent" in path:
-                return parent_prefab
+                return _PARENT_PREFAB
             return None
 
         prefab_factory.set_prefab_resolver(resolve)
 
-        entity = prefab_factory.create(child_prefab)
+        entity = prefab_factory.create(_CHILD_PREFAB)
         transform = entity.get_component(Transform)
 
         # Position should be overridden
@@ -295,14 +293,12 @@ class TestPrefabFactory:
 
     def test_create_warns_on_unknown_component(self, prefab_factory, caplog):
         """Test that unknown components log a warning."""
-        import logging
-
+        caplog.set_level(logging.WARNING)
         prefab = PrefabData(
             name="WithUnknown", components={"UnknownComponent": {"foo": "bar"}}
         )
 
-        with caplog.at_level(logging.WARNING):
-            entity = prefab_factory.create(prefab)
+        entity = prefab_factory.create(prefab)
 
         assert "UnknownComponent" in caplog.text or entity is not None
 
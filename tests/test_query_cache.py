@@ -1,6 +1,8 @@
 """Tests for P1-008: ECS Query Cache optimization."""
 
+from pyguara.ecs.entity import Entity
 from pyguara.ecs.manager import EntityManager
+from pyguara.ecs.query_cache import CachedQueryView
 from pyguara.common.components import Transform
 from pyguara.physics.components import RigidBody
 from pyguara.ecs.component import BaseComponent
@@ -76,7 +78,7 @@ class TestQueryCacheBasicFunctionality:
         e1.add_component(Transform())
 
         # Query should return empty
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 0
 
     def test_cached_query_multiple_matches(self):
@@ -93,7 +95,7 @@ class TestQueryCacheBasicFunctionality:
             entities.append(e)
 
         # Query should return all 5
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 5
         result_ids = {e.id for e in results}
         expected_ids = {e.id for e in entities}
@@ -112,7 +114,7 @@ class TestQueryCacheDynamicUpdates:
         e1.add_component(Transform())
 
         # Initially not in cache (missing RigidBody)
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 0
 
         # Add missing component
@@ -133,14 +135,14 @@ class TestQueryCacheDynamicUpdates:
         e1.add_component(RigidBody())
 
         # Initially in cache
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 1
 
         # Remove component
         e1.remove_component(RigidBody)
 
         # Should no longer appear in cache
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 0
 
     def test_cache_updates_multiple_component_changes(self):
@@ -153,25 +155,47 @@ class TestQueryCacheDynamicUpdates:
 
         # Add RigidBody (still missing MockComponent)
         e1.add_component(RigidBody())
-        results = list(
-            manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
-        )
+        results = manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
         assert len(results) == 0
 
         # Add MockComponent (now complete)
         e1.add_component(MockComponent())
-        results = list(
-            manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
-        )
+        results = manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
         assert len(results) == 1
 
         # Remove Transform (incomplete again)
         e1.remove_component(Transform)
-        results = list(
-            manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
-        )
+        results = manager.get_entities_with_cached(Transform, RigidBody, MockComponent)
         assert len(results) == 0
 
+    def test_changes_reconciled_on_read(self):
+        """Component changes are batched until the cache is next read."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform, RigidBody)
+        cache = manager._query_cache
+
+        e1 = manager.create_entity()
+        e1.add_component(Transform())
+        e1.add_component(RigidBody())
+        e1.remove_component(RigidBody)
+        e1.add_component(RigidBody())
+
+        # Four changes, one pending entry, nothing applied yet
+        assert cache._dirty == {e1.id}
+        assert cache._cache[frozenset((Transform, RigidBody))] == set()
+
+        assert cache.get_cached(Transform, RigidBody) == {e1.id}
+        assert not cache._dirty
+
+    def test_unrelated_components_not_marked_dirty(self):
+        """Components outside every registered query skip the cache."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform, RigidBody)
+
+        manager.create_entity().add_component(MockComponent())
+
+        assert not manager._query_cache._dirty
+
 
 class TestQueryCacheMultipleQueries:
     """Test behavior with multiple registered queries."""
@@ -187,22 +211,22 @@ class TestQueryCacheMultipleQueries:
         e1.add_component(RigidBody())
 
         # First query should have 1 result
-        results1 = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results1 = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results1) == 1
 
         # Second query should have 0 results
-        results2 = list(manager.get_entities_with_cached(Transform, MockComponent))
+        results2 = manager.get_entities_with_cached(Transform, MockComponent)
         assert len(results2) == 0
 
         # Add MockComponent
         e1.add_component(MockComponent())
 
         # First query still has 1 result
-        results1 = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results1 = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results1) == 1
 
         # Second query now has 1 result
-        results2 = list(manager.get_entities_with_cached(Transform, MockComponent))
+        results2 = manager.get_entities_with_cached(Transform, MockComponent)
         assert len(results2) == 1
 
 
@@ -234,7 +258,7 @@ class TestQueryCacheEdgeCases:
         manager = EntityManager()
         manager.register_cached_query(Transform, RigidBody)
 
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 0
 
     def test_cache_after_entity_removal(self):
@@ -247,16 +271,55 @@ class TestQueryCacheEdgeCases:
         e1.add_component(RigidBody())
 
         # Verify in cache
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 1
 
         # Remove entity entirely
         manager.remove_entity(e1.id)
 
         # Should no longer appear
-        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        results = manager.get_entities_with_cached(Transform, RigidBody)
         assert len(results) == 0
 
+    def test_entity_removal_clears_cache_set(self):
+        """Removed entities are dropped from the cached ID set itself."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform, RigidBody)
+
+        e1 = manager.create_entity()
+        e1.add_component(Transform())
+        e1.add_component(RigidBody())
+
+        manager.remove_entity(e1.id)
+
+        assert manager._query_cache.get_cached(Transform, RigidBody) == set()
+
+    def test_add_entity_with_existing_components(self):
+        """Entities registered with components already attached are cached."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform, RigidBody)
+
+        e1 = Entity()
+        e1.add_component(Transform())
+        e1.add_component(RigidBody())
+        manager.add_entity(e1)
+
+        results = list(manager.get_entities_with_cached(Transform, RigidBody))
+        assert [e.id for e in results] == [e1.id]
+
+    def test_removal_during_iteration(self):
+        """Entities can be removed while iterating a cached query."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform)
+
+        for _ in range(3):
+            manager.create_entity().add_component(Transform())
+
+        for entity in manager.get_entities_with_cached(Transform):
+            manager.remove_entity(entity.id)
+
+        assert list(manager.get_entities_with_cached(Transform)) == []
+
     def test_cache_with_single_component_query(self):
         """Cache works with single-component queries."""
         manager = EntityManager()
@@ -299,6 +362,31 @@ class TestQueryCacheConsistency:
         assert cached_results == standard_results
         assert len(cached_results) == 5  # Half of 10
 
+    def test_registration_seeds_from_existing_entities(self):
+        """Registering after entities exist seeds the cache correctly."""
+        manager = EntityManager()
+
+        # Skewed distribution: many Transforms, few with all three components
+        expected = set()
+        for i in range(20):
+            e = manager.create_entity()
+            e.add_component(Transform())
+            if i % 4 == 0:
+                e.add_component(RigidBody())
+            if i % 8 == 0:
+                e.add_component(MockComponent())
+                expected.add(e.id)
+
+        manager.register_cached_query(Transform, RigidBody, MockComponent)
+
+        cached_results = set(
+            e.id
+            for e in manager.get_entities_with_cached(
+                Transform, RigidBody, MockComponent
+            )
+        )
+        assert cached_results == expected
+
     def test_consistency_after_modifications(self):
         """Cached and standard queries remain consistent after modifications."""
         manager = EntityManager()
@@ -325,3 +413,48 @@ class TestQueryCacheConsistency:
         )
 
         assert cached_results == standard_results
+
+
+class TestCachedQueryView:
+    """Test the view returned by cached queries."""
+
+    def test_view_supports_len_and_membership(self):
+        """View answers len() and ``in`` without materializing entities."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform, RigidBody)
+
+        e1 = manager.create_entity()
+        e1.add_component(Transform())
+        e1.add_component(RigidBody())
+        e2 = manager.create_entity()
+        e2.add_component(Transform())
+
+        view = manager.get_entities_with_cached(Transform, RigidBody)
+
+        assert isinstance(view, CachedQueryView)
+        assert len(view) == 1
+        assert e1 in view
+        assert e1.id in view
+        assert e2 not in view
+
+    def test_view_wraps_cache_without_copy(self):
+        """Registered queries wrap the cache set itself."""
+        manager = EntityManager()
+        manager.register_cached_query(Transform)
+        manager.create_entity().add_component(Transform())
+
+        view = manager.get_entities_with_cached(Transform)
+
+        assert view._ids is manager._query_cache.get_cached_ids(Transform)
+
+    def test_unregistered_view(self):
+        """Unregistered queries return a view over the standard query."""
+        manager = EntityManager()
+        e1 = manager.create_entity()
+        e1.add_component(Transform())
+
+        view = manager.get_entities_with_cached(Transform)
+
+        assert len(view) == 1
+        assert e1 in view
+        assert [e.id for e in view] == [e1.id]
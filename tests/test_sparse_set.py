@@ -0,0 +1,75 @@
+"""Tests for the ECS sparse-set component storage."""
+
+from dataclasses import dataclass
+
+from pyguara.ecs.component import BaseComponent
+from pyguara.ecs.sparse_set import SparseSet
+
+
+@dataclass
+class Marker(BaseComponent):
+    """Mock component for testing."""
+
+    value: int = 0
+
+
+def _filled(count: int) -> SparseSet:
+    store = SparseSet()
+    for i in range(count):
+        store.add(f"e{i}", Marker(i))
+    return store
+
+
+class TestSparseSet:
+    """Tests for SparseSet."""
+
+    def test_add_and_lookup(self):
+        """Added entities are members and map to their component."""
+        store = _filled(3)
+
+        assert len(store) == 3
+        assert "e1" in store
+        assert "missing" not in store
+        assert store.get("e1").value == 1
+        assert store.get("missing") is None
+        assert list(store) == ["e0", "e1", "e2"]
+
+    def test_add_existing_replaces_component(self):
+        """Re-adding an entity swaps the component without growing the set."""
+        store = _filled(2)
+        replacement = Marker(99)
+
+        store.add("e0", replacement)
+
+        assert len(store) == 2
+        assert store.get("e0") is replacement
+
+    def test_discard_keeps_storage_packed(self):
+        """Removing from the middle moves the last row into the gap."""
+        store = _filled(4)
+
+        store.discard("e1")
+
+        assert store.dense == ["e0", "e3", "e2"]
+        assert [c.value for c in store.components] == [0, 3, 2]
+        assert store.sparse == {"e0": 0, "e3": 1, "e2": 2}
+
+    def test_discard_last_and_missing(self):
+        """Removing the last row or an absent entity is safe."""
+        store = _filled(2)
+
+        store.discard("e1")
+        store.discard("missing")
+
+        assert store.dense == ["e0"]
+        assert store.sparse == {"e0": 0}
+
+    def test_clear(self):
+        """Clear empties every internal list."""
+        store = _filled(3)
+
+        store.clear()
+
+        assert len(store) == 0
+        assert not store.components
+        assert not store.sparse
@@ -0,0 +1,43 @@
+"""Tests for the common engine value types."""
+
+import pymunk
+import pytest
+
+from pyguara.common.types import Vector2
+
+
+class TestVector2:
+    """Test Vector2 storage and operators."""
+
+    def test_no_instance_dict(self):
+        """Vector2 should stay a bare tuple without per-instance storage."""
+        v = Vector2(1, 2)
+
+        assert not hasattr(v, "__dict__")
+        with pytest.raises(AttributeError):
+            v.label = "spawn"
+
+    def test_arithmetic_returns_vector2(self):
+        """Operators should keep the Vector2 type for every operand kind."""
+        a = Vector2(3, 4)
+
+        cases = [
+            (a + Vector2(1, 2), Vector2(4, 6)),
+            (a + pymunk.Vec2d(1, 2), Vector2(4, 6)),
+            (a + (1, 2), Vector2(4, 6)),
+            (a - Vector2(1, 2), Vector2(2, 2)),
+            (a - (1, 2), Vector2(2, 2)),
+            (a * 2, Vector2(6, 8)),
+            (a * 0.5, Vector2(1.5, 2.0)),
+            (2 * a, Vector2(6, 8)),
+            (a / 2, Vector2(1.5, 2.0)),
+            (-a, Vector2(-3, -4)),
+        ]
+        for result, expected in cases:
+            assert type(result) is Vector2
+            assert result == expected
+
+    def test_equality_and_hashing(self):
+        """Equal vectors should compare and hash alike."""
+        assert Vector2(50, 50) == Vector2(50, 50)
+        assert len({Vector2(1, 2), Vector2(1.0, 2.0), Vector2(2, 1)}) == 2